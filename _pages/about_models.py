@@ -1,206 +1,13 @@
 import streamlit as st
+from components.static_render import static_markdown
+from config.settings import COALESCE_WINDOW_MS, MODEL_INFO
+from models_utils.model_loader import get_inference_engine, get_request_coalescer, get_worker_pool
 
 def render_about_models():
-    # ---------- ADVANCED STYLING & ANIMATIONS ----------
-    st.markdown("""
-    <style>
-    :root {
-        --glass-bg: rgba(15, 23, 42, 0.7);
-        --glass-border: rgba(255, 255, 255, 0.08);
-        --accent-kidney: #10b981;
-        --accent-liver: #3b82f6;
-        --accent-neuro: #8b5cf6;
-    }
-
-    @keyframes fadeInUp {
-        from { opacity: 0; transform: translateY(30px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* Bio-Tech Card Style */
-    .model-card {
-        position: relative;
-        background: var(--glass-bg);
-        backdrop-filter: blur(14px);
-        border: 1px solid var(--glass-border);
-        border-radius: 28px;
-        padding: 2.5rem;
-        margin-bottom: 3rem;
-        overflow: hidden;
-        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        animation: fadeInUp 0.8s ease-out backwards;
-    }
-
-    /* Pattern Overlays */
-    .pattern-dots::before {
-        content: ""; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-        background-image: radial-gradient(rgba(255,255,255,0.03) 1px, transparent 1px);
-        background-size: 24px 24px; pointer-events: none;
-    }
-    
-    .pattern-waves::before {
-        content: ""; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-        background: repeating-linear-gradient(45deg, transparent, transparent 10px, rgba(139, 92, 246, 0.02) 10px, rgba(139, 92, 246, 0.02) 11px);
-        pointer-events: none;
-    }
-
-    .model-card:hover {
-        transform: translateY(-10px);
-        border-color: rgba(255,255,255,0.2);
-        box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.5);
-    }
-
-    .card-1 { animation-delay: 0.2s; border-left: 5px solid var(--accent-kidney); }
-    .card-2 { animation-delay: 0.4s; border-left: 5px solid var(--accent-liver); }
-    .card-3 { animation-delay: 0.6s; border-left: 5px solid var(--accent-neuro); }
-
-    .severity-badge {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 8px;
-        font-size: 0.75rem;
-        font-weight: 700;
-        text-transform: uppercase;
-        margin-bottom: 1rem;
-        background: rgba(239, 68, 68, 0.1);
-        color: #ef4444;
-        border: 1px solid rgba(239, 68, 68, 0.2);
-    }
-
-    .health-tip-box {
-        margin-top: 2rem;
-        padding: 1.5rem;
-        border-radius: 16px;
-        transition: 0.3s;
-    }
-    
-    .pill {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 50px;
-        background: rgba(255,255,255,0.05);
-        border: 1px solid rgba(255,255,255,0.1);
-        margin: 4px 2px;
-        font-size: 0.8rem;
-    }
-                
-    .dashboard-container {
-        margin-top: 3rem;
-        padding: 2.5rem;
-        background: linear-gradient(165deg, rgba(30, 41, 59, 0.5) 0%, rgba(15, 23, 42, 0.8) 100%);
-        border-radius: 30px;
-        border: 1px solid rgba(59, 130, 246, 0.2);
-        backdrop-filter: blur(15px);
-    }
-
-    .dashboard-header {
-        display: flex;
-        align-items: center;
-        gap: 12px;
-        margin-bottom: 1rem;
-    }
-
-    .dashboard-title {
-        color: #ffffff !important;
-        font-size: 1.4rem !important;
-        font-weight: 800 !important;
-        margin: 0 !important;
-        letter-spacing: -0.5px;
-    }
-
-    .dashboard-subtitle {
-        color: #94a3b8;
-        font-size: 0.95rem;
-        margin-bottom: 2.5rem;
-        max-width: 600px;
-    }
-
-    .pulse-indicator {
-        width: 10px;
-        height: 10px;
-        background: #3b82f6;
-        border-radius: 50%;
-        box-shadow: 0 0 10px #3b82f6;
-        animation: pulseSync 2s infinite;
-    }
-
-    @keyframes pulseSync {
-        0% { transform: scale(1); opacity: 1; }
-        50% { transform: scale(1.5); opacity: 0.5; }
-        100% { transform: scale(1); opacity: 1; }
-    }
-
-    /* Metrics Grid Layout */
-    .metrics-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-        gap: 20px;
-        margin-bottom: 2rem;
-    }
-
-    .metric-item {
-        background: rgba(255, 255, 255, 0.03);
-        padding: 1.5rem 1rem;
-        border-radius: 20px;
-        border: 1px solid rgba(255, 255, 255, 0.05);
-        text-align: center;
-        transition: all 0.3s ease;
-    }
-
-    .metric-item:hover {
-        background: rgba(59, 130, 246, 0.05);
-        border-color: rgba(59, 130, 246, 0.3);
-        transform: translateY(-5px);
-    }
-
-    .metric-viz {
-        font-size: 1.1rem;
-        font-weight: 800;
-        margin-bottom: 0.5rem;
-    }
-
-    .accuracy-glow { color: #10b981; }
-    .precision-glow { color: #3b82f6; }
-    .recall-glow { color: #f59e0b; }
-    .f1-glow { color: #8b5cf6; }
-
-    .metric-label {
-        color: #f8fafc;
-        font-weight: 700;
-        font-size: 0.9rem;
-        margin-bottom: 8px;
-    }
-
-    .metric-info {
-        color: #64748b;
-        font-size: 0.75rem;
-        line-height: 1.4;
-    }
-
-    /* Footer Pills */
-    .advanced-metrics-bar {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 10px;
-        padding-top: 1.5rem;
-        border-top: 1px solid rgba(255, 255, 255, 0.1);
-    }
-
-    .pill-outline {
-        padding: 5px 15px;
-        border-radius: 50px;
-        border: 1px solid rgba(148, 163, 184, 0.3);
-        color: #94a3b8;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    from utils.convex_client import search_cache
 
     # ---------- PAGE HEADER ----------
-    st.markdown("""
+    header = """
     <div class="about-header">
         <h1 style="font-weight: 800; letter-spacing: -1px; margin-bottom: 0.5rem;">📊 Model Intelligence</h1>
         <p style='color:#94a3b8; font-size:1.1rem; max-width:800px; line-height:1.6;'>
@@ -208,11 +15,11 @@ def render_about_models():
             biomarkers, and AI architectures used to screen for high-risk chronic conditions.
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
     # ---------- KIDNEY MODEL ----------
 
-    st.markdown("""
+    kidney_card = """
     <div class="model-card card-1 pattern-dots">
         <div class="severity-badge">High Clinical Severity</div>
         <div class="model-title">🫘 Chronic Kidney Disease Model</div>
@@ -244,11 +51,11 @@ def render_about_models():
             • Avoid unnecessary painkillers and self-medication
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
     # ---------- LIVER MODEL ----------
 
-    st.markdown("""
+    liver_card = """
     <div class="model-card card-2 pattern-dots">
         <div class="severity-badge">Critical Metabolic Risk</div>
         <div class="model-title">🫀 Liver Disease Model</div>
@@ -278,11 +85,11 @@ def render_about_models():
             • Get vaccinated for Hepatitis B if at risk
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
     # ---------- PARKINSON'S MODEL ----------
 
-    st.markdown("""
+    parkinsons_card = """
     <div class="model-card card-3 pattern-waves">
         <div class="severity-badge">Degenerative Neurological Concern</div>
         <div class="model-title">🧠 Parkinson's Disease Model</div>
@@ -313,10 +120,10 @@ def render_about_models():
             • Follow a balanced diet rich in antioxidants
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
     # ---------- METRICS ----------
-    st.markdown("""
+    evaluation = """
     <div class="dashboard-container">
         <div class="dashboard-header">
             <div class="pulse-indicator"></div>
@@ -364,4 +171,51 @@ def render_about_models():
             <span class="pill">ROC-AUC Score</span> <span class="pill">Confusion Matrix</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """
+
+    # One element: identical on every rerun, so Streamlit sends it once per session
+    static_markdown(header, kidney_card, liver_card, parkinsons_card, evaluation)
+
+    # ---------- PREDICTION CACHE ----------
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.subheader("⚡ Prediction Cache")
+    st.caption("Repeated panels are answered from a per-disease LRU cache keyed by the encoded features and model version.")
+    pool = get_worker_pool()
+    if pool is None:
+        cache_stats = get_inference_engine().cache_stats()
+    else:
+        # Predictions run in the worker processes, each with its own cache
+        cache_stats = pool.cache_stats()
+        st.caption(f"Summed over {pool.max_workers} inference worker processes.")
+    for col, disease in zip(st.columns(len(MODEL_INFO)), MODEL_INFO):
+        stats = cache_stats.get(disease)
+        label = f"{MODEL_INFO[disease]['icon']} {MODEL_INFO[disease]['name']}"
+        if stats is None:
+            col.metric(label, "Not loaded")
+        else:
+            col.metric(label, f"{stats['hit_rate']:.0%} hit rate",
+                       help=f"{stats['hits']} hits · {stats['misses']} misses · {stats['size']} cached")
+
+    # ---------- REQUEST COALESCING ----------
+    if COALESCE_WINDOW_MS > 0:
+        st.subheader("🧺 Request Coalescing")
+        st.caption(f"Single-patient predictions that miss the cache and arrive within {COALESCE_WINDOW_MS:g} ms of each other are scored together in one batch.")
+        # With the worker pool the models are loaded in the workers, not here
+        models = pool or get_inference_engine()
+        for col, disease in zip(st.columns(len(MODEL_INFO)), MODEL_INFO):
+            label = f"{MODEL_INFO[disease]['icon']} {MODEL_INFO[disease]['name']}"
+            if not models.is_loaded(disease):
+                col.metric(label, "Not loaded")
+                continue
+            stats = get_request_coalescer(disease).stats()
+            col.metric(label, f"{stats['mean_batch_size']:.1f} avg batch",
+                       help=f"{stats['requests']} requests · {stats['batches']} batches · largest {stats['max_batch_size']}")
+
+    # ---------- SYMPTOM SEARCH CACHE ----------
+    st.subheader("🔎 Symptom Search Cache")
+    st.caption("Chatbot lookups with the same symptom words, in any order, are answered from a shared cache until the disease snapshot changes.")
+    stats = search_cache.stats()
+    hit_col, hits_col, size_col = st.columns(3)
+    hit_col.metric("Hit rate", f"{stats['hit_rate']:.0%}")
+    hits_col.metric("Hits / misses", f"{stats['hits']} / {stats['misses']}")
+    size_col.metric("Cached queries", stats['size'])
@@ -1,30 +1,35 @@
 import streamlit as st
 import os
-import requests
-from dotenv import load_dotenv
-from groq import Groq
-
-# ===== PDF SUPPORT (ADDED) =====
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.units import inch
 from datetime import datetime
 import io
+from config.settings import DISEASE_SNAPSHOT_PATH, SYMPTOM_SEARCH
 
+# groq, httpx (via utils.chat_pipeline), dotenv and reportlab are imported
+# inside the functions that use them so that loading this page module stays
+# cheap.
 
-load_dotenv()
+_env_loaded = False
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-CONVEX_URL = os.getenv("CONVEX_URL")
+
+def get_env(name):
+    """Read a setting from the environment, loading .env on first use."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+    return os.getenv(name)
 
 
 # CLIENT SETUP
-def get_groq_client():
-    if "groq_client" not in st.session_state:
-        st.session_state.groq_client = Groq(api_key=GROQ_API_KEY)
-    return st.session_state.groq_client
+@st.cache_resource
+def get_chat_pipeline(groq_api_key, convex_url):
+    """
+    Process-wide chat pipeline: async Groq and Convex clients (keep-alive,
+    retries, circuit breaker) on one background event loop.
+    """
+    from utils.chat_pipeline import ChatPipeline
+    return ChatPipeline(groq_api_key, convex_url)
 
 
 # ===== RESET HELPER (ADDED) =====
@@ -37,30 +42,35 @@ def reset_conversation():
 
     st.session_state.triage_stage = "initial"
     st.session_state.final_report = None
+    # The running summary belongs to the previous case
+    st.session_state.history_summary = None
 
 
-#  CONVEX SEARCH 
-def fetch_top_matches(user_text: str):
+#  SYMPTOM SEARCH 
+def get_symptom_index():
     """
-    Calls Convex HTTP API to retrieve ranked disease matches.
+    Local BM25 index of the exported disease snapshot, or None without one.
+    Re-exporting the snapshot (new mtime) loads the new version.
     """
-    if not CONVEX_URL:
-        return []
-
     try:
-        r = requests.post(
-            f"{CONVEX_URL}/api/search_diseases",
-            json={"query": user_text},
-            timeout=10
-        )
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        st.error(f"Convex error: {e}")
-        return []
+        mtime = os.path.getmtime(DISEASE_SNAPSHOT_PATH)
+    except OSError:
+        return None
+    return _load_symptom_index(DISEASE_SNAPSHOT_PATH, mtime)
+
+
+@st.cache_resource(max_entries=1)
+def _load_symptom_index(path, mtime):
+    from utils.symptom_index import load_symptom_index
+    return load_symptom_index(path)
 
 
 def generate_pdf_report(messages):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.units import inch
+
     buffer = io.BytesIO()
 
     doc = SimpleDocTemplate(
@@ -138,6 +148,9 @@ def render_chatbox_page():
     if "final_report" not in st.session_state:
         st.session_state.final_report = None
 
+    if "history_summary" not in st.session_state:
+        st.session_state.history_summary = None
+
     # ---------- Render Chat History ----------
     for msg in st.session_state.messages:
         with st.chat_message(msg["role"]):
@@ -172,82 +185,34 @@ def render_chatbox_page():
     with st.chat_message("user"):
         st.markdown(user_input)
 
-    # ---------- Fetch from Convex ----------
-    potential_matches = fetch_top_matches(user_input)
-
-    # ---------- Build DB Context ----------
-    if potential_matches:
-        db_context = ""
-        for i, entry in enumerate(potential_matches, 1):
-            db_context += f"""
-{i}. **{entry['name']}**
-   - Category: {entry['category']}
-   - Symptoms: {", ".join(entry['symptoms'])}
-   - Description: {entry['description']}
-   - Advice: {entry['advice']}
-   - Medicines: {", ".join([m['name'] for m in entry['medicines']])}
-   - Database Confidence: {entry['score']} symptom overlaps
-"""
-    else:
-        db_context = "No relevant diseases were found in the database."
-
-    # ---------- SYSTEM PROMPT (UNCHANGED) ----------
-    SYSTEM_PROMPT = f"""
-You are an AI-powered Medical Triage Assistant.
-
-You have TWO knowledge sources:
-1. A VERIFIED MEDICAL DATABASE (provided below)
-2. Your general medical knowledge (secondary, supportive)
-
-DATABASE RULES:
-- The database is your PRIMARY source of truth.
-- Prefer database diseases over inferred ones.
-- Do NOT invent medicines or treatments.
-
-======== RESPONSE MODE RULES ========
-
-IF CURRENT TRIAGE STAGE IS "initial" OR "followup":
-
-- DO NOT give full disease descriptions.
-- DO NOT list medicines in detail.
-- DO NOT give long explanations.
-- ONLY do the following:
-  • List 2–3 MOST LIKELY diseases (names only)
-  • Give 1 short reason per disease (1 sentence max)
-  • Ask 2–3 targeted follow-up questions
-  • Explain briefly why each question matters
-
-IF CURRENT TRIAGE STAGE IS "final":
-
-- FIRST, list the TOP 2–3 MOST PROBABLE diseases in descending order of likelihood.
-- THEN select the MOST LIKELY diagnosis
-- Provide confidence level
-- Give medicines ONLY from database
-- Provide home care advice
-- ALWAYS include a medical disclaimer
-
-CURRENT TRIAGE STAGE:
-{st.session_state.triage_stage}
-
-DATABASE MATCHES:
-{db_context}
-"""
+    # ---------- Retrieval, history summary and prompt (concurrently) ----------
+    pipeline = get_chat_pipeline(
+        get_env("GROQ_API_KEY"),
+        get_env("CONVEX_URL") if SYMPTOM_SEARCH != "local" else None
+    )
+    snapshot = get_symptom_index()
+    turn = pipeline.prepare(
+        user_input,
+        st.session_state.messages,
+        st.session_state.triage_stage,
+        index=snapshot if SYMPTOM_SEARCH != "convex" else None,
+        version=snapshot.version if snapshot else None,
+        summary=st.session_state.history_summary,
+    )
+    st.session_state.history_summary = turn.summary
+
+    if turn.notice:
+        level, text = turn.notice
+        if level == "warning":
+            st.warning(text)
+        else:
+            st.caption(text)
 
     # ---------- LLM RESPONSE ----------
     with st.chat_message("assistant"):
-        client = get_groq_client()
-
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                *st.session_state.messages
-            ],
-            temperature=0.3,
-        )
-
-        reply = response.choices[0].message.content
-        st.markdown(reply)
+        # Tokens are rendered as they arrive; the checks below run on the
+        # assembled reply
+        reply = st.write_stream(pipeline.stream_reply(turn.messages))
 
         st.session_state.messages.append({
             "role": "assistant",
@@ -1,10 +1,10 @@
 import streamlit as st
-import numpy as np
 from components.gauges import create_confidence_gauge
+from utils.instrumentation import timer
 from models_utils.model_loader import load_kidney_models
 from models_utils.sample_data import KIDNEY_DISEASE_SAMPLE, KIDNEY_HEALTHY_SAMPLE
 from config.settings import SG_VALUES, KIDNEY_ENCODING
-from utils.encoding import encode_kidney_features
+from utils.feature_schema import KIDNEY_SCHEMA
 from utils.prediction_helper import assess_kidney_disease_risk, get_kidney_ckd_status
 
 
@@ -14,9 +14,9 @@ def render_kidney_page():
     st.markdown("Enter the patient's clinical parameters to predict Chronic Kidney Disease (CKD)")
     
     # Load model
-    model, scaler = load_kidney_models()
+    predictor, ckd_mask = load_kidney_models()
     
-    if model is None or scaler is None:
+    if predictor is None:
         st.error("⚠️ Model not found! Please train the model first by running `python training_scripts/train_kidney_extratrees.py`")
     else:
         st.markdown('<div class="info-box">✅ Model loaded successfully! Extra Trees Classifier with 100% accuracy</div>', unsafe_allow_html=True)
@@ -55,7 +55,6 @@ def render_kidney_page():
         sg = st.selectbox("Specific Gravity 💧", SG_VALUES,
                         index=SG_VALUES.index(st.session_state.kidney_values.get('sg', 1.020)),
                         help="Urine specific gravity")
-        sg_enc = SG_VALUES.index(sg)
         al = st.selectbox("Albumin 🧪", [0, 1, 2, 3, 4, 5],
                         index=st.session_state.kidney_values.get('al', 0),
                         help="Albumin level in urine")
@@ -125,25 +124,24 @@ def render_kidney_page():
                          help="Presence of anemia")
         
         if st.button("🔍 Predict Kidney Disease", type="primary"):
-            # Encode categorical variables
-            rbc_enc, pc_enc, pcc_enc, ba_enc, htn_enc, dm_enc, cad_enc, appet_enc, pe_enc, ane_enc = encode_kidney_features(
-                rbc, pc, pcc, ba, htn, dm, cad, appet, pe, ane
-            )
-            
-            # Create feature array
-            features = np.array([[age, bp, sg_enc, al, su, rbc_enc, pc_enc, pcc_enc, ba_enc, bgr, 
-                                bu, sc, sod, pot, hemo, pcv, wc, rc, htn_enc, dm_enc, cad_enc, 
-                                appet_enc, pe_enc, ane_enc]])
+            # Encode into the model's feature order
+            with timer('encode', disease='kidney'):
+                features = KIDNEY_SCHEMA.build_matrix({
+                    'age': age, 'bp': bp, 'sg': sg, 'al': al, 'su': su, 'rbc': rbc, 'pc': pc,
+                    'pcc': pcc, 'ba': ba, 'bgr': bgr, 'bu': bu, 'sc': sc, 'sod': sod, 'pot': pot,
+                    'hemo': hemo, 'pcv': pcv, 'wc': wc, 'rc': rc, 'htn': htn, 'dm': dm,
+                    'cad': cad, 'appet': appet, 'pe': pe, 'ane': ane,
+                })
             
             # Scale and predict
-            features_scaled = scaler.transform(features)
-            prediction = model.predict(features_scaled)[0]
-            prediction_proba = model.predict_proba(features_scaled)[0]
+            with timer('predict', disease='kidney'):
+                result = predictor.predict(features)
+            prediction = result.predictions[0]
             
             st.markdown("---")
             st.subheader("📊 Prediction Result")
             
-            confidence = prediction_proba[prediction]*100
+            confidence = result.confidence[0]
             
             # Display confidence gauge
             col_gauge, col_result = st.columns([1, 1])
@@ -154,12 +152,13 @@ def render_kidney_page():
             
             with col_result:
                 # Determine CKD status
-                ckd_detected = get_kidney_ckd_status(model, prediction)
+                ckd_detected = get_kidney_ckd_status(ckd_mask, prediction)
                 
                 # Clinical risk assessment
-                risk_override, override_reasons = assess_kidney_disease_risk(
-                    rbc, pc, pcc, pe, ane, sc, al, bu, bgr
-                )
+                with timer('clinical_rules', disease='kidney'):
+                    risk_override, override_reasons = assess_kidney_disease_risk(
+                        rbc, pc, pcc, pe, ane, sc, al, bu, bgr
+                    )
                 
                 if ckd_detected or risk_override:
                     st.markdown(f'<div class="gradient-card"><h2>⚠️ Chronic Kidney Disease Detected</h2><p style="font-size:20px;">Confidence: {confidence:.2f}%</p></div>', unsafe_allow_html=True)
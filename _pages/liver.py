@@ -3,11 +3,11 @@ Liver Disease Prediction page.
 """
 
 import streamlit as st
-import numpy as np
 from components.gauges import create_confidence_gauge
+from utils.instrumentation import timer
 from models_utils.model_loader import load_liver_models
 from models_utils.sample_data import LIVER_DISEASE_SAMPLE, LIVER_HEALTHY_SAMPLE
-from utils.encoding import encode_gender
+from utils.feature_schema import LIVER_SCHEMA
 
 
 def render_liver_page():
@@ -16,9 +16,9 @@ def render_liver_page():
     st.markdown("Enter the patient's liver function test parameters to predict liver disease")
     
     # Load model
-    model, scaler = load_liver_models()
+    predictor = load_liver_models()
     
-    if model is None or scaler is None:
+    if predictor is None:
         st.error("⚠️ Model not found! Please train the model first by running `python training_scripts/train_liver_randomforest.py`")
     else:
         st.markdown('<div class="info-box">✅ Model loaded successfully - Ready for prediction!</div>', unsafe_allow_html=True)
@@ -62,23 +62,25 @@ def render_liver_page():
         ag_ratio = st.number_input("Albumin/Globulin Ratio 📊", 0.1, 5.0, value=st.session_state.liver_values.get('ag_ratio', 1.0), step=0.1, help="A/G ratio (normal: 1.0-2.5)")
         
         if st.button("🔍 Predict Liver Disease", type="primary"):
-            # Encode gender
-            gender_enc = encode_gender(gender)
-            
-            # Create feature array
-            features = np.array([[age, gender_enc, total_bilirubin, direct_bilirubin, 
-                                alkaline_phosphotase, alamine_aminotransferase, 
-                                aspartate_aminotransferase, total_protiens, albumin, ag_ratio]])
+            # Encode into the model's feature order
+            with timer('encode', disease='liver'):
+                features = LIVER_SCHEMA.build_matrix({
+                    'age': age, 'gender': gender, 'total_bilirubin': total_bilirubin,
+                    'direct_bilirubin': direct_bilirubin, 'alkaline_phosphotase': alkaline_phosphotase,
+                    'alamine_aminotransferase': alamine_aminotransferase,
+                    'aspartate_aminotransferase': aspartate_aminotransferase,
+                    'total_protiens': total_protiens, 'albumin': albumin, 'ag_ratio': ag_ratio,
+                })
             
             # Scale and predict
-            features_scaled = scaler.transform(features)
-            prediction = model.predict(features_scaled)[0]
-            prediction_proba = model.predict_proba(features_scaled)[0]
+            with timer('predict', disease='liver'):
+                result = predictor.predict(features)
+            prediction = result.predictions[0]
             
             st.markdown("---")
             st.subheader("📊 Prediction Result")
             
-            confidence = prediction_proba[prediction]*100
+            confidence = result.confidence[0]
             
             # Display confidence gauge and result
             col_gauge, col_result = st.columns([1, 1])
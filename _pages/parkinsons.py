@@ -2,13 +2,34 @@
 Parkinson's Disease Prediction page.
 """
 
+import os
+import tempfile
+import numpy as np
 import streamlit as st
 import pandas as pd
-import numpy as np
 from components.gauges import create_confidence_gauge
-from models_utils.model_loader import load_parkinsons_models
+from utils.instrumentation import timer
+from models_utils.model_loader import get_inference_engine, get_worker_pool, load_parkinsons_models
 from models_utils.sample_data import PARKINSONS_DISEASE_SAMPLE, PARKINSONS_HEALTHY_SAMPLE
-from config.settings import PARKINSONS_FEATURES
+from config.settings import CSV_CHUNK_SIZE, SCORED_CSV_DIR, SCORED_CSV_MAX_AGE
+from utils.feature_schema import PARKINSONS_SCHEMA
+from utils.files import remove_older_than
+
+# Rejected CSV rows listed on the page; the download has all of them
+MAX_REPORTED_ROWS = 5
+
+
+def discard_csv_result():
+    """Delete the session's previous scored CSV from disk."""
+    previous = st.session_state.pop('parkinsons_csv_result', None)
+    if previous and os.path.exists(previous['path']):
+        os.remove(previous['path'])
+
+
+def read_csv_result(path):
+    """Return the scored CSV bytes for the download button."""
+    with open(path, 'rb') as f:
+        return f.read()
 
 
 def render_parkinsons_page():
@@ -17,9 +38,9 @@ def render_parkinsons_page():
     st.markdown("Enter voice measurement features to detect Parkinson's Disease")
     
     # Load model
-    model, scaler, features_list = load_parkinsons_models()
+    predictor, _ = load_parkinsons_models()
     
-    if model is None or scaler is None:
+    if predictor is None:
         st.error("⚠️ Model not found! Please train the model first by running `python training_scripts/train_parkinsons_xgboost.py`")
     else:
         st.markdown('<div class="info-box">✅ Model loaded successfully - Ready for prediction!</div>', unsafe_allow_html=True)
@@ -152,22 +173,28 @@ def render_parkinsons_page():
                                  help="Pitch Period Entropy")
             
             if st.button("🔍 Detect Parkinson's Disease", type="primary"):
-                # Create feature array
-                features = np.array([[mdvp_fo, mdvp_fhi, mdvp_flo, mdvp_jitter_percent, 
-                                    mdvp_jitter_abs, mdvp_rap, mdvp_ppq, jitter_ddp,
-                                    mdvp_shimmer, mdvp_shimmer_db, shimmer_apq3, shimmer_apq5,
-                                    mdvp_apq, shimmer_dda, nhr, hnr, rpde, dfa, spread1, 
-                                    spread2, d2, ppe]])
+                # Encode into the model's feature order
+                with timer('encode', disease='parkinsons'):
+                    features = PARKINSONS_SCHEMA.build_matrix({
+                        'mdvp_fo': mdvp_fo, 'mdvp_fhi': mdvp_fhi, 'mdvp_flo': mdvp_flo,
+                        'mdvp_jitter_percent': mdvp_jitter_percent, 'mdvp_jitter_abs': mdvp_jitter_abs,
+                        'mdvp_rap': mdvp_rap, 'mdvp_ppq': mdvp_ppq, 'jitter_ddp': jitter_ddp,
+                        'mdvp_shimmer': mdvp_shimmer, 'mdvp_shimmer_db': mdvp_shimmer_db,
+                        'shimmer_apq3': shimmer_apq3, 'shimmer_apq5': shimmer_apq5,
+                        'mdvp_apq': mdvp_apq, 'shimmer_dda': shimmer_dda, 'nhr': nhr, 'hnr': hnr,
+                        'rpde': rpde, 'dfa': dfa, 'spread1': spread1, 'spread2': spread2,
+                        'd2': d2, 'ppe': ppe,
+                    })
                 
                 # Scale and predict
-                features_scaled = scaler.transform(features)
-                prediction = model.predict(features_scaled)[0]
-                prediction_proba = model.predict_proba(features_scaled)[0]
+                with timer('predict', disease='parkinsons'):
+                    result = predictor.predict(features)
+                prediction = result.predictions[0]
                 
                 st.markdown("---")
                 st.subheader("📊 Prediction Result")
                 
-                confidence = prediction_proba[prediction]*100
+                confidence = result.confidence[0]
                 
                 # Display confidence gauge and result
                 col_gauge, col_result = st.columns([1, 1])
@@ -186,9 +213,80 @@ def render_parkinsons_page():
         else:
             uploaded_file = st.file_uploader("Upload CSV file with voice features", type=['csv'])
             if uploaded_file is not None:
-                data = pd.read_csv(uploaded_file)
+                # Only the first rows are read for the preview and column check
+                preview = pd.read_csv(uploaded_file, nrows=5)
+                uploaded_file.seek(0)
                 st.write("Preview of uploaded data:")
-                st.dataframe(data.head())
+                st.dataframe(preview)
+                
+                missing_cols = PARKINSONS_SCHEMA.missing_columns(preview.columns)
+                if missing_cols:
+                    st.error(f"⚠️ CSV is missing required voice feature columns: {', '.join(missing_cols)}")
+                    return
+                
+                upload_key = f"{uploaded_file.name}:{uploaded_file.size}"
                 
                 if st.button("🔍 Predict from CSV"):
-                    st.info("CSV prediction feature coming soon!")
+                    # Worker processes keep a large upload from stalling other sessions
+                    scorer = get_worker_pool() or get_inference_engine()
+                    progress = st.progress(0.0, text="Scoring voice recordings...")
+                    discard_csv_result()
+                    os.makedirs(SCORED_CSV_DIR, exist_ok=True)
+                    remove_older_than(SCORED_CSV_DIR, SCORED_CSV_MAX_AGE)
+                    fd, result_path = tempfile.mkstemp(dir=SCORED_CSV_DIR, prefix='scored_', suffix='.csv')
+                    total_rows = 0
+                    detected = 0
+                    rejected = 0
+                    examples = []
+                    
+                    # Stream the upload through the model into a temp file chunk by chunk
+                    chunks = pd.read_csv(uploaded_file, chunksize=CSV_CHUNK_SIZE)
+                    with timer('csv_scoring', disease='parkinsons'), os.fdopen(fd, 'w', newline='') as output:
+                        for i, scored in enumerate(scorer.score_chunks('parkinsons', chunks)):
+                            scored.to_csv(output, index=False, header=(i == 0))
+                            unscored = np.flatnonzero(scored['prediction'].isna())
+                            rejected += len(unscored)
+                            for row in unscored[:MAX_REPORTED_ROWS - len(examples)]:
+                                # Line 1 of the file is the header
+                                examples.append(f"line {total_rows + row + 2}: {scored['issues'].iat[row]}")
+                            total_rows += len(scored)
+                            detected += int((scored['prediction'] == 1).sum())
+                            progress.progress(
+                                min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0),
+                                text=f"Scored {total_rows:,} recordings..."
+                            )
+                    progress.progress(1.0, text=f"Scored {total_rows:,} recordings")
+                    
+                    st.session_state.parkinsons_csv_result = {
+                        'key': upload_key,
+                        'path': result_path,
+                        'total': total_rows,
+                        'detected': detected,
+                        'rejected': rejected,
+                        'examples': examples,
+                    }
+                
+                csv_result = st.session_state.get('parkinsons_csv_result')
+                if csv_result and csv_result['key'] == upload_key:
+                    st.markdown("---")
+                    st.subheader("📊 Batch Prediction Result")
+                    col_total, col_detected, col_rejected = st.columns(3)
+                    col_total.metric("Recordings Scored", f"{csv_result['total'] - csv_result['rejected']:,}")
+                    col_detected.metric("Parkinson's Detected", f"{csv_result['detected']:,}")
+                    col_rejected.metric("Rows Not Scored", f"{csv_result['rejected']:,}")
+                    if csv_result['rejected']:
+                        st.warning(
+                            f"⚠️ {csv_result['rejected']:,} row(s) have missing, non-numeric or impossible voice features "
+                            "and were not scored (blank prediction, reason in the `issues` column):\n\n"
+                            + "\n".join(f"- {example}" for example in csv_result['examples'])
+                        )
+                    if not os.path.exists(csv_result['path']):
+                        st.info(f"The scored file was removed after {SCORED_CSV_MAX_AGE // 60} minutes; predict again to download it.")
+                    else:
+                        st.download_button(
+                            "📥 Download Scored CSV",
+                            # Read from disk only when the button is clicked
+                            data=lambda: read_csv_result(csv_result['path']),
+                            file_name=f"scored_{uploaded_file.name}",
+                            mime="text/csv"
+                        )
@@ -0,0 +1 @@
+"""HTTP prediction API package for FamilyAIDoc."""
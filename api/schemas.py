@@ -0,0 +1,130 @@
+"""
+Request and response models for the FamilyAIDoc prediction API.
+Field names match ``models_utils.sample_data`` so the same patient dicts
+work in the Streamlit pages, the ``InferenceEngine`` and over HTTP.
+"""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, SkipValidation
+
+from config.settings import API_MAX_BATCH, SG_VALUES
+from utils.feature_schema import SCHEMAS
+
+
+YesNo = Literal['yes', 'no']
+NormalAbnormal = Literal['normal', 'abnormal']
+Presence = Literal['present', 'notpresent']
+# The kidney model only knows these specific gravity readings
+SpecificGravity = Literal[tuple(SG_VALUES)]
+
+
+def bounded(disease, name, **kwargs):
+    """``Field`` limited to the feature's bounds in ``utils.feature_schema``."""
+    schema = SCHEMAS[disease]
+    low, high = schema.features[schema.index[name]].bounds
+    return Field(ge=low, le=high, **kwargs)
+
+
+class KidneyPatient(BaseModel):
+    """Clinical parameters for the CKD model."""
+
+    age: float = bounded('kidney', 'age')
+    bp: float = bounded('kidney', 'bp', description="Blood pressure (mm/Hg)")
+    sg: SpecificGravity = Field(description="Specific gravity, one of 1.005, 1.010, 1.015, 1.020, 1.025")
+    al: float = bounded('kidney', 'al', description="Urine albumin (0-5)")
+    su: float = bounded('kidney', 'su', description="Urine sugar (0-5)")
+    rbc: NormalAbnormal
+    pc: NormalAbnormal
+    pcc: Presence
+    ba: Presence
+    bgr: float = bounded('kidney', 'bgr', description="Blood glucose random (mg/dL)")
+    bu: float = bounded('kidney', 'bu', description="Blood urea (mg/dL)")
+    sc: float = bounded('kidney', 'sc', description="Serum creatinine (mg/dL)")
+    sod: float = bounded('kidney', 'sod', description="Sodium (mEq/L)")
+    pot: float = bounded('kidney', 'pot', description="Potassium (mEq/L)")
+    hemo: float = bounded('kidney', 'hemo', description="Hemoglobin (g/dL)")
+    pcv: float = bounded('kidney', 'pcv', description="Packed cell volume")
+    wc: float = bounded('kidney', 'wc', description="White blood cell count (cells/cumm)")
+    rc: float = bounded('kidney', 'rc', description="Red blood cell count (millions/cmm)")
+    htn: YesNo
+    dm: YesNo
+    cad: YesNo
+    appet: Literal['good', 'poor']
+    pe: YesNo
+    ane: YesNo
+
+
+class LiverPatient(BaseModel):
+    """Liver function test results for the liver model."""
+
+    age: float = bounded('liver', 'age')
+    gender: Literal['Male', 'Female']
+    total_bilirubin: float = bounded('liver', 'total_bilirubin')
+    direct_bilirubin: float = bounded('liver', 'direct_bilirubin')
+    alkaline_phosphotase: float = bounded('liver', 'alkaline_phosphotase')
+    alamine_aminotransferase: float = bounded('liver', 'alamine_aminotransferase')
+    aspartate_aminotransferase: float = bounded('liver', 'aspartate_aminotransferase')
+    total_protiens: float = bounded('liver', 'total_protiens')
+    albumin: float = bounded('liver', 'albumin')
+    ag_ratio: float = bounded('liver', 'ag_ratio')
+
+
+class ParkinsonsRecording(BaseModel):
+    """The 22 voice measurements used by the Parkinson's model."""
+
+    mdvp_fo: float = bounded('parkinsons', 'mdvp_fo')
+    mdvp_fhi: float = bounded('parkinsons', 'mdvp_fhi')
+    mdvp_flo: float = bounded('parkinsons', 'mdvp_flo')
+    mdvp_jitter_percent: float = bounded('parkinsons', 'mdvp_jitter_percent')
+    mdvp_jitter_abs: float = bounded('parkinsons', 'mdvp_jitter_abs')
+    mdvp_rap: float = bounded('parkinsons', 'mdvp_rap')
+    mdvp_ppq: float = bounded('parkinsons', 'mdvp_ppq')
+    jitter_ddp: float = bounded('parkinsons', 'jitter_ddp')
+    mdvp_shimmer: float = bounded('parkinsons', 'mdvp_shimmer')
+    mdvp_shimmer_db: float = bounded('parkinsons', 'mdvp_shimmer_db')
+    shimmer_apq3: float = bounded('parkinsons', 'shimmer_apq3')
+    shimmer_apq5: float = bounded('parkinsons', 'shimmer_apq5')
+    mdvp_apq: float = bounded('parkinsons', 'mdvp_apq')
+    shimmer_dda: float = bounded('parkinsons', 'shimmer_dda')
+    nhr: float = bounded('parkinsons', 'nhr')
+    hnr: float = bounded('parkinsons', 'hnr')
+    rpde: float = bounded('parkinsons', 'rpde')
+    dfa: float = bounded('parkinsons', 'dfa')
+    spread1: float = bounded('parkinsons', 'spread1')
+    spread2: float = bounded('parkinsons', 'spread2')
+    d2: float = bounded('parkinsons', 'd2')
+    ppe: float = bounded('parkinsons', 'ppe')
+
+
+# Batch items are validated one by one by the server, so an invalid patient
+# gets an error row instead of failing the whole batch
+class KidneyBatch(BaseModel):
+    patients: List[SkipValidation[KidneyPatient]] = Field(min_length=1, max_length=API_MAX_BATCH)
+
+
+class LiverBatch(BaseModel):
+    patients: List[SkipValidation[LiverPatient]] = Field(min_length=1, max_length=API_MAX_BATCH)
+
+
+class ParkinsonsBatch(BaseModel):
+    recordings: List[SkipValidation[ParkinsonsRecording]] = Field(min_length=1, max_length=API_MAX_BATCH)
+
+
+class Prediction(BaseModel):
+    """Model output for one patient; only ``index`` and ``error`` for a rejected one."""
+
+    index: int = Field(default=0, description="Position of the patient in the request")
+    error: Optional[str] = Field(default=None, description="Why the patient was not scored")
+    prediction: Optional[int] = Field(default=None, description="Predicted class index")
+    detected: Optional[bool] = Field(default=None, description="True if the disease is detected")
+    confidence: Optional[float] = Field(default=None, description="Confidence of the predicted class (0-100)")
+    probabilities: Optional[List[float]] = None
+    risk_override: Optional[bool] = Field(
+        default=None, description="Kidney only: clinical rules flag CKD regardless of the model"
+    )
+    override_reasons: Optional[List[str]] = None
+
+
+class BatchPrediction(BaseModel):
+    predictions: List[Prediction]
@@ -0,0 +1,184 @@
+"""
+ASGI prediction service for FamilyAIDoc.
+Exposes the kidney, liver and Parkinson's models over HTTP for integrations
+that cannot drive the Streamlit UI. Requests are handled asynchronously;
+the CPU-bound encoding and ``predict_proba`` work runs on a bounded thread
+pool so the event loop keeps accepting connections while models score.
+
+Usage:
+    uvicorn api.server:app --host 0.0.0.0 --port 8000
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+from pydantic import ValidationError
+
+from api.schemas import (
+    BatchPrediction,
+    KidneyBatch,
+    KidneyPatient,
+    LiverBatch,
+    LiverPatient,
+    ParkinsonsBatch,
+    ParkinsonsRecording,
+    Prediction,
+)
+from config.settings import API_WORKER_THREADS, WARMUP_ON_START
+from models_utils.inference_engine import InferenceEngine
+from models_utils.warmup import get_warmup_state, start_warmup
+from utils.clinical_rules import KIDNEY_RULES
+from utils.instrumentation import metrics, timer
+from utils.prediction_helper import assess_kidney_risk_batch, get_kidney_ckd_status
+
+
+# One engine per process: the model bundles are memory-mapped, so they share
+# the OS page cache with the Streamlit app running on the same host
+engine = InferenceEngine()
+executor = ThreadPoolExecutor(max_workers=API_WORKER_THREADS, thread_name_prefix='predict')
+
+
+@asynccontextmanager
+async def lifespan(app):
+    if WARMUP_ON_START:
+        start_warmup(engine_factory=lambda: engine)
+    yield
+    executor.shutdown(wait=False)
+
+
+app = FastAPI(
+    title="FamilyAIDoc Prediction API",
+    description="Kidney, liver and Parkinson's disease predictions",
+    lifespan=lifespan,
+)
+
+
+def score_patients(disease, patients):
+    """
+    Score validated patients and build the API response rows.
+
+    Runs on the worker thread pool.
+
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        patients (list): Pydantic patient models
+
+    Returns:
+        list: ``Prediction`` per patient, in request order
+    """
+    records = [patient.model_dump() for patient in patients]
+    models = engine.load(disease)
+    features = engine.encode(disease, records)
+    result = models['predictor'].predict(features)
+
+    if disease == 'kidney':
+        detected = get_kidney_ckd_status(models['ckd_mask'], result.predictions)
+        with timer('clinical_rules', disease='kidney'):
+            rules = assess_kidney_risk_batch(features)
+        detected = detected | rules.override
+    else:
+        detected = result.predictions == 1
+
+    rows = []
+    for i in range(len(records)):
+        row = Prediction(
+            index=i,
+            prediction=int(result.predictions[i]),
+            detected=bool(detected[i]),
+            confidence=float(result.confidence[i]),
+            probabilities=result.probabilities[i].tolist(),
+        )
+        if disease == 'kidney':
+            row.risk_override = bool(rules.override[i])
+            row.override_reasons = KIDNEY_RULES.reason_labels(rules.reasons[i])
+        rows.append(row)
+    return rows
+
+
+async def run_prediction(disease, patients):
+    """Score patients off the event loop; model load failures become 503s."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, score_patients, disease, patients)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+def validation_message(error):
+    """One line per invalid field of a pydantic ``ValidationError``."""
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'patient'}: {e['msg']}" for e in error.errors())
+
+
+async def run_batch(disease, model, items):
+    """
+    Validate batch items one by one and score the valid ones.
+
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        model (type): Pydantic model of one patient
+        items (list): Raw patient objects from the request
+
+    Returns:
+        BatchPrediction: One row per item, in request order; invalid items
+        get a row with only ``index`` and ``error``
+    """
+    rows, patients = {}, {}
+    for i, item in enumerate(items):
+        try:
+            patients[i] = model.model_validate(item)
+        except ValidationError as e:
+            rows[i] = Prediction(index=i, error=validation_message(e))
+
+    if patients:
+        for i, row in zip(patients, await run_prediction(disease, list(patients.values()))):
+            row.index = i
+            rows[i] = row
+    return BatchPrediction(predictions=[rows[i] for i in range(len(items))])
+
+
+@app.get("/health")
+async def health():
+    """Warm-up status; ``ready`` is true once every model has been loaded."""
+    state = get_warmup_state()
+    if state is None:
+        return {'ready': False, 'finished': False, 'load_seconds': {}, 'errors': {}}
+    return state.as_dict()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Per-stage latency histograms in the Prometheus text format."""
+    return metrics.to_prometheus()
+
+
+@app.post("/predict/kidney", response_model=Prediction)
+async def predict_kidney(patient: KidneyPatient):
+    return (await run_prediction('kidney', [patient]))[0]
+
+
+@app.post("/predict/kidney/batch", response_model=BatchPrediction)
+async def predict_kidney_batch(batch: KidneyBatch):
+    return await run_batch('kidney', KidneyPatient, batch.patients)
+
+
+@app.post("/predict/liver", response_model=Prediction)
+async def predict_liver(patient: LiverPatient):
+    return (await run_prediction('liver', [patient]))[0]
+
+
+@app.post("/predict/liver/batch", response_model=BatchPrediction)
+async def predict_liver_batch(batch: LiverBatch):
+    return await run_batch('liver', LiverPatient, batch.patients)
+
+
+@app.post("/predict/parkinsons", response_model=Prediction)
+async def predict_parkinsons(recording: ParkinsonsRecording):
+    return (await run_prediction('parkinsons', [recording]))[0]
+
+
+@app.post("/predict/parkinsons/batch", response_model=BatchPrediction)
+async def predict_parkinsons_batch(batch: ParkinsonsBatch):
+    return await run_batch('parkinsons', ParkinsonsRecording, batch.recordings)
@@ -1,34 +1,40 @@
-import textwrap
+import importlib
 import streamlit as st
-from _pages.chatbox import render_chatbox_page
-from config.styles import CUSTOM_CSS
-from config.settings import MODEL_INFO, PAGE_CONFIG, PAGES
+from config.styles import CUSTOM_CSS, PAGE_STYLES, SIDEBAR_CSS
+from config.settings import METRICS_FILE, PAGE_CONFIG
 from components.sidebar import render_sidebar
-from _pages.home import render_home
-from _pages.kidney import render_kidney_page
-from _pages.liver import render_liver_page
-from _pages.parkinsons import render_parkinsons_page
-from _pages.about_models import render_about_models
+from components.static_render import stylesheet
+from utils.instrumentation import metrics, timer
+
+# Page modules (and their heavy dependencies) are only imported when selected
+PAGE_ROUTES = {
+    "🏠 Home": ("_pages.home", "render_home"),
+    "🫘 Kidney Disease": ("_pages.kidney", "render_kidney_page"),
+    "🫀 Liver Disease": ("_pages.liver", "render_liver_page"),
+    "🧠 Parkinson's Disease": ("_pages.parkinsons", "render_parkinsons_page"),
+    "Medical Chatbot": ("_pages.chatbox", "render_chatbox_page"),
+    "📊 About Models": ("_pages.about_models", "render_about_models"),
+}
 
 # Configure page
 st.set_page_config(**PAGE_CONFIG)
 
-# Apply custom CSS
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+# Placeholder for the stylesheet, filled once the page is known
+style_slot = st.empty()
 
 # Render sidebar and get selected page
 page = render_sidebar()
+module_name, render_name = PAGE_ROUTES.get(page, (None, None))
+
+# Apply the app, sidebar and page CSS as one element (identical across reruns)
+style_slot.markdown(stylesheet(CUSTOM_CSS, SIDEBAR_CSS, PAGE_STYLES.get(module_name)),
+                    unsafe_allow_html=True)
 
 # Route to selected page
-if page == "🏠 Home":
-    render_home()
-elif page == "🫘 Kidney Disease":
-    render_kidney_page()
-elif page == "🫀 Liver Disease":
-    render_liver_page()
-elif page == "🧠 Parkinson's Disease":
-    render_parkinsons_page()
-elif page == "Medical Chatbot":
-    render_chatbox_page()
-elif page == "📊 About Models":
-    render_about_models()
+if module_name:
+    with timer('page_render', page=module_name.rsplit('.', 1)[-1]):
+        getattr(importlib.import_module(module_name), render_name)()
+
+# Publish latency histograms for a Prometheus textfile collector
+if metrics.enabled and METRICS_FILE:
+    metrics.write_prometheus(METRICS_FILE)
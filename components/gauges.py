@@ -2,13 +2,21 @@
 Gauge and visualization components for displaying prediction confidence.
 """
 
-import plotly.graph_objects as go
+import copy
+from functools import lru_cache
+
+from utils.instrumentation import timer
 
 
 def create_confidence_gauge(confidence, title="Confidence"):
     """
     Create a confidence gauge chart using Plotly.
     
+    The styled gauge is validated once per title and cached as a plain
+    figure dict; each call copies only the indicator trace, patches its
+    value and threshold and wraps it without re-running Plotly's property
+    validation (the figure copies the shared layout on construction).
+    
     Args:
         confidence (float): Confidence percentage (0-100)
         title (str): Title for the gauge
@@ -16,6 +24,26 @@ def create_confidence_gauge(confidence, title="Confidence"):
     Returns:
         plotly.graph_objects.Figure: Configured gauge figure
     """
+    with timer('gauge_figure'):
+        import plotly.graph_objects as go
+
+        template = _gauge_template(title)
+        indicator = copy.deepcopy(template['data'][0])
+        indicator['value'] = float(confidence)
+        indicator['gauge']['threshold']['value'] = float(confidence)
+        return go.Figure({'data': [indicator], 'layout': template['layout']}, _validate=False)
+
+
+@lru_cache(maxsize=16)
+def _gauge_template(title):
+    """Validated gauge figure for ``title`` as a plotly JSON dict (value 0)."""
+    return _build_gauge(0, title).to_plotly_json()
+
+
+def _build_gauge(confidence, title):
+    # Imported on first use so pages don't pay for plotly until a result is shown
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=confidence,
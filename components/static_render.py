@@ -0,0 +1,62 @@
+"""
+Static HTML/CSS rendering for FamilyAIDoc pages.
+Static sections are compacted once per process (and ``APP_VERSION``) and
+sent as few, byte-identical markdown elements. Streamlit replaces an
+element the browser already holds with a hash reference on later reruns
+(for elements of at least ``global.minCachedMessageSize``, set in
+.streamlit/config.toml), so reruns only ship content that changed.
+"""
+
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+from config.settings import APP_VERSION
+
+
+def compact_css(css):
+    """Strip ``<style>`` tags, comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r'</?style>', '', css)
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
+
+def compact_html(html):
+    """Drop indentation and blank lines from an HTML fragment."""
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+
+@lru_cache(maxsize=32)
+def _stylesheet(version, sheets):
+    return '<style>' + ''.join(compact_css(sheet) for sheet in dict.fromkeys(sheets)) + '</style>'
+
+
+@lru_cache(maxsize=64)
+def _section(version, blocks):
+    return '\n'.join(compact_html(block) for block in blocks)
+
+
+def stylesheet(*sheets):
+    """
+    One compacted ``<style>`` element from several stylesheets.
+
+    Args:
+        *sheets (str): CSS strings (with or without ``<style>`` tags);
+            empty and repeated sheets are skipped
+
+    Returns:
+        str: Combined stylesheet, built once per process
+    """
+    return _stylesheet(APP_VERSION, tuple(sheet for sheet in sheets if sheet))
+
+
+def static_markdown(*blocks):
+    """
+    Render static HTML blocks as one compacted markdown element.
+
+    Args:
+        *blocks (str): HTML fragments, rendered in order
+    """
+    st.markdown(_section(APP_VERSION, blocks), unsafe_allow_html=True)
@@ -2,24 +2,132 @@
 Configuration settings and constants for FamilyAIDoc application.
 """
 
+import os
+import tempfile
+
 # Model paths
+# 'bundle' is the single-file artifact written by the training scripts; the
+# separate pickles are only read when no bundle has been built yet.
 MODEL_PATHS = {
     'kidney': {
+        'bundle': 'models/kidney/kidney_extratrees_bundle.joblib',
+        'onnx': 'models/kidney/kidney_extratrees.onnx',
         'model': 'models/kidney/kidney_extratrees_basic.pkl',
         'scaler': 'models/kidney/kidney_extratrees_scaler.pkl',
+        'features': 'models/kidney/kidney_extratrees_features.pkl',
         'metadata': 'models/kidney/kidney_extratrees_metadata.pkl',
     },
     'liver': {
+        'bundle': 'models/liver/liver_randomforest_bundle.joblib',
+        'onnx': 'models/liver/liver_randomforest.onnx',
         'model': 'models/liver/liver_randomforest_basic.pkl',
         'scaler': 'models/liver/liver_randomforest_scaler.pkl',
+        'features': 'models/liver/liver_randomforest_features.pkl',
+        'metadata': 'models/liver/liver_randomforest_metadata.pkl',
     },
     'parkinsons': {
+        'bundle': 'models/parkinsons/parkinsons_xgboost_bundle.joblib',
+        'onnx': 'models/parkinsons/parkinsons_xgboost.onnx',
         'model': 'models/parkinsons/parkinsons_xgboost_basic.pkl',
         'scaler': 'models/parkinsons/parkinsons_xgboost_scaler.pkl',
         'features': 'models/parkinsons/parkinsons_xgboost_features.pkl',
+        'metadata': 'models/parkinsons/parkinsons_xgboost_metadata.pkl',
     }
 }
 
+# Tree-model inference backend: 'sklearn' (predict_proba), 'compiled'
+# (flat NumPy node arrays, see models_utils/compiled_trees.py) or 'onnx'
+# (exported scaler + model graph served by onnxruntime, falls back to
+# 'sklearn' when the .onnx file or onnxruntime is missing)
+INFERENCE_BACKEND = os.getenv('FAMILYAIDOC_BACKEND', 'sklearn')
+
+# onnxruntime threads per prediction call
+ONNX_INTRA_OP_THREADS = 1
+
+# Cache of recent single-patient predictions (size 0 disables it)
+PREDICTION_CACHE_SIZE = 1024
+PREDICTION_CACHE_TTL = 3600  # seconds
+PREDICTION_CACHE_MAX_BATCH = 32  # larger batches bypass the cache
+
+# Single-patient predictions arriving within this window are scored as one
+# batch (0 disables coalescing)
+COALESCE_WINDOW_MS = float(os.getenv('FAMILYAIDOC_COALESCE_MS', '3'))
+COALESCE_MAX_BATCH = 64
+
+# Worker processes for out-of-process scoring (0 keeps inference on the
+# Streamlit script thread)
+INFERENCE_WORKERS = int(os.getenv('FAMILYAIDOC_INFERENCE_WORKERS', '0'))
+
+# Rows read per chunk when scoring uploaded CSV files
+CSV_CHUNK_SIZE = 5000
+
+# Scored CSV files offered for download; files older than the max age (seconds)
+# are deleted whenever another CSV is scored, so abandoned sessions don't pile up
+SCORED_CSV_DIR = os.getenv(
+    'FAMILYAIDOC_SCORED_CSV_DIR',
+    os.path.join(tempfile.gettempdir(), 'familyaidoc_scored')
+)
+SCORED_CSV_MAX_AGE = int(os.getenv('FAMILYAIDOC_SCORED_CSV_MAX_AGE', '3600'))
+
+# Load every model and run a dummy prediction in the background at server start
+# (serve.py and the API startup hook)
+WARMUP_ON_START = os.getenv('FAMILYAIDOC_WARMUP', '1') != '0'
+WARMUP_WORKERS = 3
+
+# Written once warm-up succeeds; load balancers poll it before routing traffic
+WARMUP_HEALTH_FILE = os.getenv(
+    'FAMILYAIDOC_HEALTH_FILE',
+    os.path.join(tempfile.gettempdir(), 'familyaidoc_ready.json')
+)
+
+# Prediction API (api/server.py): threads running model inference and the
+# largest batch accepted by the /predict/<disease>/batch endpoints
+API_WORKER_THREADS = int(os.getenv('FAMILYAIDOC_API_THREADS', '8'))
+API_MAX_BATCH = 1000
+
+# Per-stage latency histograms (utils/instrumentation.py); exported in the
+# Prometheus text format to METRICS_FILE after each page run and served at
+# /metrics by the API
+METRICS_ENABLED = os.getenv('FAMILYAIDOC_METRICS', '0') == '1'
+METRICS_FILE = os.getenv('FAMILYAIDOC_METRICS_FILE')
+
+# Convex disease search (utils/convex_client.py): connect/read timeouts,
+# retries after the first attempt with jittered exponential backoff, and a
+# circuit breaker that skips Convex for CONVEX_BREAKER_RESET seconds after
+# CONVEX_BREAKER_THRESHOLD consecutive failed lookups
+CONVEX_TIMEOUT = (3.05, float(os.getenv('FAMILYAIDOC_CONVEX_TIMEOUT', '4')))
+CONVEX_RETRIES = 2
+CONVEX_BACKOFF_BASE = 0.2  # seconds
+CONVEX_BACKOFF_MAX = 2.0  # seconds
+CONVEX_BREAKER_THRESHOLD = 3
+CONVEX_BREAKER_RESET = 30  # seconds
+CONVEX_POOL_SIZE = 10
+
+# Process-wide cache of Convex search results, keyed by the normalized
+# symptom tokens of the query and the disease snapshot version
+CONVEX_CACHE_SIZE = 512
+CONVEX_CACHE_TTL = 900  # seconds
+
+# Exported copy of the Convex `diseases` table (tools/export_disease_snapshot.py)
+# searched in-process by utils/symptom_index.py. SYMPTOM_SEARCH: 'auto' uses
+# Convex and falls back to the snapshot when CONVEX_URL is unset or Convex is
+# unavailable, 'local' only searches the snapshot, 'convex' never does
+DISEASE_SNAPSHOT_PATH = os.getenv('FAMILYAIDOC_DISEASE_SNAPSHOT', 'data/diseases/diseases_snapshot.json')
+SYMPTOM_SEARCH = os.getenv('FAMILYAIDOC_SYMPTOM_SEARCH', 'auto')
+
+# Chat turn pipeline (utils/chat_pipeline.py): per-stage timeouts in seconds.
+# Retrieval falls back to the snapshot, summarization to the full history;
+# CHAT_LLM_TIMEOUT bounds the wait for each streamed chunk of the reply
+CHAT_MODEL = 'llama-3.1-8b-instant'
+CHAT_RETRIEVAL_TIMEOUT = float(os.getenv('FAMILYAIDOC_CHAT_RETRIEVAL_TIMEOUT', '4'))
+CHAT_SUMMARY_TIMEOUT = float(os.getenv('FAMILYAIDOC_CHAT_SUMMARY_TIMEOUT', '3'))
+CHAT_LLM_TIMEOUT = float(os.getenv('FAMILYAIDOC_CHAT_LLM_TIMEOUT', '20'))
+# Messages sent verbatim; older ones are replaced by a running summary
+CHAT_HISTORY_KEEP = 12
+
+# Keys the per-process cache of static page HTML / CSS (components/static_render.py)
+APP_VERSION = os.getenv('FAMILYAIDOC_VERSION', '1.0.0')
+
 # Page configuration
 PAGE_CONFIG = {
     'page_title': "FamilyAIDoc - AI Disease Detection",
@@ -72,6 +180,20 @@ PARKINSONS_FEATURES = [
     'rpde', 'dfa', 'spread1', 'spread2', 'd2', 'ppe'
 ]
 
+# Kidney feature order (matches the columns the kidney scaler was fit on)
+KIDNEY_FEATURES = [
+    'age', 'bp', 'sg', 'al', 'su', 'rbc', 'pc', 'pcc', 'ba',
+    'bgr', 'bu', 'sc', 'sod', 'pot', 'hemo', 'pcv', 'wc', 'rc',
+    'htn', 'dm', 'cad', 'appet', 'pe', 'ane'
+]
+
+# Liver feature order (matches the columns the liver scaler was fit on)
+LIVER_FEATURES = [
+    'age', 'gender', 'total_bilirubin', 'direct_bilirubin',
+    'alkaline_phosphotase', 'alamine_aminotransferase',
+    'aspartate_aminotransferase', 'total_protiens', 'albumin', 'ag_ratio'
+]
+
 # Clinical thresholds for kidney disease
 KIDNEY_THRESHOLDS = {
     'high_creatinine': 1.8,
@@ -94,5 +216,20 @@ KIDNEY_ENCODING = {
     'ane': {'yes': 1, 'no': 0},
 }
 
+# Encoded value used when a kidney categorical input is missing or unknown
+KIDNEY_ENCODING_DEFAULTS = {
+    'rbc': 1,
+    'pc': 1,
+    'pcc': 0,
+    'ba': 0,
+    'htn': 0,
+    'dm': 0,
+    'cad': 0,
+    'appet': 0,
+    'pe': 0,
+    'ane': 0,
+}
+
 # SG values for kidney disease
 SG_VALUES = [1.005, 1.010, 1.015, 1.020, 1.025]
+SG_DEFAULT = 1.020
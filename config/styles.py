@@ -201,3 +201,697 @@ CUSTOM_CSS = """
     }
     </style>
     """
+
+
+# Sidebar theme (components/sidebar.py)
+SIDEBAR_CSS = """
+    <style>
+    /* Sidebar shell */
+    section[data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #0b0f14 0%, #020617 100%);
+        border-right: 1px solid rgba(255,255,255,0.05);
+    }
+
+    section[data-testid="stSidebar"] > div {
+        padding: 1.6rem 1.2rem 2rem 1.2rem;
+    }
+
+    /* Brand */
+    .sidebar-brand h2 {
+        margin: 0;
+        font-size: 1.45rem;
+        font-weight: 800;
+        letter-spacing: -0.5px;
+        color: #f9fafb;
+    }
+
+    .sidebar-tagline {
+        font-size: 0.7rem;
+        letter-spacing: 2px;
+        text-transform: uppercase;
+        color: #9ca3af;
+        margin-bottom: 1.8rem;
+    }
+    
+    /* Brand container */
+    .sidebar-brand-wrap {
+        padding-bottom: 1.4rem;
+        margin-bottom: 1.6rem;
+        border-bottom: 1px solid rgba(255,255,255,0.06);
+    }
+
+    .sidebar-brand {
+        display: flex;
+        align-items: center;
+        gap: 12px;
+    }
+
+    .sidebar-logo {
+        width: 36px;
+        height: 36px;
+        border-radius: 10px;
+        background: linear-gradient(145deg, #14b8a6, #0ea5a5);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 1.1rem;
+        box-shadow: inset 0 0 0 1px rgba(255,255,255,0.25);
+    }
+
+    .sidebar-brand h2 {
+        margin: 0;
+        font-size: 1.45rem;
+        font-weight: 800;
+        letter-spacing: -0.4px;
+        color: #f9fafb;
+        line-height: 1.1;
+    }
+
+    .sidebar-tagline {
+        margin-left: 48px;
+        margin-top: 0.3rem;
+        font-size: 0.65rem;
+        letter-spacing: 3px;
+        text-transform: uppercase;
+        color: #9ca3af;
+    }
+
+    /* Section label */
+    .sidebar-section {
+        font-size: 0.65rem;
+        letter-spacing: 2px;
+        text-transform: uppercase;
+        color: #6b7280;
+        margin-bottom: 0.6rem;
+    }
+
+    /* Radio container */
+    div[data-testid="stRadio"] div[role="radiogroup"] {
+        gap: 6px;
+    }
+
+    /* Radio option */
+    div[data-testid="stRadio"] div[role="radiogroup"] label {
+        position: relative;
+        background: rgba(255,255,255,0.025);
+        border-radius: 10px;
+        padding: 0.55rem 0.75rem 0.55rem 0.85rem;
+        border: 1px solid rgba(255,255,255,0.05);
+        transition: all 0.2s ease;
+        font-size: 0.9rem;
+        color: #e5e7eb;
+    }
+
+    /* Hover */
+    div[data-testid="stRadio"] div[role="radiogroup"] label:hover {
+        background: rgba(20,184,166,0.08);
+        border-color: rgba(20,184,166,0.25);
+    }
+
+    /* ACTIVE PAGE */
+    div[data-testid="stRadio"] input:checked + div {
+        background: rgba(20,184,166,0.14);
+        border-color: rgba(20,184,166,0.6);
+        color: #ecfeff;
+    }
+
+    /* Left accent bar for active item */
+    div[data-testid="stRadio"] input:checked + div::before {
+        content: "";
+        position: absolute;
+        left: 0;
+        top: 6px;
+        bottom: 6px;
+        width: 3px;
+        border-radius: 3px;
+        background: #14b8a6;
+    }
+
+    /* Info box */
+    div[data-testid="stAlert"] {
+        background: rgba(255,255,255,0.035);
+        border-radius: 14px;
+        border: 1px solid rgba(255,255,255,0.06);
+        color: #d1d5db;
+        font-size: 0.85rem;
+        line-height: 1.6;
+    }
+
+    /* Footer */
+    .sidebar-footer {
+        margin-top: 3rem;
+        padding-top: 1.4rem;
+        border-top: 1px solid rgba(255,255,255,0.06);
+        text-align: center;
+    }
+
+    .footer-section {
+        margin-bottom: 0.45rem;
+        font-size: 0.72rem;
+    }
+
+    .footer-muted {
+        color: #9ca3af;
+        letter-spacing: 1.5px;
+        text-transform: uppercase;
+    }
+
+    .footer-strong {
+        color: #e5e7eb;
+        font-weight: 600;
+    }
+
+    .footer-brand {
+        color: #14b8a6;
+        font-weight: 700;
+    }
+
+    .footer-made {
+        margin-top: 0.8rem;
+        color: #cbd5e1;
+        font-size: 0.7rem;
+    }
+
+    .heart {
+        display: inline-block;
+        margin: 0 2px;
+    }
+
+    .footer-names {
+        margin-top: 0.5rem;
+        display: flex;
+        flex-direction: column;
+        gap: 0.35rem;
+    }
+
+    .footer-name {
+        font-size: 0.68rem;
+        color: #94a3b8;
+    }
+    </style>
+    """
+
+
+# Home page (_pages/home.py)
+HOME_CSS = """
+    <style>
+    :root {
+        --primary-mint: #10b981;
+        --electric-blue: #3b82f6;
+        --slate-950: #020617;
+        --slate-900: #0f172a;
+        --slate-800: #1e293b;
+        --text-main: #f8fafc;
+        --glass: rgba(30, 41, 59, 0.45);
+        --glass-border: rgba(255, 255, 255, 0.08);
+    }
+
+    /* Entry Animations */
+    @keyframes fadeInUp {
+        from { opacity: 0; transform: translateY(30px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    @keyframes float {
+        0% { transform: translateY(0px); }
+        50% { transform: translateY(-10px); }
+        100% { transform: translateY(0px); }
+    }
+
+    /* Hero Styling - Mesh Gradient */
+
+    .hero-container {
+        padding: 5.5rem 2.5rem;
+        border-radius: 36px;
+        background:
+            radial-gradient(circle at 20% 20%, rgba(16,185,129,0.15), transparent 40%),
+            radial-gradient(circle at 80% 30%, rgba(59,130,246,0.18), transparent 45%),
+            linear-gradient(180deg, #020617, #0f172a);
+        border: 1px solid rgba(255,255,255,0.08);
+        text-align: center;
+        margin-bottom: 4rem;
+        box-shadow:
+            0 40px 80px -20px rgba(0,0,0,0.75),
+            inset 0 1px 0 rgba(255,255,255,0.05);
+        animation: fadeInUp 0.9s ease-out;
+    }
+
+    .hero-icon {
+        font-size: 3.8rem;
+        margin-bottom: 1.2rem;
+        filter: drop-shadow(0 0 20px rgba(16,185,129,0.35));
+    }
+
+    .hero-title {
+        font-size: 4.8rem;
+        font-weight: 900;
+        margin-bottom: 1rem;
+        letter-spacing: -2px;
+        background: linear-gradient(180deg, #ffffff 20%, #cbd5e1 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+
+    .hero-badge {
+        display: inline-block;
+        padding: 0.45rem 1.2rem;
+        border-radius: 999px;
+        background: rgba(16,185,129,0.12);
+        color: var(--primary-mint);
+        font-size: 0.8rem;
+        font-weight: 800;
+        letter-spacing: 2px;
+        text-transform: uppercase;
+        margin-bottom: 1.6rem;
+        border: 1px solid rgba(16,185,129,0.25);
+    }
+
+    .hero-description {
+        color: #94a3b8;
+        max-width: 780px;
+        margin: 0 auto;
+        font-size: 1.1rem;
+        line-height: 1.9;
+    }
+
+    .hero-description strong {
+        color: #e5e7eb;
+        font-weight: 600;
+    }
+
+    /* Glass Card Evolution */
+    .glass-card {
+        background: var(--glass);
+        backdrop-filter: blur(12px);
+        padding: 2.5rem 2rem;
+        border-radius: 24px;
+        border: 1px solid var(--glass-border);
+        transition: all 0.5s cubic-bezier(0.23, 1, 0.32, 1);
+        height: 100%;
+        display: flex;
+        flex-direction: column;
+    }
+    
+    .glass-card:hover {
+        transform: translateY(-15px) scale(1.02);
+        border-color: var(--primary-mint);
+        box-shadow: 0 30px 60px -12px rgba(0, 0, 0, 0.6);
+        background: rgba(30, 41, 59, 0.75);
+    }
+
+    .icon-wrapper {
+        animation: float 4s ease-in-out infinite;
+    }
+
+    /* Process Step Evolution */
+    .process-step {
+        position: relative;
+        text-align: center;
+        padding: 2rem 1.5rem;
+        background: var(--slate-800);
+        border-radius: 20px;
+        border: 1px solid var(--glass-border);
+        transition: 0.3s;
+    }
+    
+    .process-step:hover {
+        border-color: var(--electric-blue);
+        background: var(--slate-900);
+    }
+
+    .step-number {
+        position: absolute;
+        top: -15px;
+        left: 50%;
+        transform: translateX(-50%);
+        background: var(--electric-blue);
+        color: white;
+        width: 30px;
+        height: 30px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 800;
+        font-size: 0.8rem;
+        box-shadow: 0 0 15px rgba(59, 130, 246, 0.5);
+    }
+
+    /* Tech Section */
+    .tech-box-modern {
+        background: linear-gradient(165deg, #0a0f1a 0%, #020617 100%);
+        padding: 3rem;
+        border-radius: 28px;
+        border: 1px solid var(--glass-border);
+        border-left: 6px solid var(--primary-mint);
+        box-shadow: inset 0 1px 1px rgba(255,255,255,0.05);
+    }
+                
+    @keyframes fadeInUp {
+        from { opacity: 0; transform: translateY(20px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    /* Step Card Styling */
+    .step-card-modern {
+        background: linear-gradient(145deg, #1e293b, #0f172a);
+        border: 1px solid rgba(255, 255, 255, 0.05);
+        border-radius: 20px;
+        padding: 2.5rem 1.5rem;
+        text-align: center;
+        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
+        height: 100%;
+        animation: fadeInUp 0.8s ease-out;
+    }
+
+    /* Hover Effects */
+    .step-card-modern:hover {
+        transform: translateY(-12px);
+        border-color: #3b82f6;
+        box-shadow: 0 15px 45px rgba(0, 0, 0, 0.4), 0 0 15px rgba(59, 130, 246, 0.2);
+        background: #1e293b;
+    }
+
+    /* Icon Container */
+    .step-icon-box {
+        width: 60px;
+        height: 60px;
+        margin: 0 auto 1.5rem auto;
+        background: rgba(59, 130, 246, 0.1);
+        border-radius: 15px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: #3b82f6;
+    }
+
+    .step-badge {
+        font-size: 0.7rem;
+        font-weight: 800;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        color: #3b82f6;
+        margin-bottom: 0.5rem;
+        display: block;
+    }
+
+    .step-title-modern {
+        color: #ffffff;
+        font-size: 1.25rem;
+        font-weight: 700;
+        margin-bottom: 0.75rem;
+    }
+
+    .step-desc-modern {
+        color: #94a3b8;
+        font-size: 0.85rem;
+        line-height: 1.5;
+    }
+    
+    /* Emergency Alert Styling */
+    .legal-warning-container {
+        margin-top: 4rem;
+        padding: 2.5rem;
+        background: linear-gradient(165deg, rgba(239, 68, 68, 0.08) 0%, rgba(127, 29, 29, 0.15) 100%);
+        border: 1px solid rgba(239, 68, 68, 0.3);
+        border-radius: 24px;
+        backdrop-filter: blur(10px);
+        animation: borderPulse 4s infinite;
+    }
+
+    @keyframes borderPulse {
+        0% { border-color: rgba(239, 68, 68, 0.3); box-shadow: 0 0 0 0 rgba(239, 68, 68, 0); }
+        50% { border-color: rgba(239, 68, 68, 0.6); box-shadow: 0 0 20px rgba(239, 68, 68, 0.1); }
+        100% { border-color: rgba(239, 68, 68, 0.3); box-shadow: 0 0 0 0 rgba(239, 68, 68, 0); }
+    }
+
+    .warning-header {
+        display: flex;
+        align-items: center;
+        gap: 15px;
+        margin-bottom: 1.5rem;
+    }
+
+    .warning-icon {
+        color: #ef4444;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        background: rgba(239, 68, 68, 0.15);
+        padding: 10px;
+        border-radius: 12px;
+    }
+
+    .warning-title {
+        color: #fca5a5 !important;
+        font-size: 1.1rem !important;
+        font-weight: 800 !important;
+        letter-spacing: 1.5px !important;
+        margin: 0 !important;
+        text-transform: uppercase;
+    }
+
+    .primary-alert {
+        color: #ffffff;
+        font-size: 1.05rem;
+        margin-bottom: 1rem;
+    }
+
+    .secondary-text {
+        color: #f8fafc;
+        opacity: 0.85;
+        font-size: 0.95rem;
+        line-height: 1.6;
+        margin-bottom: 1.2rem;
+    }
+
+    .compliance-list {
+        color: #cbd5e1;
+        font-size: 0.9rem;
+        padding-left: 1.2rem;
+        margin-bottom: 1.5rem;
+    }
+
+    .compliance-list li {
+        margin-bottom: 8px;
+    }
+
+    .compliance-list strong {
+        color: #fca5a5;
+    }
+
+    .footer-notice {
+        font-size: 0.8rem;
+        color: #94a3b8;
+        font-style: italic;
+        border-top: 1px solid rgba(255, 255, 255, 0.1);
+        padding-top: 1rem;
+    }
+    </style>
+    """
+
+
+# About Models page (_pages/about_models.py)
+ABOUT_MODELS_CSS = """
+    <style>
+    :root {
+        --glass-bg: rgba(15, 23, 42, 0.7);
+        --glass-border: rgba(255, 255, 255, 0.08);
+        --accent-kidney: #10b981;
+        --accent-liver: #3b82f6;
+        --accent-neuro: #8b5cf6;
+    }
+
+    @keyframes fadeInUp {
+        from { opacity: 0; transform: translateY(30px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    /* Bio-Tech Card Style */
+    .model-card {
+        position: relative;
+        background: var(--glass-bg);
+        backdrop-filter: blur(14px);
+        border: 1px solid var(--glass-border);
+        border-radius: 28px;
+        padding: 2.5rem;
+        margin-bottom: 3rem;
+        overflow: hidden;
+        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
+        animation: fadeInUp 0.8s ease-out backwards;
+    }
+
+    /* Pattern Overlays */
+    .pattern-dots::before {
+        content: ""; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+        background-image: radial-gradient(rgba(255,255,255,0.03) 1px, transparent 1px);
+        background-size: 24px 24px; pointer-events: none;
+    }
+    
+    .pattern-waves::before {
+        content: ""; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+        background: repeating-linear-gradient(45deg, transparent, transparent 10px, rgba(139, 92, 246, 0.02) 10px, rgba(139, 92, 246, 0.02) 11px);
+        pointer-events: none;
+    }
+
+    .model-card:hover {
+        transform: translateY(-10px);
+        border-color: rgba(255,255,255,0.2);
+        box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.5);
+    }
+
+    .card-1 { animation-delay: 0.2s; border-left: 5px solid var(--accent-kidney); }
+    .card-2 { animation-delay: 0.4s; border-left: 5px solid var(--accent-liver); }
+    .card-3 { animation-delay: 0.6s; border-left: 5px solid var(--accent-neuro); }
+
+    .severity-badge {
+        display: inline-block;
+        padding: 4px 12px;
+        border-radius: 8px;
+        font-size: 0.75rem;
+        font-weight: 700;
+        text-transform: uppercase;
+        margin-bottom: 1rem;
+        background: rgba(239, 68, 68, 0.1);
+        color: #ef4444;
+        border: 1px solid rgba(239, 68, 68, 0.2);
+    }
+
+    .health-tip-box {
+        margin-top: 2rem;
+        padding: 1.5rem;
+        border-radius: 16px;
+        transition: 0.3s;
+    }
+    
+    .pill {
+        display: inline-block;
+        padding: 4px 12px;
+        border-radius: 50px;
+        background: rgba(255,255,255,0.05);
+        border: 1px solid rgba(255,255,255,0.1);
+        margin: 4px 2px;
+        font-size: 0.8rem;
+    }
+                
+    .dashboard-container {
+        margin-top: 3rem;
+        padding: 2.5rem;
+        background: linear-gradient(165deg, rgba(30, 41, 59, 0.5) 0%, rgba(15, 23, 42, 0.8) 100%);
+        border-radius: 30px;
+        border: 1px solid rgba(59, 130, 246, 0.2);
+        backdrop-filter: blur(15px);
+    }
+
+    .dashboard-header {
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        margin-bottom: 1rem;
+    }
+
+    .dashboard-title {
+        color: #ffffff !important;
+        font-size: 1.4rem !important;
+        font-weight: 800 !important;
+        margin: 0 !important;
+        letter-spacing: -0.5px;
+    }
+
+    .dashboard-subtitle {
+        color: #94a3b8;
+        font-size: 0.95rem;
+        margin-bottom: 2.5rem;
+        max-width: 600px;
+    }
+
+    .pulse-indicator {
+        width: 10px;
+        height: 10px;
+        background: #3b82f6;
+        border-radius: 50%;
+        box-shadow: 0 0 10px #3b82f6;
+        animation: pulseSync 2s infinite;
+    }
+
+    @keyframes pulseSync {
+        0% { transform: scale(1); opacity: 1; }
+        50% { transform: scale(1.5); opacity: 0.5; }
+        100% { transform: scale(1); opacity: 1; }
+    }
+
+    /* Metrics Grid Layout */
+    .metrics-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+        gap: 20px;
+        margin-bottom: 2rem;
+    }
+
+    .metric-item {
+        background: rgba(255, 255, 255, 0.03);
+        padding: 1.5rem 1rem;
+        border-radius: 20px;
+        border: 1px solid rgba(255, 255, 255, 0.05);
+        text-align: center;
+        transition: all 0.3s ease;
+    }
+
+    .metric-item:hover {
+        background: rgba(59, 130, 246, 0.05);
+        border-color: rgba(59, 130, 246, 0.3);
+        transform: translateY(-5px);
+    }
+
+    .metric-viz {
+        font-size: 1.1rem;
+        font-weight: 800;
+        margin-bottom: 0.5rem;
+    }
+
+    .accuracy-glow { color: #10b981; }
+    .precision-glow { color: #3b82f6; }
+    .recall-glow { color: #f59e0b; }
+    .f1-glow { color: #8b5cf6; }
+
+    .metric-label {
+        color: #f8fafc;
+        font-weight: 700;
+        font-size: 0.9rem;
+        margin-bottom: 8px;
+    }
+
+    .metric-info {
+        color: #64748b;
+        font-size: 0.75rem;
+        line-height: 1.4;
+    }
+
+    /* Footer Pills */
+    .advanced-metrics-bar {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 10px;
+        padding-top: 1.5rem;
+        border-top: 1px solid rgba(255, 255, 255, 0.1);
+    }
+
+    .pill-outline {
+        padding: 5px 15px;
+        border-radius: 50px;
+        border: 1px solid rgba(148, 163, 184, 0.3);
+        color: #94a3b8;
+        font-size: 0.75rem;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+    </style>
+    """
+
+# Page-specific stylesheets, by page module; injected together with
+# CUSTOM_CSS and SIDEBAR_CSS as a single element per run
+PAGE_STYLES = {
+    '_pages.home': HOME_CSS,
+    '_pages.about_models': ABOUT_MODELS_CSS,
+}
@@ -149,6 +149,14 @@ export const searchDiseases = query({
   },
 });
 
+/* 📦 FULL TABLE (snapshot for the app's local symptom index) */
+export const listDiseases = query({
+  args: {},
+  handler: async (ctx) => {
+    return await ctx.db.query("diseases").collect();
+  },
+});
+
 /* ➕ ADD DISEASE */
 export const addDisease = mutation({
   args: {
@@ -322,4 +322,20 @@ http.route({
   }),
 });
 
+http.route({
+  path: "/api/diseases",
+  method: "GET",
+  handler: httpAction(async (ctx) => {
+    const diseases = await ctx.runQuery(api.diseases.listDiseases, {});
+
+    return new Response(JSON.stringify(diseases), {
+      status: 200,
+      headers: {
+        "Content-Type": "application/json",
+        "Access-Control-Allow-Origin": "*",
+      },
+    });
+  }),
+});
+
 export default http;
@@ -0,0 +1,149 @@
+"""
+Per-disease model bundle format for FamilyAIDoc.
+A bundle is one joblib file holding everything needed to serve a disease:
+model, scaler, feature order, class mapping, thresholds and training metrics.
+"""
+
+import os
+from datetime import datetime, timezone
+
+import joblib
+
+from config.settings import KIDNEY_THRESHOLDS, MODEL_PATHS
+from models_utils.compiled_trees import CompiledForest, is_compilable
+
+
+# Bump when the bundle layout changes; older bundles must be rebuilt
+BUNDLE_VERSION = 1
+
+
+def build_model_bundle(disease, model, scaler, features, class_mapping=None,
+                       thresholds=None, metrics=None, created_at=None):
+    """
+    Assemble a versioned model bundle.
+
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        model: Trained classifier
+        scaler: Fitted scaler used before the classifier
+        features (list): Feature names in model input order
+        class_mapping (list): Class label for each predicted class index
+        thresholds (dict): Clinical or decision thresholds for the disease
+        metrics (dict): Training/evaluation metrics (accuracy, f1, ...)
+        created_at (str): ISO timestamp of the trained model, defaults to now
+
+    Returns:
+        dict: Bundle ready for ``save_model_bundle``; forest models also get
+        their ``compiled`` node arrays
+    """
+    compiled = CompiledForest.from_sklearn(model).to_arrays() if is_compilable(model) else None
+    return {
+        'version': BUNDLE_VERSION,
+        'disease': disease,
+        'model': model,
+        'scaler': scaler,
+        'features': list(features) if features is not None else None,
+        'class_mapping': list(class_mapping) if class_mapping is not None else None,
+        'thresholds': dict(thresholds or {}),
+        'metrics': dict(metrics or {}),
+        'compiled': compiled,
+        'created_at': created_at or datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def save_model_bundle(bundle, path):
+    """
+    Write a bundle to disk.
+
+    Saved uncompressed so NumPy arrays inside it can be memory-mapped by
+    ``load_model_bundle`` and shared between worker processes through the
+    OS page cache.
+
+    Args:
+        bundle (dict): Bundle from ``build_model_bundle``
+        path (str): Destination file
+    """
+    joblib.dump(bundle, path)
+
+
+def load_model_bundle(disease, model_paths=None, mmap_mode='r'):
+    """
+    Load the bundle for a disease.
+
+    Falls back to the older separate model/scaler/features/metadata pickles
+    when no bundle file has been built yet.
+
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        model_paths (dict): Defaults to ``config.settings.MODEL_PATHS``
+        mmap_mode (str): Passed to ``joblib.load``; ``None`` disables mapping
+
+    Returns:
+        dict: Bundle with the keys produced by ``build_model_bundle``
+    """
+    paths = (model_paths or MODEL_PATHS)[disease]
+
+    bundle_path = paths.get('bundle')
+    if bundle_path and os.path.exists(bundle_path):
+        bundle = joblib.load(bundle_path, mmap_mode=mmap_mode)
+        if not isinstance(bundle, dict) or bundle.get('version') != BUNDLE_VERSION:
+            raise ValueError(
+                f"{bundle_path} is not a version {BUNDLE_VERSION} bundle, "
+                "rebuild it with training_scripts/build_model_bundles.py"
+            )
+        return bundle
+
+    return load_legacy_bundle(disease, paths)
+
+
+def load_legacy_bundle(disease, paths):
+    """
+    Build a bundle in memory from the separate per-artifact pickles.
+
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        paths (dict): Artifact paths for this disease from ``MODEL_PATHS``
+
+    Returns:
+        dict: Bundle with the keys produced by ``build_model_bundle``
+    """
+    metadata = _load_optional(paths.get('metadata'))
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    features = _load_optional(paths.get('features'))
+    if features is None:
+        features = metadata.get('features')
+
+    metrics = {'accuracy': float(metadata['accuracy'])} if 'accuracy' in metadata else {}
+
+    return build_model_bundle(
+        disease,
+        model=joblib.load(paths['model']),
+        scaler=joblib.load(paths['scaler']),
+        features=features,
+        class_mapping=metadata.get('target_classes'),
+        thresholds=KIDNEY_THRESHOLDS if disease == 'kidney' else None,
+        metrics=metrics,
+        created_at=datetime.fromtimestamp(os.path.getmtime(paths['model']), timezone.utc).isoformat(),
+    )
+
+
+def bundle_id(bundle):
+    """
+    Identify the trained model inside a bundle.
+
+    Args:
+        bundle (dict): Loaded model bundle
+
+    Returns:
+        str: Disease, bundle format version and model timestamp
+    """
+    return f"{bundle.get('disease')}:v{bundle.get('version')}:{bundle.get('created_at')}"
+
+
+def _load_optional(path):
+    """Load an artifact the bundle can do without."""
+    if path is None or not os.path.exists(path):
+        return None
+    return joblib.load(path)
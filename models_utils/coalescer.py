@@ -0,0 +1,144 @@
+"""
+Micro-batching request coalescer for FamilyAIDoc.
+Single-patient predictions from concurrent Streamlit sessions (or API
+requests) that arrive within a few milliseconds of each other are stacked
+into one matrix and scored with one vectorized ``predict`` call, then the
+rows are handed back to their callers.
+"""
+
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+import numpy as np
+
+from models_utils.predictor import PredictionResult
+
+
+class RequestCoalescer:
+    """
+    Wrap a predictor so concurrent one-row ``predict`` calls share a batch.
+
+    A daemon thread waits for the first queued request. If nothing else is
+    queued it is scored at once; otherwise the thread keeps collecting
+    requests for ``window_ms`` (or until ``max_batch`` rows are queued) and
+    scores them together. Under load, requests queue up while a batch is
+    being scored, so the window is only paid when there is something to
+    share it with. Multi-row calls skip the queue, they are already batched.
+    """
+
+    def __init__(self, predictor, window_ms=3.0, max_batch=64):
+        """
+        Args:
+            predictor: Object with ``predict(features) -> PredictionResult``
+            window_ms (float): How long to wait for more requests after the
+                first one, when others are already queued
+            max_batch (int): Rows scored together at most
+        """
+        self.predictor = predictor
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._batch_sizes = Counter()
+        self._stats_lock = threading.Lock()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # Expose the wrapped predictor's attributes (model, scaler, classes_, ...)
+        if name == 'predictor':
+            raise AttributeError(name)
+        return getattr(self.predictor, name)
+
+    def predict(self, features):
+        """
+        Predict, batching single rows with other concurrent callers.
+
+        Args:
+            features (array-like): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            PredictionResult: Same as the wrapped predictor's result
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if features.shape[0] != 1:
+            return self.predictor.predict(features)
+
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((features[0], future))
+        return future.result()
+
+    def predict_proba(self, features):
+        """Class probabilities, batched like ``predict``."""
+        return self.predict(features).probabilities
+
+    def stats(self):
+        """
+        Achieved batch sizes.
+
+        Returns:
+            dict: ``requests``, ``batches``, ``mean_batch_size``,
+            ``max_batch_size`` and the ``histogram`` of batch sizes
+        """
+        with self._stats_lock:
+            batches = sum(self._batch_sizes.values())
+            requests = sum(size * count for size, count in self._batch_sizes.items())
+            return {
+                'requests': requests,
+                'batches': batches,
+                'mean_batch_size': requests / batches if batches else 0.0,
+                'max_batch_size': max(self._batch_sizes, default=0),
+                'histogram': dict(sorted(self._batch_sizes.items())),
+            }
+
+    def _ensure_worker(self):
+        """Start the batching thread on first use."""
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name='prediction-coalescer', daemon=True
+                    )
+                    self._worker.start()
+
+    def _run(self):
+        """Collect requests for one window at a time and score them."""
+        while True:
+            pending = [self._queue.get()]
+            if self._queue.empty():
+                self._score(pending)
+                continue
+            deadline = time.monotonic() + self.window
+            while len(pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._score(pending)
+
+    def _score(self, pending):
+        """Run one batched prediction and resolve every caller's future."""
+        rows, futures = zip(*pending)
+        try:
+            result = self.predictor.predict(np.vstack(rows))
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        with self._stats_lock:
+            self._batch_sizes[len(futures)] += 1
+        for i, future in enumerate(futures):
+            future.set_result(PredictionResult(
+                result.predictions[i:i + 1],
+                result.probabilities[i:i + 1],
+                result.confidence[i:i + 1],
+            ))
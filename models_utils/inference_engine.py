@@ -0,0 +1,249 @@
+"""
+Batch inference engine for FamilyAIDoc.
+Scores many patients at once without depending on Streamlit, so the same
+models can be used from scripts, scheduled jobs and the web pages.
+"""
+
+import os
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from config.settings import (
+    INFERENCE_BACKEND,
+    MODEL_PATHS,
+    PREDICTION_CACHE_MAX_BATCH,
+    PREDICTION_CACHE_SIZE,
+    PREDICTION_CACHE_TTL,
+)
+from models_utils.bundle import bundle_id, load_model_bundle
+from models_utils.compiled_trees import CompiledForest, is_compilable
+from models_utils.prediction_cache import CachedPredictor
+from models_utils.predictor import FusedPredictor
+from utils.feature_schema import SCHEMAS
+from utils.instrumentation import timer
+from utils.ttl_cache import TTLCache
+from utils.prediction_helper import resolve_ckd_mask
+
+
+DISEASES = ('kidney', 'liver', 'parkinsons')
+
+FEATURE_COUNTS = {disease: len(schema) for disease, schema in SCHEMAS.items()}
+
+class InferenceEngine:
+    """
+    Load the disease models once and score batches of patients.
+
+    Input can be a pandas DataFrame (or a dict / list of dicts) of raw
+    patient values keyed like ``models_utils.sample_data``, or a NumPy matrix
+    that is already encoded in the model's feature order.
+    """
+
+    def __init__(self, model_paths=None, bundle_loader=None, backend=None,
+                 cache_size=PREDICTION_CACHE_SIZE):
+        """
+        Args:
+            model_paths (dict): Per-disease artifact paths, defaults to
+                ``config.settings.MODEL_PATHS``
+            bundle_loader (callable): Function returning the model bundle for
+                a disease, defaults to ``load_model_bundle``
+            backend (str): 'sklearn', 'compiled' or 'onnx', defaults to
+                ``config.settings.INFERENCE_BACKEND``
+            cache_size (int): Per-disease prediction cache entries, 0 disables
+        """
+        self.model_paths = model_paths or MODEL_PATHS
+        self.backend = backend or INFERENCE_BACKEND
+        self._bundle_loader = bundle_loader or (
+            lambda disease: load_model_bundle(disease, self.model_paths)
+        )
+        self._models = {}
+        self._caches = {}
+        self._cache_size = cache_size
+        # One lock per disease, so cold loads run in parallel and a loaded
+        # disease never waits behind another one's load
+        self._load_locks = {}
+        self._lock = threading.Lock()
+
+    def _load_lock(self, disease):
+        with self._lock:
+            return self._load_locks.setdefault(disease, threading.Lock())
+
+    def load(self, disease):
+        """
+        Load (once) the model bundle for a disease.
+
+        Args:
+            disease (str): One of ``DISEASES``
+
+        Returns:
+            dict: Bundle with ``model``, ``scaler``, ``features``,
+            ``class_mapping``, ``thresholds`` and ``metrics``, plus the
+            ``serving_model`` chosen for the configured backend and the
+            ``predictor`` wrapping it with the scaler (and the prediction
+            cache); kidney also gets its precomputed ``ckd_mask``
+        """
+        if disease not in self.model_paths:
+            raise ValueError(f"Unknown disease '{disease}', expected one of {DISEASES}")
+
+        models = self._models.get(disease)
+        if models is not None:
+            return models
+
+        with self._load_lock(disease):
+            if disease not in self._models:
+                with timer('model_load', disease=disease):
+                    bundle = self._bundle_loader(disease)
+                if bundle is None or bundle.get('model') is None or bundle.get('scaler') is None:
+                    raise RuntimeError(f"Model files for '{disease}' could not be loaded")
+                features = bundle.get('features')
+                if features is not None and not SCHEMAS[disease].matches(features):
+                    raise RuntimeError(f"Feature order of the '{disease}' model does not match its schema")
+                models = dict(bundle)
+                models['serving_model'] = self._serving_model(models)
+                models['predictor'] = self._build_predictor(disease, models)
+                if disease == 'kidney':
+                    models['ckd_mask'] = resolve_ckd_mask(models['model'], models.get('class_mapping'))
+                self._models[disease] = models
+            return self._models[disease]
+
+    def is_loaded(self, disease):
+        """True if the disease's bundle has already been loaded."""
+        return disease in self._models
+
+    def encode(self, disease, data):
+        """
+        Turn raw patient data into the encoded feature matrix for a disease.
+
+        Args:
+            disease (str): One of ``DISEASES``
+            data: DataFrame, dict, list of dicts or 2-D array-like
+
+        Returns:
+            numpy.ndarray: Float matrix of shape (n_patients, n_features)
+        """
+        if isinstance(data, (dict, pd.DataFrame)) or (
+                isinstance(data, list) and data and isinstance(data[0], dict)):
+            with timer('encode', disease=disease):
+                return SCHEMAS[disease].build_matrix(data)
+
+        features = np.asarray(data, dtype=float)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if features.ndim != 2 or features.shape[1] != FEATURE_COUNTS[disease]:
+            raise ValueError(
+                f"Expected {FEATURE_COUNTS[disease]} {disease} features per row, "
+                f"got array of shape {features.shape}"
+            )
+        return features
+
+    def predict(self, disease, data):
+        """
+        Encode, scale and score a batch of patients for one disease.
+
+        Args:
+            disease (str): One of ``DISEASES``
+            data: DataFrame, dict, list of dicts or 2-D array-like
+
+        Returns:
+            PredictionResult: Vectorized predictions for every patient
+        """
+        predictor = self.load(disease)['predictor']
+        return predictor.predict(self.encode(disease, data))
+
+    def score_chunks(self, disease, chunks):
+        """
+        Score an iterable of DataFrame chunks, one predict_proba call each.
+
+        Intended for ``pd.read_csv(..., chunksize=...)`` readers so large
+        exports are never held in memory all at once. Rows with missing or
+        non-numeric features are not scored (see ``scored_chunk``).
+
+        Args:
+            disease (str): One of ``DISEASES``
+            chunks (iterable): DataFrames of raw patient rows
+
+        Yields:
+            pandas.DataFrame: Each chunk with ``prediction``, ``confidence``
+            and ``issues`` columns appended
+        """
+        predictor = self.load(disease)['predictor']
+        for chunk in chunks:
+            features = self.encode(disease, chunk)
+            valid = scorable_rows(disease, features)
+            result = predictor.predict(features[valid]) if valid.any() else None
+            yield scored_chunk(disease, chunk, features, valid, result)
+
+    def cache_stats(self):
+        """
+        Prediction cache hit/miss counters of the loaded diseases.
+
+        Returns:
+            dict: Disease -> ``TTLCache.stats()``
+        """
+        return {disease: cache.stats() for disease, cache in self._caches.items()}
+
+    def _build_predictor(self, disease, models):
+        """Fused scaler + model (or ONNX) predictor, behind the cache when enabled."""
+        predictor = self._onnx_predictor(disease, models) if self.backend == 'onnx' else None
+        if predictor is None:
+            predictor = FusedPredictor(models['serving_model'], models['scaler'], disease=disease)
+        if self._cache_size <= 0:
+            return predictor
+
+        cache = TTLCache(maxsize=self._cache_size, ttl=PREDICTION_CACHE_TTL)
+        self._caches[disease] = cache
+        return CachedPredictor(predictor, cache, bundle_id(models),
+                               max_batch=PREDICTION_CACHE_MAX_BATCH)
+
+    def _onnx_predictor(self, disease, models):
+        """onnxruntime predictor for the exported graph, or None to fall back."""
+        path = self.model_paths[disease].get('onnx')
+        if not path or not os.path.exists(path):
+            warnings.warn(f"No ONNX model for '{disease}', using the sklearn backend")
+            return None
+        try:
+            from models_utils.onnx_backend import OnnxPredictor
+            return OnnxPredictor(path, classes=getattr(models['model'], 'classes_', None),
+                                 disease=disease)
+        except ImportError:
+            warnings.warn("onnxruntime is not installed, using the sklearn backend")
+            return None
+
+    def _serving_model(self, models):
+        """Pick the object whose predict_proba serves this bundle."""
+        if self.backend == 'compiled' and is_compilable(models['model']):
+            if models.get('compiled') is not None:
+                return CompiledForest.from_arrays(models['compiled'])
+            return CompiledForest.from_sklearn(models['model'])
+        return models['model']
+
+
+def scorable_rows(disease, features):
+    """Rows of an encoded matrix whose values are all present and within bounds."""
+    return ~SCHEMAS[disease].out_of_bounds(features).any(axis=1)
+
+
+def scored_chunk(disease, chunk, features, valid, result):
+    """
+    Append the scores of the ``valid`` rows to a raw chunk.
+
+    Args:
+        disease (str): One of ``DISEASES``
+        chunk (pandas.DataFrame): Raw rows as read from the CSV
+        features (numpy.ndarray): ``chunk`` encoded
+        valid (numpy.ndarray): Boolean mask of the rows that were scored
+        result (PredictionResult): Scores of the valid rows, or None
+
+    Returns:
+        pandas.DataFrame: ``chunk`` with ``prediction`` and ``confidence``
+        (blank for rows that were not scored) and ``issues`` columns
+    """
+    prediction = pd.array([pd.NA] * len(chunk), dtype='Int64')
+    confidence = np.full(len(chunk), np.nan)
+    if result is not None:
+        prediction[valid] = result.predictions
+        confidence[valid] = result.confidence
+    return chunk.assign(prediction=prediction, confidence=confidence,
+                        issues=SCHEMAS[disease].row_issues(features))
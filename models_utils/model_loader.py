@@ -5,7 +5,12 @@ Handles loading of trained models and scalers from disk.
 
 import streamlit as st
 import joblib
-from config.settings import MODEL_PATHS
+from config.settings import COALESCE_MAX_BATCH, COALESCE_WINDOW_MS, INFERENCE_WORKERS, MODEL_PATHS
+from models_utils.bundle import load_model_bundle
+from models_utils.coalescer import RequestCoalescer
+from models_utils.inference_engine import InferenceEngine
+from models_utils.prediction_cache import CachedPredictor
+from models_utils.process_pool import InferenceWorkerPool
 
 
 @st.cache_resource
@@ -26,23 +31,125 @@ def load_model(model_path):
         return None
 
 
+@st.cache_resource
+def load_bundle(disease):
+    """
+    Load a disease's model bundle once per process.
+    
+    The bundle is memory-mapped, so its arrays are backed by the OS page
+    cache and shared by every Streamlit worker on the host.
+    
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        
+    Returns:
+        dict: Model bundle or None if loading fails
+    """
+    try:
+        return load_model_bundle(disease)
+    except Exception as e:
+        st.warning(f"Error loading {disease} model bundle: {str(e)}")
+        return None
+
+
+@st.cache_resource
+def get_inference_engine():
+    """Batch inference engine sharing the cached model bundles."""
+    return InferenceEngine(bundle_loader=load_bundle)
+
+
+@st.cache_resource
+def get_worker_pool():
+    """
+    Out-of-process inference workers shared by all sessions. Each worker
+    loads every model when it starts.
+    
+    Returns:
+        InferenceWorkerPool: Worker pool, or None when ``INFERENCE_WORKERS``
+        is 0 and predictions run on the script thread
+    """
+    if INFERENCE_WORKERS <= 0:
+        return None
+    return InferenceWorkerPool(max_workers=INFERENCE_WORKERS, diseases=tuple(MODEL_PATHS))
+
+
+def _base_predictor(disease):
+    """The disease's predictor, running in the worker pool when enabled."""
+    pool = get_worker_pool()
+    if pool is not None:
+        return pool.predictor(disease)
+    return get_inference_engine().load(disease)['predictor']
+
+
+@st.cache_resource
+def get_request_coalescer(disease):
+    """
+    Shared micro-batching wrapper around a disease's predictor.
+    
+    Every Streamlit session gets the same coalescer, so single-patient
+    predictions made at the same moment are scored in one batch.
+    
+    Args:
+        disease (str): 'kidney', 'liver' or 'parkinsons'
+        
+    Returns:
+        RequestCoalescer: Coalescing predictor
+    """
+    predictor = _base_predictor(disease)
+    if isinstance(predictor, CachedPredictor):
+        # Batch only the model calls; the cache sits in front (_serving_predictor)
+        predictor = predictor.predictor
+    return RequestCoalescer(predictor, window_ms=COALESCE_WINDOW_MS, max_batch=COALESCE_MAX_BATCH)
+
+
+def _serving_predictor(disease):
+    """
+    The predictor handed to the pages, coalesced unless disabled. Cache
+    hits are answered before the coalescer, so only misses wait for a batch.
+    """
+    predictor = _base_predictor(disease)
+    if COALESCE_WINDOW_MS <= 0:
+        return predictor
+    coalescer = get_request_coalescer(disease)
+    if isinstance(predictor, CachedPredictor):
+        return CachedPredictor(coalescer, predictor.cache, predictor.version,
+                               max_batch=predictor.max_batch)
+    return coalescer
+
+
+def _load_disease_models(disease):
+    """
+    Fetch a disease's loaded models, or None. With the worker pool only the
+    metadata comes back from a worker; the bundle is not loaded here.
+    """
+    pool = get_worker_pool()
+    try:
+        if pool is not None:
+            return pool.model_info(disease)
+        return get_inference_engine().load(disease)
+    except RuntimeError:
+        return None
+
+
 def load_kidney_models():
-    """Load kidney disease models and scaler."""
-    model = load_model(MODEL_PATHS['kidney']['model'])
-    scaler = load_model(MODEL_PATHS['kidney']['scaler'])
-    return model, scaler
+    """Load the kidney disease predictor and CKD class mask."""
+    models = _load_disease_models('kidney')
+    if models is None:
+        return None, None
+    return _serving_predictor('kidney'), models['ckd_mask']
 
 
 def load_liver_models():
-    """Load liver disease models and scaler."""
-    model = load_model(MODEL_PATHS['liver']['model'])
-    scaler = load_model(MODEL_PATHS['liver']['scaler'])
-    return model, scaler
+    """Load the liver disease predictor."""
+    models = _load_disease_models('liver')
+    if models is None:
+        return None
+    return _serving_predictor('liver')
 
 
 def load_parkinsons_models():
-    """Load Parkinson's disease models and scaler."""
-    model = load_model(MODEL_PATHS['parkinsons']['model'])
-    scaler = load_model(MODEL_PATHS['parkinsons']['scaler'])
-    features_list = load_model(MODEL_PATHS['parkinsons']['features'])
-    return model, scaler, features_list
+    """Load the Parkinson's disease predictor and its feature list."""
+    models = _load_disease_models('parkinsons')
+    if models is None:
+        return None, None
+    return _serving_predictor('parkinsons'), models['features']
@@ -0,0 +1,156 @@
+"""
+ONNX export and onnxruntime inference for FamilyAIDoc.
+The fitted scaler and model are exported together as one ONNX graph, so
+serving a prediction is a single onnxruntime call on the encoded features.
+onnxruntime runs the tree ensembles in native code with the GIL released,
+which lets concurrent Streamlit sessions score in parallel.
+
+skl2onnx / onnxmltools (export) and onnxruntime (serving) are optional
+dependencies and are only imported when used.
+"""
+
+import numpy as np
+
+from config.settings import ONNX_INTRA_OP_THREADS
+from models_utils.predictor import FusedPredictor, PredictionResult
+from utils.instrumentation import timer
+
+
+# ai.onnx.ml opset supported by skl2onnx and onnxmltools for tree ensembles
+ONNX_ML_OPSET = 3
+ONNX_OPSET = 15
+
+
+# ONNX operator for each in-place scaler step of ``FusedPredictor``
+SCALER_OPS = {
+    np.multiply: 'Mul',
+    np.add: 'Add',
+    np.subtract: 'Sub',
+    np.divide: 'Div',
+}
+
+
+def export_onnx(model, scaler, n_features, path):
+    """
+    Export a fitted scaler + classifier as one ONNX graph.
+
+    The graph takes the float64 encoded features as ``features``, applies
+    the scaler's arithmetic in double precision (the same steps as
+    ``FusedPredictor``), casts to float32 like scikit-learn / XGBoost do
+    before walking their trees, and returns ``label`` and ``probabilities``
+    (a plain tensor, no ZipMap).
+
+    Args:
+        model: Fitted scikit-learn forest or XGBoost classifier
+        scaler: Fitted MinMaxScaler or StandardScaler applied before the model
+        n_features (int): Number of encoded input features
+        path (str): Destination .onnx file
+
+    Returns:
+        str: ``path``
+    """
+    from onnx import TensorProto, helper, numpy_helper
+    from skl2onnx import convert_sklearn, update_registered_converter
+    from skl2onnx.common.data_types import FloatTensorType
+    from skl2onnx.common.shape_calculator import calculate_linear_classifier_output_shapes
+
+    scale_ops = FusedPredictor._compile_scaler(scaler)
+    if scale_ops is None:
+        raise TypeError(f"Cannot export {type(scaler).__name__}, expected MinMaxScaler or StandardScaler")
+
+    if type(model).__name__ == 'XGBClassifier':
+        from onnxmltools.convert.xgboost.operator_converters.XGBoost import convert_xgboost
+        from xgboost import XGBClassifier
+        update_registered_converter(
+            XGBClassifier, 'XGBoostXGBClassifier',
+            calculate_linear_classifier_output_shapes, convert_xgboost,
+            options={'nocl': [True, False], 'zipmap': [True, False, 'columns']},
+        )
+
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('scaled', FloatTensorType([None, n_features]))],
+        options={id(model): {'zipmap': False}},
+        target_opset={'': ONNX_OPSET, 'ai.onnx.ml': ONNX_ML_OPSET},
+    )
+    graph = onnx_model.graph
+
+    # Prepend the scaler: features (double) -> scaler steps -> Cast -> scaled
+    nodes = []
+    current = 'features'
+    for i, (ufunc, operand) in enumerate(scale_ops):
+        constant = f'scaler_operand_{i}'
+        graph.initializer.append(numpy_helper.from_array(np.asarray(operand, dtype=np.float64), constant))
+        nodes.append(helper.make_node(SCALER_OPS[ufunc], [current, constant], [f'scaler_step_{i}']))
+        current = f'scaler_step_{i}'
+    nodes.append(helper.make_node('Cast', [current], ['scaled'], to=TensorProto.FLOAT))
+
+    model_nodes = list(graph.node)
+    del graph.node[:]
+    graph.node.extend(nodes + model_nodes)
+    del graph.input[:]
+    graph.input.append(helper.make_tensor_value_info('features', TensorProto.DOUBLE, [None, n_features]))
+
+    with open(path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    return path
+
+
+class OnnxPredictor:
+    """
+    Score encoded features with an exported scaler + model ONNX graph.
+
+    Drop-in replacement for ``FusedPredictor``: takes unscaled encoded
+    features and returns a ``PredictionResult``.
+    """
+
+    def __init__(self, path, classes=None, intra_op_threads=ONNX_INTRA_OP_THREADS, disease=None):
+        """
+        Args:
+            path (str): ONNX file written by ``export_onnx``
+            classes (array-like): Class labels in probability column order,
+                defaults to the column indices
+            intra_op_threads (int): onnxruntime threads per call; keep small
+                so concurrent sessions don't oversubscribe the CPU
+            disease (str): Label for the latency metrics
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            path, sess_options=options, providers=['CPUExecutionProvider']
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.n_features_in_ = self.session.get_inputs()[0].shape[1]
+        self.classes_ = np.asarray(classes if classes is not None else [])
+        self.disease = disease
+
+    def predict_proba(self, features):
+        """Class probabilities for encoded (unscaled) features."""
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        with timer('predict_proba', disease=self.disease):
+            _, probabilities = self.session.run(None, {self.input_name: features})
+        return probabilities.astype(np.float64)
+
+    def predict(self, features):
+        """
+        Predict classes and confidence for encoded (unscaled) features.
+
+        Args:
+            features (array-like): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            PredictionResult: Predicted classes, class probabilities and the
+            confidence (0-100) of each predicted class
+        """
+        probabilities = self.predict_proba(features)
+
+        indices = probabilities.argmax(axis=1)
+        predictions = self.classes_.take(indices) if self.classes_.size else indices
+        confidence = probabilities[np.arange(len(indices)), indices] * 100
+
+        return PredictionResult(predictions, probabilities, confidence)
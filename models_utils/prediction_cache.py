@@ -0,0 +1,92 @@
+"""
+Prediction result cache for FamilyAIDoc.
+Remembers recent single-patient predictions keyed by a hash of the encoded
+feature vector and the model bundle version, so re-running the same panel
+(or a sample button) skips scaling and model inference entirely.
+"""
+
+import hashlib
+
+import numpy as np
+
+from models_utils.predictor import PredictionResult
+
+
+def feature_key(row, version):
+    """
+    Cache key for one encoded feature vector.
+
+    Args:
+        row (numpy.ndarray): Encoded (unscaled) features of one patient
+        version (str): Identifies the model bundle that produced the result
+
+    Returns:
+        str: Hex digest of the normalized vector and version
+    """
+    # float64 and +0.0 so 1 vs 1.0 and -0.0 vs 0.0 hash the same
+    normalized = np.ascontiguousarray(row, dtype=np.float64) + 0.0
+    digest = hashlib.blake2b(normalized.tobytes(), digest_size=16)
+    digest.update(version.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class CachedPredictor:
+    """
+    Wrap a ``FusedPredictor`` with a ``TTLCache``.
+
+    Only small batches (interactive requests) go through the cache; bulk
+    scoring such as CSV uploads is passed straight to the predictor so it
+    neither pays for hashing nor flushes the interactive entries.
+    """
+
+    def __init__(self, predictor, cache, version, max_batch=32):
+        """
+        Args:
+            predictor: Object with ``predict(features) -> PredictionResult``
+            cache (TTLCache): Cache to read and fill
+            version (str): Model bundle version, part of every key
+            max_batch (int): Largest batch looked up in the cache
+        """
+        self.predictor = predictor
+        self.cache = cache
+        self.version = version
+        self.max_batch = max_batch
+
+    def __getattr__(self, name):
+        # Expose the wrapped predictor's attributes (model, scaler, classes_, ...)
+        if name == 'predictor':
+            raise AttributeError(name)
+        return getattr(self.predictor, name)
+
+    def predict(self, features):
+        """
+        Predict with cached results where available.
+
+        Args:
+            features (array-like): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            PredictionResult: Same as the wrapped predictor's result
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if features.shape[0] > self.max_batch:
+            return self.predictor.predict(features)
+
+        keys = [feature_key(row, self.version) for row in features]
+        rows = [self.cache.get(key) for key in keys]
+        missing = [i for i, row in enumerate(rows) if row is None]
+
+        if missing:
+            result = self.predictor.predict(features[missing])
+            for j, i in enumerate(missing):
+                rows[i] = (result.predictions[j], result.probabilities[j].copy(), result.confidence[j])
+                self.cache.put(keys[i], rows[i])
+
+        predictions, probabilities, confidence = zip(*rows)
+        return PredictionResult(np.array(predictions), np.vstack(probabilities), np.array(confidence))
+
+    def predict_proba(self, features):
+        """Class probabilities, served from the cache where possible."""
+        return self.predict(features).probabilities
@@ -0,0 +1,123 @@
+"""
+Fused scaler + model predictor for FamilyAIDoc.
+Applies the fitted scaler's affine arithmetic in place on a preallocated
+buffer and computes class probabilities once, deriving the predicted class
+from the argmax instead of calling ``transform``, ``predict`` and
+``predict_proba`` separately.
+"""
+
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from utils.instrumentation import timer
+
+
+PredictionResult = namedtuple('PredictionResult', ['predictions', 'probabilities', 'confidence'])
+
+# Rows allocated for a thread's first buffer; grown on demand
+INITIAL_BUFFER_ROWS = 64
+
+
+class FusedPredictor:
+    """
+    Score encoded feature matrices with one scaling pass and one
+    ``predict_proba`` call.
+
+    MinMaxScaler and StandardScaler are applied with the same in-place
+    operations scikit-learn uses, so results are identical to
+    ``model.predict_proba(scaler.transform(X))``. Any other scaler falls
+    back to its own ``transform``.
+    """
+
+    def __init__(self, model, scaler, disease=None):
+        """
+        Args:
+            model: Classifier exposing ``predict_proba`` (sklearn, XGBoost or
+                ``CompiledForest``)
+            scaler: Fitted scaler used at training time
+            disease (str): Label for the latency metrics
+        """
+        self.model = model
+        self.scaler = scaler
+        self.disease = disease
+        self.classes_ = np.asarray(getattr(model, 'classes_', []))
+        self.n_features_in_ = getattr(scaler, 'n_features_in_', None)
+        self._scale_ops = self._compile_scaler(scaler)
+        self._local = threading.local()
+
+    @staticmethod
+    def _compile_scaler(scaler):
+        """Translate a fitted scaler into in-place (ufunc, operand) steps."""
+        name = type(scaler).__name__
+        if name == 'MinMaxScaler' and not getattr(scaler, 'clip', False):
+            return [(np.multiply, scaler.scale_), (np.add, scaler.min_)]
+        if name == 'StandardScaler':
+            ops = []
+            if scaler.with_mean:
+                ops.append((np.subtract, scaler.mean_))
+            if scaler.with_std:
+                ops.append((np.divide, scaler.scale_))
+            return ops
+        return None
+
+    def _buffer(self, n_rows, n_features):
+        """This thread's scratch buffer, grown to at least ``n_rows`` rows."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None or buffer.shape[0] < n_rows or buffer.shape[1] != n_features:
+            buffer = np.empty((max(n_rows, INITIAL_BUFFER_ROWS), n_features), dtype=np.float64)
+            self._local.buffer = buffer
+        return buffer[:n_rows]
+
+    def scale(self, features):
+        """
+        Scale encoded features into this thread's buffer.
+
+        The returned array is overwritten by the next call on the same
+        thread; copy it if it has to outlive the prediction.
+
+        Args:
+            features (array-like): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            numpy.ndarray: Scaled features
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+
+        if self._scale_ops is None:
+            return self.scaler.transform(features)
+
+        scaled = self._buffer(*features.shape)
+        np.copyto(scaled, features)
+        for ufunc, operand in self._scale_ops:
+            ufunc(scaled, operand, out=scaled)
+        return scaled
+
+    def predict_proba(self, features):
+        """Class probabilities for encoded (unscaled) features."""
+        with timer('scale', disease=self.disease):
+            scaled = self.scale(features)
+        with timer('predict_proba', disease=self.disease):
+            return self.model.predict_proba(scaled)
+
+    def predict(self, features):
+        """
+        Predict classes and confidence for encoded (unscaled) features.
+
+        Args:
+            features (array-like): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            PredictionResult: Predicted classes, class probabilities and the
+            confidence (0-100) of each predicted class
+        """
+        probabilities = self.predict_proba(features)
+
+        indices = probabilities.argmax(axis=1)
+        predictions = self.classes_.take(indices) if self.classes_.size else indices
+        confidence = probabilities[np.arange(len(indices)), indices] * 100
+
+        return PredictionResult(predictions, probabilities, confidence)
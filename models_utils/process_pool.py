@@ -0,0 +1,283 @@
+"""
+Out-of-process inference workers for FamilyAIDoc.
+Streamlit runs each page script on a thread of one server process, so a
+long ``predict_proba`` (a large Parkinson's CSV, the 200-tree liver forest)
+holds the GIL and slows every other session. ``InferenceWorkerPool`` moves
+scoring into separate processes: the encoded feature matrix is written to
+a shared memory block that the worker maps directly, and only the (much
+smaller) predictions come back through the pipe.
+"""
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from models_utils.inference_engine import InferenceEngine, scorable_rows, scored_chunk
+
+
+# Engine of the current worker process, created by ``_init_worker``
+_worker_engine = None
+
+
+def _init_worker(backend, diseases):
+    """Load the models once per worker process."""
+    global _worker_engine
+    _worker_engine = InferenceEngine(backend=backend)
+    for disease in diseases:
+        try:
+            _worker_engine.load(disease)
+        except Exception:
+            # Raising here would break the whole pool; the load is retried,
+            # and its error reported, on the disease's first request
+            pass
+
+
+def _warm_worker(samples):
+    """Score one encoded sample per disease; returns the worker's pid."""
+    for disease, features in samples.items():
+        _worker_engine.load(disease)['predictor'].predict(features)
+    return os.getpid()
+
+
+def _model_info(disease):
+    """The loaded model's metadata the pages need besides the predictor."""
+    models = _worker_engine.load(disease)
+    return {'features': models.get('features'), 'ckd_mask': models.get('ckd_mask')}
+
+
+def _predict_shared(disease, shm_name, shape):
+    """
+    Score a feature matrix held in shared memory (runs in the worker).
+
+    Returns:
+        tuple: ``PredictionResult``, worker pid and the worker's cache stats
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    features = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    try:
+        # Predictions are freshly allocated, so nothing returned views the block
+        result = _worker_engine.load(disease)['predictor'].predict(features)
+        return result, os.getpid(), _worker_engine.cache_stats()
+    finally:
+        del features
+        shm.close()
+
+
+class InferenceWorkerPool:
+    """
+    A pool of worker processes, each holding its own ``InferenceEngine``.
+
+    Inputs are encoded in the calling process and handed over through
+    shared memory, so submitting a 100k-row matrix does not pickle it.
+    """
+
+    def __init__(self, max_workers=2, backend=None, diseases=(), mp_context='spawn'):
+        """
+        Args:
+            max_workers (int): Worker processes
+            backend (str): Inference backend of the workers' engines
+            diseases (tuple): Models each worker loads at start-up
+            mp_context (str): multiprocessing start method; 'spawn' avoids
+                forking the multi-threaded Streamlit server
+        """
+        self.max_workers = max_workers
+        # Worker pid -> cache stats reported with its latest prediction
+        self._worker_stats = {}
+        # Disease -> ``model_info()``, fetched from a worker once
+        self._info = {}
+        self._stats_lock = threading.Lock()
+        # Used only for encoding in this process, never loads a model for it
+        self._encoder = InferenceEngine(backend=backend, cache_size=0)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(backend, tuple(diseases)),
+        )
+
+    def submit(self, disease, features):
+        """
+        Queue an encoded feature matrix for scoring.
+
+        Args:
+            disease (str): 'kidney', 'liver' or 'parkinsons'
+            features (array-like): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            concurrent.futures.Future: Resolves to a ``PredictionResult``
+        """
+        features = np.ascontiguousarray(features, dtype=np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(features.nbytes, 1))
+        np.ndarray(features.shape, dtype=np.float64, buffer=shm.buf)[:] = features
+        try:
+            work = self._executor.submit(_predict_shared, disease, shm.name, features.shape)
+        except Exception:
+            _release(shm)
+            raise
+
+        future = Future()
+
+        def done(work):
+            _release(shm)
+            try:
+                result, pid, stats = work.result()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            with self._stats_lock:
+                self._worker_stats[pid] = stats
+            future.set_result(result)
+
+        work.add_done_callback(done)
+        return future
+
+    def predict(self, disease, data):
+        """
+        Encode and score patients in a worker process, waiting for the result.
+
+        Args:
+            disease (str): 'kidney', 'liver' or 'parkinsons'
+            data: DataFrame, dict, list of dicts or 2-D array-like
+
+        Returns:
+            PredictionResult: Vectorized predictions for every patient
+        """
+        return self.submit(disease, self._encoder.encode(disease, data)).result()
+
+    def score_chunks(self, disease, chunks):
+        """
+        Score DataFrame chunks in the workers, keeping every worker busy.
+
+        Same contract as ``InferenceEngine.score_chunks``: chunks are
+        yielded in input order with ``prediction``, ``confidence`` and
+        ``issues`` columns appended.
+
+        Args:
+            disease (str): 'kidney', 'liver' or 'parkinsons'
+            chunks (iterable): DataFrames of raw patient rows
+
+        Yields:
+            pandas.DataFrame: Scored chunks
+        """
+        in_flight = deque()
+        for chunk in chunks:
+            features = self._encoder.encode(disease, chunk)
+            valid = scorable_rows(disease, features)
+            future = self.submit(disease, features[valid]) if valid.any() else None
+            in_flight.append((disease, chunk, features, valid, future))
+            if len(in_flight) > self.max_workers:
+                yield _assign(*in_flight.popleft())
+        while in_flight:
+            yield _assign(*in_flight.popleft())
+
+    def warm_up(self, samples, rounds=3):
+        """
+        Send a dummy prediction to every worker, starting the ones not yet
+        running, so each has loaded and exercised its models.
+
+        The executor does not address workers directly, so one request per
+        worker is sent at a time until every worker has answered (new
+        workers are started for requests that find no idle one).
+
+        Args:
+            samples (dict): Disease -> raw patient dict
+            rounds (int): Rounds of requests before giving up
+
+        Returns:
+            int: Distinct workers that answered
+        """
+        encoded = {disease: self._encoder.encode(disease, sample) for disease, sample in samples.items()}
+        warmed = set()
+        for _ in range(rounds):
+            futures = [self._executor.submit(_warm_worker, encoded) for _ in range(self.max_workers)]
+            warmed.update(future.result() for future in futures)
+            if len(warmed) >= self.max_workers:
+                break
+        return len(warmed)
+
+    def model_info(self, disease):
+        """
+        Metadata of a disease's model as loaded in the workers, so the
+        calling process never loads the bundle itself.
+
+        Args:
+            disease (str): 'kidney', 'liver' or 'parkinsons'
+
+        Returns:
+            dict: ``features`` and (kidney) ``ckd_mask``
+
+        Raises:
+            RuntimeError: The worker could not load the model
+        """
+        if disease not in self._info:
+            self._info[disease] = self._executor.submit(_model_info, disease).result()
+        return self._info[disease]
+
+    def is_loaded(self, disease):
+        """True once ``model_info`` has been fetched for the disease."""
+        return disease in self._info
+
+    def cache_stats(self):
+        """
+        Prediction cache counters summed over the worker processes.
+
+        Each worker's cache is private, so its counters are the ones it
+        reported with its latest prediction.
+
+        Returns:
+            dict: Disease -> ``TTLCache.stats()``, for diseases a worker has scored
+        """
+        with self._stats_lock:
+            reports = list(self._worker_stats.values())
+        totals = {}
+        for report in reports:
+            for disease, stats in report.items():
+                total = totals.setdefault(disease, {'hits': 0, 'misses': 0, 'size': 0})
+                for name in total:
+                    total[name] += stats[name]
+        for total in totals.values():
+            lookups = total['hits'] + total['misses']
+            total['hit_rate'] = total['hits'] / lookups if lookups else 0.0
+        return totals
+
+    def predictor(self, disease):
+        """``predict(features)`` adapter for code written against a predictor."""
+        return PooledPredictor(self, disease)
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=wait)
+
+
+class PooledPredictor:
+    """Predictor interface (encoded features in, ``PredictionResult`` out) backed by the pool."""
+
+    def __init__(self, pool, disease):
+        self.pool = pool
+        self.disease = disease
+
+    def predict(self, features):
+        """Score encoded features in a worker process."""
+        return self.pool.submit(self.disease, features).result()
+
+    def predict_proba(self, features):
+        """Class probabilities computed in a worker process."""
+        return self.predict(features).probabilities
+
+
+def _assign(disease, chunk, features, valid, future):
+    return scored_chunk(disease, chunk, features, valid, future.result() if future else None)
+
+
+def _release(shm):
+    """Free a shared memory block once its prediction has finished."""
+    shm.close()
+    shm.unlink()
@@ -0,0 +1,164 @@
+"""
+Background model warm-up for FamilyAIDoc.
+Loads every model bundle in a thread pool when the server starts, runs a
+dummy prediction on each and publishes a readiness flag / health file so
+the first visitor of each page doesn't pay for unpickling the models.
+When the inference worker pool is enabled, every worker process is warmed
+instead, since those are the engines that serve the pages.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import MODEL_PATHS, WARMUP_HEALTH_FILE, WARMUP_WORKERS
+from models_utils.process_pool import InferenceWorkerPool
+from models_utils.sample_data import (
+    KIDNEY_HEALTHY_SAMPLE,
+    LIVER_HEALTHY_SAMPLE,
+    PARKINSONS_HEALTHY_SAMPLE,
+)
+from utils.files import atomic_write
+
+
+WARMUP_SAMPLES = {
+    'kidney': KIDNEY_HEALTHY_SAMPLE,
+    'liver': LIVER_HEALTHY_SAMPLE,
+    'parkinsons': PARKINSONS_HEALTHY_SAMPLE,
+}
+
+
+class WarmupState:
+    """Progress of a warm-up run, safe to read from any thread."""
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.done = threading.Event()
+        self.durations = {}
+        self.errors = {}
+
+    def is_ready(self):
+        """True once every model loaded and answered a dummy prediction."""
+        return self.ready.is_set()
+
+    def as_dict(self):
+        """Status summary written to the health file."""
+        return {
+            'ready': self.is_ready(),
+            'finished': self.done.is_set(),
+            'load_seconds': dict(self.durations),
+            'errors': dict(self.errors),
+        }
+
+
+_state = None
+_state_lock = threading.Lock()
+
+
+def get_warmup_state():
+    """Return the current process's warm-up state, or None if not started."""
+    return _state
+
+
+def is_ready():
+    """True once the warm-up of this process has completed successfully."""
+    return _state is not None and _state.is_ready()
+
+
+def start_warmup(engine_factory=None, diseases=None, health_file=WARMUP_HEALTH_FILE,
+                 max_workers=WARMUP_WORKERS):
+    """
+    Start warming up the models in a background thread, once per process.
+
+    Streamlit re-executes the app script on every interaction, so repeated
+    calls return the state of the run that is already in progress.
+
+    Args:
+        engine_factory (callable): Returns the ``InferenceEngine`` (or
+            ``InferenceWorkerPool``) to warm; defaults to the one serving
+            the Streamlit pages
+        diseases (list): Diseases to warm, defaults to all of ``MODEL_PATHS``
+        health_file (str): Path written once every model is ready
+        max_workers (int): Thread pool size for loading models
+
+    Returns:
+        WarmupState: Shared progress / readiness of the warm-up
+    """
+    global _state
+    with _state_lock:
+        if _state is None:
+            _state = WarmupState()
+            thread = threading.Thread(
+                target=_run_warmup,
+                args=(_state, engine_factory or _default_engine,
+                      list(diseases or MODEL_PATHS), health_file, max_workers),
+                name='model-warmup',
+                daemon=True,
+            )
+            thread.start()
+        return _state
+
+
+def _default_engine():
+    """Worker pool or engine serving the Streamlit pages (imported lazily)."""
+    from models_utils.model_loader import get_inference_engine, get_worker_pool
+    return get_worker_pool() or get_inference_engine()
+
+
+def _run_warmup(state, engine_factory, diseases, health_file, max_workers):
+    """Load and exercise every model, then publish readiness."""
+    if health_file and os.path.exists(health_file):
+        os.remove(health_file)
+
+    try:
+        engine = engine_factory()
+        if isinstance(engine, InferenceWorkerPool):
+            _warm_pool(state, engine, diseases)
+        else:
+            _warm_engine(state, engine, diseases, max_workers)
+    except Exception as e:
+        state.errors['engine'] = str(e)
+
+    if not state.errors:
+        state.ready.set()
+    state.done.set()
+
+    # Written atomically so pollers never see partial JSON
+    if health_file and state.is_ready():
+        try:
+            atomic_write(health_file, json.dumps(state.as_dict()))
+        except OSError as e:
+            state.errors['health_file'] = str(e)
+
+
+def _warm_engine(state, engine, diseases, max_workers):
+    """Warm every disease of an in-process engine in parallel."""
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='warmup') as executor:
+        futures = {disease: executor.submit(_warm_disease, engine, disease) for disease in diseases}
+        for disease, future in futures.items():
+            try:
+                state.durations[disease] = future.result()
+            except Exception as e:
+                state.errors[disease] = str(e)
+
+
+def _warm_pool(state, pool, diseases):
+    """Warm every worker process of the inference pool."""
+    start = time.perf_counter()
+    workers = pool.warm_up({disease: WARMUP_SAMPLES[disease] for disease in diseases})
+    for disease in diseases:
+        pool.model_info(disease)
+    state.durations['workers'] = round(time.perf_counter() - start, 3)
+    if workers < pool.max_workers:
+        state.errors['workers'] = f"only {workers} of {pool.max_workers} workers answered"
+
+
+def _warm_disease(engine, disease):
+    """Load one bundle and run a dummy prediction through it."""
+    start = time.perf_counter()
+    engine.load(disease)
+    engine.predict(disease, WARMUP_SAMPLES[disease])
+    return round(time.perf_counter() - start, 3)
+
@@ -0,0 +1,32 @@
+"""
+Server entry point for FamilyAIDoc.
+Starts the model warm-up as soon as the server process starts, then runs
+the Streamlit app in the same process, so ``WARMUP_HEALTH_FILE`` appears
+before any browser connects and a load balancer can wait for it.
+``streamlit run app_refactored.py`` still works but does not warm up.
+
+Usage:
+    python serve.py [streamlit run options, e.g. --server.port 8501]
+"""
+
+import os
+import sys
+
+from config.settings import WARMUP_ON_START
+from models_utils.warmup import start_warmup
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app_refactored.py')
+
+
+def main():
+    if WARMUP_ON_START:
+        start_warmup()
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ['streamlit', 'run', APP_SCRIPT, *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Shared harness for the check scripts in tools/.
+Importing it puts the project root on sys.path; ``Checks`` prints the
+banner, one ✓/✗ line per check and the final verdict, exiting non-zero if
+any check failed.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+class Checks:
+    """Named pass/fail results of one check script."""
+
+    def __init__(self, title):
+        """
+        Args:
+            title (str): What is checked, e.g. "Convex client"; used in the
+                banner and the verdict
+        """
+        self.title = title
+        self.results = []
+        print("="*72)
+        print(f" {title.upper()} CHECK")
+        print("="*72)
+
+    def __call__(self, name, ok, detail=""):
+        """Record and print one check; returns ``ok``."""
+        self.results.append(bool(ok))
+        print(f"   {'✓' if ok else '✗'} {name:<44} {detail}")
+        return ok
+
+    def finish(self):
+        """Print the verdict; exits non-zero if any check failed."""
+        print("="*72)
+        if not all(self.results):
+            sys.exit(f"❌ {self.title} checks failed")
+        print(f"✅ {self.title} checks passed")
@@ -0,0 +1,73 @@
+"""
+Confidence Gauge Benchmark
+Times ``create_confidence_gauge`` (cached template, patched per call)
+against building and validating the styled Plotly figure from scratch, both
+for figure construction alone and including the JSON serialization
+Streamlit performs in ``st.plotly_chart``. Checks that both produce the
+same figure for a range of confidences and exits non-zero on a mismatch.
+Run from the project root.
+
+Usage:
+    python tools/benchmark_gauge.py [--renders 500]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import plotly.io as pio
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from components.gauges import _build_gauge, create_confidence_gauge
+
+TITLE = "Prediction Confidence"
+
+
+def per_render_ms(func, renders):
+    """Mean milliseconds per call of ``func(confidence)``."""
+    start = time.perf_counter()
+    for i in range(renders):
+        func(50 + (i % 50))
+    return (time.perf_counter() - start) * 1000 / renders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--renders', type=int, default=500)
+    args = parser.parse_args()
+
+    mismatches = [
+        value for value in (0, 12.5, 50, 73.25, 99.9, 100)
+        if create_confidence_gauge(value, TITLE).to_plotly_json() != _build_gauge(value, TITLE).to_plotly_json()
+    ]
+
+    cases = {
+        'figure': (
+            lambda value: _build_gauge(value, TITLE),
+            lambda value: create_confidence_gauge(value, TITLE),
+        ),
+        'figure + JSON': (
+            lambda value: pio.to_json(_build_gauge(value, TITLE), validate=False),
+            lambda value: pio.to_json(create_confidence_gauge(value, TITLE), validate=False),
+        ),
+    }
+
+    print("="*60)
+    print(f" CONFIDENCE GAUGE RENDER COST ({args.renders} renders)")
+    print("="*60)
+    print(f" {'stage':<15} {'rebuilt ms':>12} {'cached ms':>12} {'speed-up':>10}")
+    for name, (rebuilt, cached) in cases.items():
+        rebuilt_ms = per_render_ms(rebuilt, args.renders)
+        cached_ms = per_render_ms(cached, args.renders)
+        print(f" {name:<15} {rebuilt_ms:>12.3f} {cached_ms:>12.3f} {rebuilt_ms / cached_ms:>9.1f}x")
+
+    print("="*60)
+    if mismatches:
+        sys.exit(f"❌ Cached gauge differs from the rebuilt one at {mismatches}")
+    print("✅ Cached gauge matches the rebuilt figure")
+
+
+if __name__ == '__main__':
+    main()
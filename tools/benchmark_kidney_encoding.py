@@ -0,0 +1,86 @@
+"""
+Kidney Categorical Encoding Benchmark
+Encodes the ten kidney categorical columns of a resampled lab export three
+ways - per-patient ``encode_kidney_features`` calls, pandas ``Series.map``
+per column, and the lookup-table ``encode_kidney_categoricals`` - checks
+that all three agree (including missing / unknown values) and reports the
+timings, also for columns already held as pandas ``category`` dtype.
+Exits non-zero on any mismatch. Run from the project root.
+
+Usage:
+    python tools/benchmark_kidney_encoding.py [--rows 1000000]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from patient_data import load_kidney_frame, resample
+from config.settings import KIDNEY_ENCODING, KIDNEY_ENCODING_DEFAULTS
+from utils.encoding import encode_kidney_categoricals, encode_kidney_features
+
+
+def encode_per_patient(df):
+    """Baseline: one ``encode_kidney_features`` call per row."""
+    columns = [df[col].tolist() for col in KIDNEY_ENCODING]
+    return np.array([encode_kidney_features(*row) for row in zip(*columns)], dtype=np.float64)
+
+
+def encode_with_map(df):
+    """pandas ``Series.map`` + ``fillna`` per column."""
+    return np.column_stack([
+        df[col].map(mapping).fillna(KIDNEY_ENCODING_DEFAULTS[col]).to_numpy(dtype=np.float64)
+        for col, mapping in KIDNEY_ENCODING.items()
+    ])
+
+
+def timed(func, df):
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = resample(load_kidney_frame(), args.rows)
+    # Exercise the default path with missing and unrecognised values
+    rng = np.random.default_rng(1)
+    for col in KIDNEY_ENCODING:
+        df.loc[rng.random(len(df)) < 0.01, col] = None
+        df.loc[rng.random(len(df)) < 0.01, col] = 'unknown'
+
+    print("="*60)
+    print(f" KIDNEY CATEGORICAL ENCODING ({args.rows:,} rows)")
+    print("="*60)
+
+    expected, baseline = timed(encode_per_patient, df)
+    failed = False
+    for name, func in (('encode_kidney_features', encode_per_patient),
+                       ('Series.map', encode_with_map),
+                       ('encode_kidney_categoricals', encode_kidney_categoricals)):
+        result, seconds = timed(func, df)
+        same = np.array_equal(result, expected)
+        failed |= not same
+        print(f"   {'✓' if same else '✗'} {name:<28} {seconds * 1000:>9.1f} ms"
+              f"  ({baseline / seconds:>6.1f}x)")
+
+    # Exports read with dtype='category' skip hashing the strings row by row
+    categorical = df.astype({col: 'category' for col in KIDNEY_ENCODING})
+    result, seconds = timed(encode_kidney_categoricals, categorical)
+    same = np.array_equal(result, expected)
+    failed |= not same
+    print(f"   {'✓' if same else '✗'} {'... on category dtype':<28} {seconds * 1000:>9.1f} ms"
+          f"  ({baseline / seconds:>6.1f}x)")
+
+    if failed:
+        print("   ✗ Encoders disagree")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
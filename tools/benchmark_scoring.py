@@ -0,0 +1,254 @@
+"""
+End-to-End Scoring Benchmark
+Times the full prediction path - schema encoding of raw patient rows, the
+serving predictor (scaler + model) and, for kidney, CKD resolution and the
+clinical override rules - for each disease at several batch sizes, using
+the bundled data/ CSVs resampled to size. Reports throughput, p50/p99 call
+latency and the peak RSS of the process that scored the disease.
+
+Each disease runs in its own fresh process with batch sizes in ascending
+order, so the peak RSS reported for a batch size is the high-water mark up
+to and including it. Batch size 1 is scored from a dict, as the prediction
+pages do; larger batches from DataFrame slices. The prediction cache is
+disabled unless ``--cache`` is given, so repeated rows are really scored.
+
+Results can be saved with ``--save`` and compared against an earlier run
+with ``--compare``; the script exits non-zero if a case fails, produces
+invalid probabilities, or regresses beyond ``--max-regression``. Run from
+the project root.
+
+Usage:
+    python tools/benchmark_scoring.py [--diseases kidney liver parkinsons]
+        [--batch-sizes 1 10 1000 100000] [--backend sklearn|compiled|onnx]
+        [--min-time 1.0] [--save results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+from patient_data import DATASET_LOADERS, resample
+from config.settings import INFERENCE_BACKEND, PREDICTION_CACHE_SIZE
+from models_utils.inference_engine import InferenceEngine
+from utils.prediction_helper import assess_kidney_risk_batch, get_kidney_ckd_status
+
+BATCH_SIZES = (1, 10, 1_000, 100_000)
+
+# Timed calls per case: at least MIN_REPEATS, then until --min-time elapses
+MIN_REPEATS = 3
+MAX_REPEATS = 1000
+
+# Allowed relative drop in throughput / rise in p99 before --compare fails
+MAX_REGRESSION = 0.25
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def make_batches(frame, batch_size, count):
+    """
+    Pre-built inputs so building them is not part of the timing.
+
+    Args:
+        frame (pandas.DataFrame): Resampled raw patient rows
+        batch_size (int): Rows per call
+        count (int): Number of distinct batches wanted
+
+    Returns:
+        list: dicts for batch size 1, DataFrame slices otherwise
+    """
+    if batch_size == 1:
+        return frame.iloc[:count].to_dict('records')
+    starts = range(0, max(len(frame) - batch_size, 0) + 1, batch_size)
+    return [frame.iloc[start:start + batch_size] for start in list(starts)[:count]]
+
+
+def score(engine, models, disease, batch):
+    """
+    One end-to-end scoring call, as the pages and the API perform it.
+
+    Returns:
+        tuple: (PredictionResult, detected mask for kidney or None)
+    """
+    features = engine.encode(disease, batch)
+    result = models['predictor'].predict(features)
+    detected = None
+    if disease == 'kidney':
+        detected = get_kidney_ckd_status(models['ckd_mask'], result.predictions)
+        detected = detected | assess_kidney_risk_batch(features).override
+    return result, detected
+
+
+def check_result(result, n_rows):
+    """Problem with a scoring result, or None if it looks valid."""
+    probabilities = result.probabilities
+    if probabilities.shape[0] != n_rows or len(result.predictions) != n_rows:
+        return f"expected {n_rows} rows, got {probabilities.shape[0]}"
+    if not np.isfinite(probabilities).all():
+        return "non-finite probabilities"
+    if not np.allclose(probabilities.sum(axis=1), 1.0, atol=1e-4):
+        return "probabilities do not sum to 1"
+    return None
+
+
+def run_case(engine, models, disease, batches, batch_size, min_time):
+    """
+    Time repeated scoring calls for one batch size.
+
+    Returns:
+        dict: Case results (latencies in ms, throughput in rows/s) or an
+        ``error`` entry
+    """
+    # Untimed first call: lazy buffers, thread pools, etc.
+    error = check_result(score(engine, models, disease, batches[0])[0], batch_size)
+    if error:
+        return {'batch_size': batch_size, 'error': error}
+
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < MAX_REPEATS and (
+            len(latencies) < MIN_REPEATS or time.perf_counter() - started < min_time):
+        batch = batches[len(latencies) % len(batches)]
+        start = time.perf_counter()
+        score(engine, models, disease, batch)
+        latencies.append(time.perf_counter() - start)
+
+    latencies = np.array(latencies)
+    return {
+        'batch_size': batch_size,
+        'repeats': len(latencies),
+        'throughput': batch_size * len(latencies) / latencies.sum(),
+        'p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'p99_ms': float(np.percentile(latencies, 99) * 1000),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def benchmark_disease(disease, batch_sizes, backend, cache, min_time):
+    """
+    Benchmark one disease at every batch size; runs in a worker process.
+
+    Returns:
+        dict: ``load_ms``, ``baseline_rss_mb`` and the ``cases`` list
+    """
+    # Unpickling warnings from newer sklearn / xgboost versions are noise here
+    warnings.filterwarnings('ignore')
+    engine = InferenceEngine(backend=backend, cache_size=PREDICTION_CACHE_SIZE if cache else 0)
+    start = time.perf_counter()
+    models = engine.load(disease)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    frame = resample(DATASET_LOADERS[disease](), max(batch_sizes))
+    baseline_rss = peak_rss_mb()
+
+    cases = []
+    for batch_size in sorted(batch_sizes):
+        count = MAX_REPEATS if batch_size == 1 else max(1, min(len(frame) // batch_size, 100))
+        batches = make_batches(frame.iloc[:batch_size * count], batch_size, count)
+        try:
+            cases.append(run_case(engine, models, disease, batches, batch_size, min_time))
+        except Exception as e:
+            cases.append({'batch_size': batch_size, 'error': f"{type(e).__name__}: {e}"})
+    return {'load_ms': load_ms, 'baseline_rss_mb': baseline_rss, 'cases': cases}
+
+
+def compare(results, baseline, max_regression):
+    """
+    Regressions of ``results`` against a saved ``baseline`` run.
+
+    Returns:
+        list: One message per regressed case
+    """
+    regressions = []
+    for disease, run in results['diseases'].items():
+        previous = {c['batch_size']: c for c in baseline.get('diseases', {}).get(disease, {}).get('cases', [])}
+        for case in run['cases']:
+            old = previous.get(case['batch_size'])
+            if not old or 'error' in case or 'error' in old:
+                continue
+            label = f"{disease} batch={case['batch_size']:,}"
+            if case['throughput'] < old['throughput'] * (1 - max_regression):
+                regressions.append(f"{label}: throughput {case['throughput']:,.0f} rows/s "
+                                   f"vs {old['throughput']:,.0f} baseline")
+            if case['p99_ms'] > old['p99_ms'] * (1 + max_regression):
+                regressions.append(f"{label}: p99 {case['p99_ms']:.2f} ms "
+                                   f"vs {old['p99_ms']:.2f} ms baseline")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--diseases', nargs='+', default=list(DATASET_LOADERS),
+                        choices=list(DATASET_LOADERS))
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=list(BATCH_SIZES))
+    parser.add_argument('--backend', default=INFERENCE_BACKEND, choices=('sklearn', 'compiled', 'onnx'))
+    parser.add_argument('--cache', action='store_true', help="keep the prediction cache enabled")
+    parser.add_argument('--min-time', type=float, default=1.0, help="seconds timed per case")
+    parser.add_argument('--save', help="write the results as JSON")
+    parser.add_argument('--compare', help="baseline JSON from an earlier --save")
+    parser.add_argument('--max-regression', type=float, default=MAX_REGRESSION)
+    args = parser.parse_args()
+
+    results = {
+        'backend': args.backend,
+        'cache': args.cache,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'diseases': {},
+    }
+
+    print("="*72)
+    print(f" END-TO-END SCORING BENCHMARK (backend={args.backend}, "
+          f"cache={'on' if args.cache else 'off'})")
+    print("="*72)
+
+    failures = []
+    for disease in args.diseases:
+        # A fresh process per disease keeps each peak RSS to its own models
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+            run = pool.submit(benchmark_disease, disease, args.batch_sizes, args.backend,
+                              args.cache, args.min_time).result()
+        results['diseases'][disease] = run
+
+        print(f"\n {disease.upper()}  (load {run['load_ms']:.0f} ms, "
+              f"RSS after load {run['baseline_rss_mb']:.0f} MB)")
+        print(f" {'batch':>9} {'calls':>6} {'rows/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'peak RSS':>10}")
+        for case in run['cases']:
+            if 'error' in case:
+                failures.append(f"{disease} batch={case['batch_size']:,}: {case['error']}")
+                print(f" {case['batch_size']:>9,}   ✗ {case['error']}")
+                continue
+            print(f" {case['batch_size']:>9,} {case['repeats']:>6} {case['throughput']:>12,.0f} "
+                  f"{case['p50_ms']:>10.3f} {case['p99_ms']:>10.3f} {case['peak_rss_mb']:>7.0f} MB")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n   Results saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            failures += compare(results, json.load(f), args.max_regression)
+
+    print("\n" + "="*72)
+    if failures:
+        for failure in failures:
+            print(f"   ✗ {failure}")
+        sys.exit("❌ Scoring benchmark failed")
+    print("✅ Scoring benchmark passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+Chat Pipeline Check
+Runs ``ChatPipeline`` against the local Convex stand-in and a minimal Groq
+stand-in (OpenAI-style ``/chat/completions``, streamed as server-sent
+events) and checks that retrieval and history summarization overlap, that
+each stage falls back when it misses its timeout (local snapshot, verbatim
+history, truncated reply), that slow Convex answers open the circuit
+breaker and it closes again on recovery, that Convex answers are cached
+across reworded queries and that the streamed reply arrives intact. Exits non-zero on any
+failed check. Run from the project root.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Short stage timeouts so the fallbacks are quick to reach
+os.environ.setdefault('FAMILYAIDOC_CHAT_RETRIEVAL_TIMEOUT', '0.6')
+os.environ.setdefault('FAMILYAIDOC_CHAT_SUMMARY_TIMEOUT', '0.6')
+os.environ.setdefault('FAMILYAIDOC_CHAT_LLM_TIMEOUT', '0.6')
+
+from _checks import Checks
+from convex_stub_server import StubConvexServer, load_diseases
+from config.settings import CHAT_HISTORY_KEEP, CHAT_RETRIEVAL_TIMEOUT
+from utils.chat_pipeline import TIMEOUT_NOTICE, ChatPipeline
+from utils.convex_client import search_cache
+from utils.symptom_index import SymptomIndex
+
+QUERY = "I have a headache, nausea and sensitivity to light"
+REWORDED = "nausea, sensitivity to light and a headache"
+REPLY = ["Most likely ", "**Migraine**", ". How long ", "has the headache lasted?"]
+SUMMARY = "Patient reports recurring headaches for two weeks."
+
+
+class GroqHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        server = self.server
+        if not body.get('stream'):
+            time.sleep(server.summary_delay)
+            server.summaries += 1
+            self._json({
+                'id': 'summary', 'object': 'chat.completion', 'created': 0, 'model': body['model'],
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': SUMMARY}}],
+            })
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        events = [json.dumps({'id': 'reply', 'object': 'chat.completion.chunk', 'created': 0,
+                              'model': body['model'],
+                              'choices': [{'index': 0, 'delta': {'content': text}, 'finish_reason': None}]})
+                  for text in REPLY] + ['[DONE]']
+        for n, event in enumerate(events):
+            if n == 2:
+                time.sleep(server.stall)
+            self.wfile.write(f"data: {event}\n\n".encode())
+            self.wfile.flush()
+
+    def _json(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StubGroqServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), GroqHandler)
+        self.summary_delay = 0.0
+        self.stall = 0.0
+        self.summaries = 0
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def handle_error(self, request, client_address):
+        # The pipeline hangs up on summaries and replies that miss their timeout
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def history(n):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"} for i in range(n)]
+
+
+def main():
+    convex = StubConvexServer().start()
+    groq = StubGroqServer().start()
+    os.environ['GROQ_BASE_URL'] = f"http://127.0.0.1:{groq.server_address[1]}"
+    pipeline = ChatPipeline("stub-key", convex.url)
+    breaker = pipeline.convex.breaker
+    breaker.reset_timeout = 0.5
+    index = SymptomIndex(load_diseases())
+    check = Checks("Chat pipeline")
+
+    def prepare(query, messages, summary=None):
+        start = time.perf_counter()
+        turn = pipeline.prepare(query, messages, "initial", index=index, version=index.version,
+                                summary=summary)
+        return turn, time.perf_counter() - start
+
+    messages = history(CHAT_HISTORY_KEEP + 5) + [{"role": "user", "content": QUERY}]
+    convex.delay = groq.summary_delay = 0.3
+    turn, seconds = prepare(QUERY, messages)
+    check("retrieval and summary overlap", seconds < 0.55 and groq.summaries == 1,
+          f"{seconds * 1000:.0f} ms for two 300 ms stages")
+    system = turn.messages[0]['content']
+    check("prompt has stage and matches",
+          "CURRENT TRIAGE STAGE:\ninitial" in system and f"**{turn.matches[0]['name']}**" in system,
+          f"top match: {turn.matches[0]['name']}")
+    check("older messages replaced by the summary",
+          SUMMARY in turn.messages[1]['content'] and len(turn.messages) == 2 + CHAT_HISTORY_KEEP,
+          f"{len(messages)} messages -> {len(turn.messages) - 1}")
+
+    requests_before = convex.requests
+    next_turn, _ = prepare(REWORDED, messages + history(2), turn.summary)
+    check("summary reused, reworded query cached",
+          groq.summaries == 1 and convex.requests == requests_before,
+          f"hit rate {search_cache.stats()['hit_rate']:.0%}")
+
+    convex.delay = 2 * CHAT_RETRIEVAL_TIMEOUT
+    groq.summary_delay = 2.0
+    turn, seconds = prepare("joint pain and rash", messages)
+    check("slow Convex falls back to the snapshot",
+          turn.notice is not None and turn.notice[0] == 'caption' and seconds < CHAT_RETRIEVAL_TIMEOUT + 0.3,
+          f"{seconds * 1000:.0f} ms")
+    check("slow summary keeps the history verbatim",
+          turn.summary is None and len(turn.messages) == 1 + len(messages))
+
+    for n in range(breaker.threshold - 1):
+        prepare(f"slow lookup {n} with fever", messages[-1:])
+    check("slow lookups open the circuit breaker", breaker.state == 'open',
+          f"state={breaker.state} after {breaker.threshold} slow turns")
+    requests_before = convex.requests
+    turn, seconds = prepare("cough and fever", messages[-1:])
+    check("open circuit uses the snapshot at once",
+          convex.requests == requests_before and turn.notice is not None and seconds < 0.05,
+          f"{seconds * 1000:.1f} ms")
+
+    convex.delay = 0.0
+    time.sleep(breaker.reset_timeout)
+    turn, _ = prepare("cough and sore throat", messages[-1:])
+    check("recovered Convex closes the circuit", breaker.state == 'closed' and turn.notice is None,
+          f"state={breaker.state}")
+
+    reply = "".join(pipeline.stream_reply(turn.messages))
+    check("streamed reply arrives intact", reply == "".join(REPLY), repr(reply[:32]))
+
+    groq.stall = 2.0
+    start = time.perf_counter()
+    reply = "".join(pipeline.stream_reply(turn.messages))
+    seconds = time.perf_counter() - start
+    check("stalled stream ends with the notice",
+          reply == "".join(REPLY[:2]) + TIMEOUT_NOTICE and seconds < 1.0, f"{seconds * 1000:.0f} ms")
+
+    pipeline.close()
+    convex.stop()
+    groq.shutdown()
+
+    check.finish()
+
+
+if __name__ == '__main__':
+    main()
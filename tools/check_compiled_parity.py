@@ -0,0 +1,48 @@
+"""
+Compiled Forest Parity Check
+Compares CompiledForest against scikit-learn predict_proba for the kidney
+ExtraTrees and liver RandomForest models on the bundled data/ CSVs, plus
+random rows around the scaled feature range to reach rarely used branches.
+Exits non-zero on any mismatch. Run from the project root.
+"""
+
+import sys
+
+import numpy as np
+
+from patient_data import DATASET_LOADERS
+from models_utils.compiled_trees import CompiledForest
+from models_utils.inference_engine import InferenceEngine
+
+# Largest allowed absolute difference in class probabilities
+TOLERANCE = 1e-9
+
+print("="*60)
+print(" COMPILED FOREST PARITY CHECK")
+print("="*60)
+
+engine = InferenceEngine(backend='sklearn')
+failed = False
+
+for disease in ('kidney', 'liver'):
+    models = engine.load(disease)
+    model = models['model']
+    compiled = CompiledForest.from_sklearn(model)
+
+    X_data = models['scaler'].transform(engine.encode(disease, DATASET_LOADERS[disease]()))
+    X_random = np.random.default_rng(0).uniform(-3, 3, size=(10000, X_data.shape[1]))
+
+    for name, X in (('dataset', X_data), ('random', X_random)):
+        expected = model.predict_proba(X)
+        actual = compiled.predict_proba(X)
+        max_diff = np.abs(expected - actual).max()
+        same_class = (expected.argmax(axis=1) == actual.argmax(axis=1)).all()
+        ok = max_diff <= TOLERANCE and same_class
+        failed |= not ok
+        print(f"   {'✓' if ok else '✗'} {disease:<7} {name:<8} rows={len(X):<6} "
+              f"trees={compiled.n_trees:<4} max |Δp|={max_diff:.2e}")
+
+print("="*60)
+if failed:
+    sys.exit("❌ Compiled forest does not match scikit-learn")
+print("✅ Compiled forests match scikit-learn")
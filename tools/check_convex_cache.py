@@ -0,0 +1,83 @@
+"""
+Convex Search Cache Check
+Runs ``CachedConvexClient`` against the local stand-in server and checks
+that rephrasings of the same symptoms (word order, case, punctuation, stop
+words) share one cache entry, different symptoms do not, a new disease
+snapshot version misses, failed lookups are not cached, and the hit-rate
+counters add up. Exits non-zero on any failed check. Run from the project
+root.
+"""
+
+import asyncio
+import time
+
+from _checks import Checks
+from convex_stub_server import StubConvexServer
+from utils.ttl_cache import TTLCache
+from utils.convex_client import CachedConvexClient, ConvexClient, ConvexUnavailable, query_key
+
+REPHRASINGS = [
+    "I have a headache, nausea and sensitivity to light",
+    "nausea and headache, sensitivity to light",
+    "HEADACHE - Nausea - light sensitivity",
+    "i'm feeling a headache with nausea and some sensitivity to the light",
+]
+
+
+async def run_checks():
+    server = StubConvexServer().start()
+    cache = TTLCache(maxsize=64, ttl=60)
+    client = CachedConvexClient(ConvexClient(server.url, timeout=(0.5, 0.5), retries=0), cache)
+    check = Checks("Convex cache")
+
+    keys = {query_key(text)[0] for text in REPHRASINGS}
+    check("rephrasings normalize to one key", len(keys) == 1, repr(next(iter(keys))))
+
+    requests_before = server.requests
+    start = time.perf_counter()
+    first = await client.search_diseases(REPHRASINGS[0], version='v1')
+    miss_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    results = [await client.search_diseases(text, version='v1') for text in REPHRASINGS[1:]]
+    hit_ms = (time.perf_counter() - start) * 1000 / len(results)
+    check("rephrasings answered from one request", server.requests - requests_before == 1,
+          f"requests={server.requests - requests_before}")
+    check("cached answer matches Convex", all(r == first for r in results),
+          f"miss {miss_ms:.2f} ms · hit {hit_ms:.3f} ms")
+
+    requests_before = server.requests
+    await client.search_diseases("chest pain and shortness of breath", version='v1')
+    check("different symptoms miss", server.requests - requests_before == 1)
+
+    requests_before = server.requests
+    await client.search_diseases(REPHRASINGS[0], version='v2')
+    check("new snapshot version misses", server.requests - requests_before == 1)
+
+    server.fail_next = 1
+    try:
+        await client.search_diseases("joint pain and rash", version='v2')
+        failed = False
+    except ConvexUnavailable:
+        failed = True
+    requests_before = server.requests
+    retried = await client.search_diseases("joint pain and rash", version='v2')
+    check("failed lookups are not cached", failed and server.requests - requests_before == 1,
+          f"then {len(retried)} matches")
+
+    stats = cache.stats()
+    check("hit-rate counters add up",
+          stats['hits'] == len(REPHRASINGS) - 1 and stats['misses'] == 5 and stats['size'] == 4,
+          f"{stats['hits']} hits · {stats['misses']} misses · {stats['hit_rate']:.0%}")
+
+    await client.aclose()
+    server.stop()
+
+    return check
+
+
+def main():
+    asyncio.run(run_checks()).finish()
+
+
+if __name__ == '__main__':
+    main()
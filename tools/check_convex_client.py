@@ -0,0 +1,112 @@
+"""
+Convex Client Resilience Check
+Runs ``ConvexClient`` against the local stand-in server and checks that
+connections are reused, transient 5xx answers are retried, client errors
+are not, a slow deployment opens the circuit breaker (after which lookups
+fail fast without touching the network), and the circuit closes again once
+the deployment recovers, also when a trial lookup is cancelled, and that
+other httpx errors (a body that cannot be decoded) surface as
+``ConvexUnavailable``. Exits non-zero on any failed check. Run from the
+project root.
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from _checks import Checks
+from convex_stub_server import StubConvexServer
+from utils.convex_client import CircuitBreaker, ConvexClient, ConvexUnavailable
+
+QUERY = "I have a headache, nausea and sensitivity to light"
+
+
+async def lookup(client):
+    """(matches or None, seconds taken)."""
+    start = time.perf_counter()
+    try:
+        return await client.search_diseases(QUERY), time.perf_counter() - start
+    except ConvexUnavailable:
+        return None, time.perf_counter() - start
+
+
+async def run_checks():
+    server = StubConvexServer().start()
+    breaker = CircuitBreaker(threshold=2, reset_timeout=0.5)
+    client = ConvexClient(server.url, timeout=(0.5, 0.3), retries=2, deadline=1.0, breaker=breaker)
+    check = Checks("Convex client")
+
+    results = [(await lookup(client))[0] for _ in range(20)]
+    check("20 lookups succeed", all(results),
+          f"top match: {results[0][0]['name'] if results[0] else None}")
+    check("keep-alive: one TCP connection", server.connections == 1, f"connections={server.connections}")
+
+    requests_before = server.requests
+    server.fail_next = 2
+    matches, _ = await lookup(client)
+    check("two 503s are retried", matches is not None,
+          f"requests={server.requests - requests_before}")
+
+    server.fail_next, server.fail_status = 1, 400
+    requests_before = server.requests
+    matches, _ = await lookup(client)
+    check("400 is not retried", matches is None and server.requests - requests_before == 1,
+          f"requests={server.requests - requests_before}")
+    server.fail_status = 503
+
+    breaker.record_success()
+    server.delay = 0.5
+    slow = [await lookup(client) for _ in range(breaker.threshold)]
+    slowest = max(seconds for _, seconds in slow)
+    check("slow lookups stop at the deadline", all(m is None for m, _ in slow) and slowest < 1.2,
+          f"slowest={slowest:.2f}s")
+    check("circuit opens after repeated failures", breaker.state == 'open', f"state={breaker.state}")
+
+    requests_before = server.requests
+    matches, seconds = await lookup(client)
+    check("open circuit fails fast without a request",
+          matches is None and server.requests == requests_before and seconds < 0.01,
+          f"{seconds * 1000:.2f} ms")
+
+    await asyncio.sleep(breaker.reset_timeout)
+    trial = asyncio.create_task(lookup(client))
+    await asyncio.sleep(0.1)
+    trial.cancel()
+    await asyncio.gather(trial, return_exceptions=True)
+    check("cancelled trial re-opens the circuit", breaker.state == 'open', f"state={breaker.state}")
+
+    server.delay = 0.0
+    await asyncio.sleep(breaker.reset_timeout)
+    matches, _ = await lookup(client)
+    check("half-open trial closes the circuit", matches is not None and breaker.state == 'closed',
+          f"state={breaker.state}")
+
+    await client.aclose()
+    server.stop()
+
+    def undecodable(request):
+        raise httpx.DecodingError("malformed gzip body", request=request)
+
+    mocked = ConvexClient("http://convex.invalid", retries=0)
+    await mocked.http.aclose()
+    mocked.http = httpx.AsyncClient(transport=httpx.MockTransport(undecodable))
+    try:
+        matches, _ = await lookup(mocked)
+        escaped = None
+    except httpx.HTTPError as e:
+        matches, escaped = None, e
+    check("other httpx errors become ConvexUnavailable",
+          escaped is None and matches is None and mocked.breaker.failures == 1,
+          f"escaped={escaped!r}" if escaped else "DecodingError wrapped")
+    await mocked.aclose()
+
+    return check
+
+
+def main():
+    asyncio.run(run_checks()).finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Feature Bounds Check
+Runs every bundled training dataset through its ``FeatureSchema`` and
+checks that ``validation_errors()`` reports nothing: the bounds must accept
+every patient the models were trained on. Exits non-zero on any failed
+check. Run from the project root.
+"""
+
+from _checks import Checks
+from patient_data import DATASET_LOADERS
+from utils.feature_schema import SCHEMAS
+
+
+def main():
+    check = Checks("Feature bounds")
+    for disease, load in DATASET_LOADERS.items():
+        schema = SCHEMAS[disease]
+        features = schema.build_matrix(load())
+        errors = schema.validation_errors(features)
+        check(f"{disease} training data within bounds", not errors,
+              "; ".join(errors) or f"{len(features)} rows")
+
+        # The bounds must still reject impossible values
+        features[0, 0] = -1.0
+        errors = schema.validation_errors(features)
+        check(f"{disease} negative {schema.names[0]} rejected", bool(errors), "; ".join(errors))
+
+    check.finish()
+
+
+if __name__ == '__main__':
+    main()
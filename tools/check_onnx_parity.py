@@ -0,0 +1,87 @@
+"""
+ONNX Parity Check
+Exports each disease's pickled scaler + model to ONNX (in a temporary
+directory) and compares onnxruntime against the pickled models on the
+bundled data/ CSVs plus random rows spread over the valid input range.
+Tree leaf values are summed in float32 by onnxruntime, so probabilities
+must agree within TOLERANCE and the predicted class on at least
+MIN_AGREEMENT of rows. Exits non-zero on failure. Requires skl2onnx, onnxmltools and
+onnxruntime. Run from the project root.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from patient_data import DATASET_LOADERS, resample
+from models_utils.inference_engine import InferenceEngine
+from models_utils.onnx_backend import OnnxPredictor, export_onnx
+from utils.feature_schema import SCHEMAS
+
+# Largest allowed absolute difference in class probabilities
+TOLERANCE = 1e-5
+
+# Share of rows that must get the same predicted class
+MIN_AGREEMENT = 0.999
+
+RANDOM_ROWS = 10000
+
+
+def random_rows(engine, disease, n_rows):
+    """Encoded rows drawn from the dataset with numeric values jittered."""
+    features = engine.encode(disease, resample(DATASET_LOADERS[disease](), n_rows))
+    rng = np.random.default_rng(0)
+    numeric = np.array([f.dtype == 'float' for f in SCHEMAS[disease].features])
+    features[:, numeric] *= rng.uniform(0.8, 1.2, size=(n_rows, numeric.sum()))
+    return features
+
+
+def time_single_row(predictor, row, repeats=200):
+    """Median latency of one-row predictions in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predictor.predict(row)
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+print("="*60)
+print(" ONNX PARITY CHECK")
+print("="*60)
+
+engine = InferenceEngine(backend='sklearn', cache_size=0)
+failed = False
+
+with tempfile.TemporaryDirectory() as tmp:
+    for disease in SCHEMAS:
+        models = engine.load(disease)
+        reference = models['predictor']
+        path = export_onnx(models['model'], models['scaler'], len(SCHEMAS[disease]),
+                           os.path.join(tmp, f'{disease}.onnx'))
+        onnx_predictor = OnnxPredictor(path, classes=models['model'].classes_)
+
+        X_data = engine.encode(disease, DATASET_LOADERS[disease]())
+        X_random = random_rows(engine, disease, RANDOM_ROWS)
+
+        for name, X in (('dataset', X_data), ('random', X_random)):
+            expected = reference.predict(X)
+            actual = onnx_predictor.predict(X)
+            max_diff = np.abs(expected.probabilities - actual.probabilities).max()
+            agreement = (expected.predictions == actual.predictions).mean()
+            ok = max_diff <= TOLERANCE and agreement >= MIN_AGREEMENT
+            failed |= not ok
+            print(f"   {'✓' if ok else '✗'} {disease:<10} {name:<8} {len(X):>6} rows  "
+                  f"max |Δp| = {max_diff:.2e}  class agreement = {agreement:.4%}")
+
+        row = X_data[:1]
+        print(f"     single-row latency: sklearn {time_single_row(reference, row):.3f} ms, "
+              f"onnxruntime {time_single_row(onnx_predictor, row):.3f} ms")
+
+if failed:
+    print("\n❌ ONNX predictions differ from the pickled models")
+    sys.exit(1)
+print("\n✅ ONNX models match the pickled models")
@@ -0,0 +1,102 @@
+"""
+Local Symptom Index Check
+Exports the disease table from the local Convex stand-in, builds the
+in-process ``SymptomIndex`` from the snapshot and checks that it returns
+the same matches and overlap scores as the stand-in's ``searchDiseases``
+for a set of symptom descriptions. Then times lookups on a synthetic snapshot of ``--diseases``
+documents and fails if the p99 exceeds ``--budget-ms``. Exits non-zero on
+any failed check. Run from the project root.
+
+Usage:
+    python tools/check_symptom_index.py [--diseases 5000] [--budget-ms 1.0]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from _checks import PROJECT_ROOT, Checks
+from convex_stub_server import StubConvexServer, search_diseases
+from utils.symptom_index import SymptomIndex, load_symptom_index
+
+QUERIES = [
+    "I have a runny nose, sneezing and a sore throat",
+    "high fever with body aches and chills since yesterday",
+    "terrible headache, nausea and sensitivity to light",
+    "diarrhea and vomiting with stomach cramps",
+    "burning urination and cloudy urine",
+    "itchy eyes and nasal congestion every spring",
+    "my knee hurts when I walk",
+]
+
+
+def synthetic_diseases(n, seed=0):
+    """``n`` disease documents drawing 3-8 symptoms from a shared vocabulary."""
+    rng = np.random.default_rng(seed)
+    words = [f"sym{i}" for i in range(400)]
+    vocabulary = [f"{a} {b}" for a, b in zip(words, rng.permutation(words))] + words
+    return [{
+        '_id': f"synthetic_{i}",
+        'name': f"Condition {i}",
+        'symptoms': list(rng.choice(vocabulary, size=rng.integers(3, 9), replace=False)),
+    } for i in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--diseases', type=int, default=5000)
+    parser.add_argument('--budget-ms', type=float, default=1.0)
+    args = parser.parse_args()
+    check = Checks("Symptom index")
+
+    server = StubConvexServer().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = Path(tmp) / 'diseases_snapshot.json'
+        export = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / 'tools' / 'export_disease_snapshot.py'),
+             '--url', server.url, '--output', str(snapshot)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        check("snapshot exported from the stand-in", export.returncode == 0,
+              export.stdout.strip() or export.stderr.strip()[-200:])
+        index = load_symptom_index(str(snapshot)) if export.returncode == 0 else None
+    server.stop()
+    if index is None:
+        sys.exit("❌ No snapshot to index")
+
+    for query in QUERIES:
+        expected = [(d['name'], d['score']) for d in search_diseases(server.diseases, query)]
+        actual = [(d['name'], d['score']) for d in index.search(query)]
+        # Ties keep the candidates' relevance order, which differs between
+        # the stand-in (document order) and BM25
+        ok = sorted(actual) == sorted(expected) and actual == sorted(actual, key=lambda m: -m[1])
+        check(f"matches Convex: {query[:28]}...", ok,
+              ', '.join(f"{name} ({score})" for name, score in actual) or "no matches")
+
+    diseases = synthetic_diseases(args.diseases)
+    start = time.perf_counter()
+    large = SymptomIndex(diseases)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    rng = np.random.default_rng(1)
+    queries = [' and '.join(rng.choice(diseases[i]['symptoms'], size=2)) + ' for two days'
+               for i in rng.integers(0, len(diseases), 2000)]
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        large.search(query)
+        latencies.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    check(f"lookup p99 within {args.budget_ms:g} ms ({args.diseases:,} diseases)", p99 <= args.budget_ms,
+          f"p50={p50:.3f} ms p99={p99:.3f} ms build={build_ms:.0f} ms")
+
+    check.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+Local Stand-In for the Convex Disease Search
+Serves ``GET /health``, ``GET /api/diseases`` and ``POST /api/search_diseases``
+like the Convex HTTP actions in convex/http.ts, answering from a JSON list
+of disease documents with the same ranking as ``diseases.searchDiseases``
+(full-text candidates, then symptom-overlap score). Latency and failures can be
+injected to exercise the chatbot's retry and circuit-breaker handling.
+Point the app at it with ``CONVEX_URL=http://127.0.0.1:8787``.
+
+Usage:
+    python tools/convex_stub_server.py [--port 8787] [--delay 0.0]
+        [--fail-rate 0.0] [--snapshot tools/fixtures/diseases_sample.json]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SAMPLE_DISEASES = Path(__file__).resolve().parent / 'fixtures' / 'diseases_sample.json'
+
+
+def load_diseases(path=SAMPLE_DISEASES):
+    """Disease documents from a JSON list (or a snapshot with a ``diseases`` key)."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    diseases = data['diseases'] if isinstance(data, dict) else data
+    for disease in diseases:
+        disease.setdefault('symptomsText', ' '.join(disease['symptoms']))
+    return diseases
+
+
+def search_diseases(diseases, query):
+    """Python rendering of ``searchDiseases`` in convex/diseases.ts."""
+    terms = set(re.findall(r'\w+', query.lower()))
+    candidates = [d for d in diseases if terms & set(re.findall(r'\w+', d['symptomsText'].lower()))][:10]
+    q = query.lower()
+    scored = [dict(d, score=sum(s.lower() in q for s in d['symptoms'])) for d in candidates]
+    return sorted((d for d in scored if d['score'] > 0), key=lambda d: -d['score'])[:5]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open, like the real deployment
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type='application/json'):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, 'OK', 'text/plain')
+        elif self.path == '/api/diseases':
+            self._send(200, json.dumps(self.server.diseases))
+        else:
+            self._send(404, json.dumps({'error': 'Not found'}))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            fail = server.fail_next > 0 or random.random() < server.fail_rate
+            server.fail_next = max(server.fail_next - 1, 0)
+
+        if self.path != '/api/search_diseases':
+            self._send(404, json.dumps({'error': 'Not found'}))
+            return
+        if server.delay:
+            time.sleep(server.delay)
+        if fail:
+            self._send(server.fail_status, json.dumps({'error': 'Injected failure'}))
+            return
+        try:
+            query = json.loads(body)['query']
+        except (ValueError, KeyError, TypeError):
+            self._send(400, json.dumps({'error': 'Invalid JSON'}))
+            return
+        self._send(200, json.dumps(search_diseases(server.diseases, query)))
+
+
+class StubConvexServer(ThreadingHTTPServer):
+    """
+    Threaded stand-in server; behaviour can be changed while it runs.
+
+    Attributes:
+        delay (float): Seconds added before every search response
+        fail_rate (float): Probability (0-1) of answering with ``fail_status``
+        fail_next (int): Number of upcoming searches forced to fail
+        fail_status (int): HTTP status of injected failures
+        connections (int): TCP connections accepted so far
+        requests (int): Search requests received so far
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, diseases=None, delay=0.0, fail_rate=0.0,
+                 fail_status=503, verbose=False):
+        super().__init__(('127.0.0.1', port), StubHandler)
+        self.diseases = diseases if diseases is not None else load_diseases()
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.fail_next = 0
+        self.fail_status = fail_status
+        self.verbose = verbose
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve on a daemon thread; returns self."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def handle_error(self, request, client_address):
+        # Clients that timed out on an injected delay have hung up already
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds added to every search")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="fraction of searches answered with 503")
+    parser.add_argument('--snapshot', default=str(SAMPLE_DISEASES), help="JSON list of disease documents")
+    args = parser.parse_args()
+
+    server = StubConvexServer(args.port, load_diseases(args.snapshot), args.delay,
+                              args.fail_rate, verbose=True)
+    print(f"Convex stand-in serving {len(server.diseases)} diseases on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
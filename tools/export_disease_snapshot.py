@@ -0,0 +1,75 @@
+"""
+Export the Convex Disease Table for the Local Symptom Index
+Downloads every document of the ``diseases`` table from the Convex HTTP
+route ``GET /api/diseases`` (or reads ``diseases/documents.jsonl`` from a
+``npx convex export`` archive) and writes the versioned snapshot that
+utils/symptom_index.py searches when Convex is unavailable. Run from the
+project root.
+
+Usage:
+    python tools/export_disease_snapshot.py [--url $CONVEX_URL]
+        [--from-jsonl documents.jsonl] [--output data/diseases/diseases_snapshot.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+from patient_data import PROJECT_ROOT
+from config.settings import DISEASE_SNAPSHOT_PATH
+from utils.symptom_index import SymptomIndex, snapshot_version
+
+# Convex system fields other than the id are not part of the disease data
+SYSTEM_FIELDS = ('_creationTime',)
+
+
+def fetch_diseases(url):
+    import httpx
+
+    response = httpx.get(f"{url.rstrip('/')}/api/diseases", timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--url', default=os.getenv('CONVEX_URL'), help="Convex HTTP actions URL")
+    source.add_argument('--from-jsonl', help="diseases/documents.jsonl from `npx convex export`")
+    parser.add_argument('--output', default=str(PROJECT_ROOT / DISEASE_SNAPSHOT_PATH))
+    args = parser.parse_args()
+
+    if args.from_jsonl:
+        diseases = read_jsonl(args.from_jsonl)
+    elif args.url:
+        diseases = fetch_diseases(args.url)
+    else:
+        sys.exit("Set CONVEX_URL or pass --url / --from-jsonl")
+
+    diseases = sorted(
+        ({key: value for key, value in d.items() if key not in SYSTEM_FIELDS} for d in diseases),
+        key=lambda d: d.get('_id', d['name'])
+    )
+    version = snapshot_version(diseases)
+    index = SymptomIndex(diseases, version)
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': version,
+            'exported_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'diseases': diseases,
+        }, f, ensure_ascii=False, indent=1)
+
+    print(f"✅ {len(index)} diseases (version {version}) written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Bundled dataset loaders shared by the tools and benchmark scripts.
+Returns the CSVs under data/ as raw patient frames in the input format
+``InferenceEngine`` expects.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from config.settings import KIDNEY_ENCODING, KIDNEY_FEATURES, LIVER_FEATURES
+
+DATA_DIR = PROJECT_ROOT / 'data'
+
+
+def load_kidney_frame():
+    """kidney_disease.csv with stray whitespace/'?' cleaned and numeric gaps filled."""
+    df = pd.read_csv(DATA_DIR / 'kidney_disease' / 'kidney_disease.csv')
+    df = df.loc[:, KIDNEY_FEATURES]
+    for col in KIDNEY_FEATURES:
+        if col in KIDNEY_ENCODING:
+            df[col] = df[col].astype(str).str.strip()
+        else:
+            df[col] = pd.to_numeric(df[col].astype(str).str.strip(), errors='coerce')
+            df[col] = df[col].fillna(df[col].median())
+    return df
+
+
+def load_liver_frame():
+    """indian_liver_patient.csv renamed to the app's liver feature names."""
+    df = pd.read_csv(DATA_DIR / 'liver_disease' / 'indian_liver_patient.csv')
+    df = df.iloc[:, :len(LIVER_FEATURES)]
+    df.columns = LIVER_FEATURES
+    return df.fillna(df.median(numeric_only=True))
+
+
+def load_parkinsons_frame():
+    """parkinsons.data voice features under their original column names."""
+    df = pd.read_csv(DATA_DIR / 'parkinsons_disease' / 'parkinsons.data')
+    return df.drop(columns=['name', 'status'])
+
+
+DATASET_LOADERS = {
+    'kidney': load_kidney_frame,
+    'liver': load_liver_frame,
+    'parkinsons': load_parkinsons_frame,
+}
+
+
+def resample(df, n_rows, seed=0):
+    """Resample a frame (with replacement) to exactly ``n_rows`` rows."""
+    rng = np.random.default_rng(seed)
+    return df.iloc[rng.integers(0, len(df), n_rows)].reset_index(drop=True)
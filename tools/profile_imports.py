@@ -0,0 +1,99 @@
+"""
+Import-Time Profile for the Streamlit Entry Point
+Runs ``python -X importtime`` on app_refactored.py (which renders the Home
+page when imported outside ``streamlit run``), summarises the slowest
+imports and fails if the cold start exceeds its budget or pulls in a
+dependency that only a non-default page needs (beyond what a bare
+``import streamlit`` already loads). Run from the project root.
+
+Usage:
+    python tools/profile_imports.py [--budget-ms 1500] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time allowed for the entry point
+STARTUP_BUDGET_MS = 1500
+
+# Packages only the prediction / chatbot pages should import. Those that
+# ``import streamlit`` loads itself (plotly in recent releases) are skipped.
+DEFERRED_PACKAGES = ('plotly', 'reportlab', 'groq', 'dotenv', 'sklearn', 'xgboost', 'joblib')
+
+
+def profile_imports(module):
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        list: (cumulative_us, self_us, package) per imported package
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, package = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), int(self_us), package.rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='app_refactored')
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    rows = profile_imports(args.module)
+    baseline = {r[2].strip().split('.')[0] for r in profile_imports('streamlit')}
+
+    # Top-level packages have no leading indentation in the package column
+    top_level = [r for r in rows if not r[2].startswith('  ')]
+    total_ms = sum(r[0] for r in top_level) / 1000
+    loaded = {r[2].strip().split('.')[0] for r in rows}
+    deferred_loaded = sorted(p for p in DEFERRED_PACKAGES if p in loaded and p not in baseline)
+
+    print("="*60)
+    print(f" IMPORT-TIME PROFILE: {args.module}")
+    print("="*60)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  package")
+    for cumulative_us, self_us, package in sorted(top_level, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {package.strip()}")
+    print("-"*60)
+    print(f"   Total: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"   Modules imported: {len(rows)}")
+    inherited = sorted(p for p in DEFERRED_PACKAGES if p in baseline)
+    if inherited:
+        print(f"   Loaded by streamlit itself: {', '.join(inherited)}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"startup import time {total_ms:.1f} ms exceeds {args.budget_ms:.0f} ms")
+    if deferred_loaded:
+        failures.append(f"deferred packages imported at startup: {', '.join(deferred_loaded)}")
+
+    if failures:
+        for failure in failures:
+            print(f"   ✗ {failure}")
+        sys.exit(1)
+    print("   ✓ Within startup budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""
+Build Model Bundles
+Packs the existing per-artifact pickles into one bundle file per disease
+without retraining. Run from the project root.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the project packages importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config.settings import MODEL_PATHS
+from models_utils.bundle import load_legacy_bundle, save_model_bundle
+
+print("="*60)
+print(" BUILDING MODEL BUNDLES")
+print("="*60)
+
+for disease, paths in MODEL_PATHS.items():
+    bundle = load_legacy_bundle(disease, paths)
+    save_model_bundle(bundle, paths['bundle'])
+    print(f"   ✓ {disease}: {paths['bundle']}")
+
+print("\n✅ Bundles built!")
+print("="*60)
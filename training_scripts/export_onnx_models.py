@@ -0,0 +1,27 @@
+"""
+Export ONNX Models
+Converts the existing scaler + model pickles of every disease into the
+ONNX graphs served by the 'onnx' inference backend, without retraining.
+Requires skl2onnx and onnxmltools. Run from the project root.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the project packages importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config.settings import MODEL_PATHS
+from models_utils.bundle import load_model_bundle
+from models_utils.onnx_backend import export_onnx
+
+print("="*60)
+print(" EXPORTING ONNX MODELS")
+print("="*60)
+
+for disease, paths in MODEL_PATHS.items():
+    bundle = load_model_bundle(disease)
+    export_onnx(bundle['model'], bundle['scaler'], bundle['scaler'].n_features_in_, paths['onnx'])
+    print(f"   ✓ {disease}: {paths['onnx']}")
+
+print("\n✅ ONNX models exported!")
+print("="*60)
@@ -16,9 +16,17 @@ from sklearn.naive_bayes import GaussianNB
 from xgboost import XGBClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix
 import joblib
+import sys
 import warnings
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+# Make the project packages importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config.settings import KIDNEY_THRESHOLDS
+from models_utils.bundle import build_model_bundle, save_model_bundle
+from models_utils.onnx_backend import export_onnx
+
 print("="*60)
 print(" KIDNEY DISEASE PREDICTION - MODEL TRAINING")
 print("="*60)
@@ -178,5 +186,32 @@ joblib.dump(target_le, 'models/kidney/kidney_extratrees_target_encoder.pkl')
 print("   ✓ Metadata saved: models/kidney/kidney_extratrees_metadata.pkl")
 print("   ✓ Target encoder saved: models/kidney/kidney_extratrees_target_encoder.pkl")
 
+# Save single-file model bundle served by the app
+best_metrics = next(r for r in results if r['Model'] == best_model_name)
+bundle = build_model_bundle(
+    'kidney',
+    model=best_model,
+    scaler=scaler,
+    features=X.columns.tolist(),
+    class_mapping=target_le.classes_.tolist(),
+    thresholds=KIDNEY_THRESHOLDS,
+    metrics={
+        'accuracy': float(best_metrics['Accuracy']),
+        'precision': float(best_metrics['Precision']),
+        'recall': float(best_metrics['Recall']),
+        'f1': float(best_metrics['F1-Score']),
+    }
+)
+save_model_bundle(bundle, 'models/kidney/kidney_extratrees_bundle.joblib')
+print("   ✓ Model bundle saved: models/kidney/kidney_extratrees_bundle.joblib")
+
+# Export scaler + model as one ONNX graph for the onnxruntime backend
+try:
+    export_onnx(best_model, scaler, X.shape[1], 'models/kidney/kidney_extratrees.onnx')
+    print("   ✓ ONNX model saved: models/kidney/kidney_extratrees.onnx")
+except Exception as e:
+    # skl2onnx / onnxmltools are optional; the app falls back to the pickles
+    print(f"   ONNX export skipped: {e}")
+
 print("\n✅ Training complete!")
 print("="*60)
@@ -10,9 +10,16 @@ from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, classification_report
 import joblib
+import sys
 import warnings
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+# Make the project packages importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models_utils.bundle import build_model_bundle, save_model_bundle
+from models_utils.onnx_backend import export_onnx
+
 print("="*60)
 print(" LIVER DISEASE PREDICTION - MODEL TRAINING")
 print("="*60)
@@ -125,5 +132,30 @@ metadata = {
 joblib.dump(metadata, 'models/liver/liver_randomforest_metadata.pkl')
 print("   ✓ Metadata saved: models/liver/liver_randomforest_metadata.pkl")
 
+# Save single-file model bundle served by the app
+bundle = build_model_bundle(
+    'liver',
+    model=model,
+    scaler=scaler,
+    features=X.columns.tolist(),
+    class_mapping=['No Disease', 'Liver Disease'],
+    metrics={
+        'accuracy': float(accuracy),
+        'precision': float(precision),
+        'recall': float(recall),
+        'f1': float(f1),
+    }
+)
+save_model_bundle(bundle, 'models/liver/liver_randomforest_bundle.joblib')
+print("   ✓ Model bundle saved: models/liver/liver_randomforest_bundle.joblib")
+
+# Export scaler + model as one ONNX graph for the onnxruntime backend
+try:
+    export_onnx(model, scaler, X.shape[1], 'models/liver/liver_randomforest.onnx')
+    print("   ✓ ONNX model saved: models/liver/liver_randomforest.onnx")
+except Exception as e:
+    # skl2onnx / onnxmltools are optional; the app falls back to the pickles
+    print(f"   ONNX export skipped: {e}")
+
 print("\n✅ Training complete!")
 print("="*60)
@@ -10,9 +10,16 @@ from sklearn.preprocessing import MinMaxScaler
 from xgboost import XGBClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, classification_report
 import joblib
+import sys
 import warnings
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+# Make the project packages importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models_utils.bundle import build_model_bundle, save_model_bundle
+from models_utils.onnx_backend import export_onnx
+
 print("="*60)
 print(" PARKINSON'S DISEASE DETECTION - MODEL TRAINING")
 print("="*60)
@@ -115,5 +122,30 @@ metadata = {
 joblib.dump(metadata, 'models/parkinsons/parkinsons_xgboost_metadata.pkl')
 print("   Metadata saved: models/parkinsons/parkinsons_xgboost_metadata.pkl")
 
+# Save single-file model bundle served by the app
+bundle = build_model_bundle(
+    'parkinsons',
+    model=model,
+    scaler=scaler,
+    features=X.columns.tolist(),
+    class_mapping=['Healthy', "Parkinson's Disease"],
+    metrics={
+        'accuracy': float(accuracy),
+        'precision': float(precision),
+        'recall': float(recall),
+        'f1': float(f1),
+    }
+)
+save_model_bundle(bundle, 'models/parkinsons/parkinsons_xgboost_bundle.joblib')
+print("   Model bundle saved: models/parkinsons/parkinsons_xgboost_bundle.joblib")
+
+# Export scaler + model as one ONNX graph for the onnxruntime backend
+try:
+    export_onnx(model, scaler, X.shape[1], 'models/parkinsons/parkinsons_xgboost.onnx')
+    print("   ONNX model saved: models/parkinsons/parkinsons_xgboost.onnx")
+except Exception as e:
+    # skl2onnx / onnxmltools are optional; the app falls back to the pickles
+    print(f"   ONNX export skipped: {e}")
+
 print("\nTraining complete!")
 print("="*60)
@@ -0,0 +1,290 @@
+"""
+Chat turn pipeline for the medical chatbot.
+The slow parts of a turn run concurrently on one background asyncio loop:
+the Convex lookup (``ConvexClient``), the summary of older messages
+(``AsyncGroq``) and the system prompt, assembled up to the database matches
+while they are fetched. Each stage has its own timeout and a fallback, and
+the reply is handed back to the synchronous Streamlit script chunk by chunk
+as Groq streams it.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from groq import APIError, AsyncGroq
+
+from config.settings import (
+    CHAT_HISTORY_KEEP,
+    CHAT_LLM_TIMEOUT,
+    CHAT_MODEL,
+    CHAT_RETRIEVAL_TIMEOUT,
+    CHAT_SUMMARY_TIMEOUT,
+)
+from utils.convex_client import CachedConvexClient, ConvexClient, ConvexUnavailable
+from utils.instrumentation import metrics, timer
+
+# System prompt of the chat page, split before the database matches
+SYSTEM_PROMPT_HEAD = """
+You are an AI-powered Medical Triage Assistant.
+
+You have TWO knowledge sources:
+1. A VERIFIED MEDICAL DATABASE (provided below)
+2. Your general medical knowledge (secondary, supportive)
+
+DATABASE RULES:
+- The database is your PRIMARY source of truth.
+- Prefer database diseases over inferred ones.
+- Do NOT invent medicines or treatments.
+
+======== RESPONSE MODE RULES ========
+
+IF CURRENT TRIAGE STAGE IS "initial" OR "followup":
+
+- DO NOT give full disease descriptions.
+- DO NOT list medicines in detail.
+- DO NOT give long explanations.
+- ONLY do the following:
+  • List 2–3 MOST LIKELY diseases (names only)
+  • Give 1 short reason per disease (1 sentence max)
+  • Ask 2–3 targeted follow-up questions
+  • Explain briefly why each question matters
+
+IF CURRENT TRIAGE STAGE IS "final":
+
+- FIRST, list the TOP 2–3 MOST PROBABLE diseases in descending order of likelihood.
+- THEN select the MOST LIKELY diagnosis
+- Provide confidence level
+- Give medicines ONLY from database
+- Provide home care advice
+- ALWAYS include a medical disclaimer
+
+CURRENT TRIAGE STAGE:
+{triage_stage}
+
+DATABASE MATCHES:
+"""
+
+SUMMARY_PROMPT = (
+    "Summarize this medical triage conversation for the assistant that continues it. "
+    "Keep every symptom, its duration and severity, the answers to follow-up questions, "
+    "the diseases considered and the advice given. Plain sentences, at most 150 words."
+)
+
+# Extra seconds the retrieval stage waits past the Convex client's deadline
+RETRIEVAL_GRACE = 0.25
+
+# Older messages are summarized in batches rather than one per turn
+SUMMARY_BATCH = 4
+
+# Ends the reply when Groq stops sending chunks for CHAT_LLM_TIMEOUT seconds
+TIMEOUT_NOTICE = "\n\n_The assistant took too long to respond. Please try again._"
+
+# messages: for the completion; notice: (level, text) for the page or None;
+# summary: (messages summarized, text) to pass to the next turn, or None
+PreparedTurn = namedtuple('PreparedTurn', ['messages', 'matches', 'notice', 'summary'])
+
+
+def build_db_context(matches):
+    """Database matches as the markdown list the system prompt expects."""
+    if not matches:
+        return "No relevant diseases were found in the database."
+
+    db_context = ""
+    for i, entry in enumerate(matches, 1):
+        db_context += f"""
+{i}. **{entry['name']}**
+   - Category: {entry['category']}
+   - Symptoms: {", ".join(entry['symptoms'])}
+   - Description: {entry['description']}
+   - Advice: {entry['advice']}
+   - Medicines: {", ".join([m['name'] for m in entry['medicines']])}
+   - Database Confidence: {entry['score']} symptom overlaps
+"""
+    return db_context
+
+
+class ChatPipeline:
+    """
+    Process-wide chat turn runner.
+
+    Owns a daemon thread running an asyncio loop, and the async Convex and
+    Groq clients bound to it, so their keep-alive connections outlive the
+    individual Streamlit reruns that call ``prepare`` and ``stream_reply``.
+    """
+
+    def __init__(self, groq_api_key, convex_url=None):
+        """
+        Args:
+            groq_api_key (str): Groq API key
+            convex_url (str): Convex HTTP actions URL; None skips Convex
+        """
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name='chat-pipeline', daemon=True).start()
+        # Retries and backoff fit inside the retrieval stage, so a slow
+        # Convex is recorded as a failure by its breaker, not cut off
+        self.convex = (CachedConvexClient(ConvexClient(convex_url, deadline=CHAT_RETRIEVAL_TIMEOUT))
+                       if convex_url else None)
+        self.groq = AsyncGroq(api_key=groq_api_key)
+
+    def _run(self, coro):
+        """Run ``coro`` on the pipeline loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def prepare(self, user_text, messages, triage_stage, index=None, version=None, summary=None):
+        """
+        Fetch the matches for a turn and build the messages for the reply.
+
+        Args:
+            user_text (str): The user's new message
+            messages (list): Chat history, ending with the new message
+            triage_stage (str): Current triage stage
+            index (SymptomIndex): Local index used when Convex is not
+                configured or unavailable; None to answer without one
+            version (str): Disease snapshot version (Convex cache key)
+            summary (tuple): ``PreparedTurn.summary`` of the previous turn
+
+        Returns:
+            PreparedTurn: Completion messages, matches, notice and summary
+        """
+        with timer('chat_prepare'):
+            return self._run(self._prepare(user_text, messages, triage_stage, index, version, summary))
+
+    async def _prepare(self, user_text, messages, triage_stage, index, version, summary):
+        retrieval = asyncio.create_task(self._retrieve(user_text, index, version))
+        history = asyncio.create_task(self._history(messages, summary))
+
+        # Everything but the matches is known while they are fetched
+        head = SYSTEM_PROMPT_HEAD.format(triage_stage=triage_stage)
+
+        (matches, notice), (recent, summary) = await asyncio.gather(retrieval, history)
+        system = {"role": "system", "content": head + build_db_context(matches) + "\n"}
+        return PreparedTurn([system, *recent], matches, notice, summary)
+
+    async def _retrieve(self, query, index, version):
+        """(matches, notice): Convex (cached), else the local index."""
+        notice = None
+        if self.convex is not None:
+            try:
+                with timer('convex_lookup'):
+                    # Safety net only: the client stops at its own deadline
+                    return await asyncio.wait_for(self.convex.search_diseases(query, version),
+                                                  CHAT_RETRIEVAL_TIMEOUT + RETRIEVAL_GRACE), None
+            except (ConvexUnavailable, asyncio.TimeoutError) as e:
+                reason = e if isinstance(e, ConvexUnavailable) else f"no answer in {CHAT_RETRIEVAL_TIMEOUT:g}s"
+                if index is None:
+                    return [], ('warning', f"Medical database unavailable, answering without it ({reason})")
+                notice = ('caption', f"Medical database unavailable, using the local snapshot ({reason})")
+
+        if index is None:
+            return [], notice
+        with timer('symptom_index_lookup'):
+            return index.search(query), notice
+
+    async def _history(self, messages, summary):
+        """
+        (messages to send, summary): the last ``CHAT_HISTORY_KEEP`` or more
+        messages verbatim, the older ones as a running summary. If the
+        summary cannot be updated in time the messages stay verbatim.
+        """
+        done, text = summary if summary and summary[0] <= len(messages) else (0, "")
+        if len(messages) - done >= CHAT_HISTORY_KEEP + SUMMARY_BATCH:
+            cut = len(messages) - CHAT_HISTORY_KEEP
+            try:
+                with timer('history_summary'):
+                    text = await asyncio.wait_for(self._summarize(text, messages[done:cut]),
+                                                  CHAT_SUMMARY_TIMEOUT)
+                done = cut
+            except (APIError, asyncio.TimeoutError):
+                pass
+
+        if not done:
+            return list(messages), None
+        earlier = {"role": "system", "content": f"Summary of the earlier conversation:\n{text}"}
+        return [earlier, *messages[done:]], (done, text)
+
+    async def _summarize(self, previous, messages):
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        if previous:
+            transcript = f"Summary so far:\n{previous}\n\nNew messages:\n{transcript}"
+        response = await self.groq.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": transcript},
+            ],
+            temperature=0,
+            max_tokens=300,
+        )
+        return response.choices[0].message.content
+
+    def stream_reply(self, messages):
+        """
+        Yield the reply text as Groq streams it, for ``st.write_stream``.
+
+        Each chunk may take ``CHAT_LLM_TIMEOUT`` seconds; after that the
+        reply ends with ``TIMEOUT_NOTICE``. Time to the first token is
+        recorded as ``groq_first_token``.
+
+        Args:
+            messages (list): ``PreparedTurn.messages``
+        """
+        chunks = queue.Queue()
+        producer = asyncio.run_coroutine_threadsafe(self._produce(messages, chunks), self._loop)
+        started = time.perf_counter()
+        first = True
+        try:
+            with timer('groq_completion'):
+                while True:
+                    try:
+                        item = chunks.get(timeout=CHAT_LLM_TIMEOUT)
+                    except queue.Empty:
+                        yield TIMEOUT_NOTICE
+                        return
+                    if item is None:
+                        return
+                    if isinstance(item, Exception):
+                        raise item
+                    if first:
+                        metrics.observe('groq_first_token', time.perf_counter() - started)
+                        first = False
+                    yield item
+        finally:
+            # Stops the request if the reply timed out or the rerun ended early
+            producer.cancel()
+
+    async def _produce(self, messages, chunks):
+        """Feed the reply text into ``chunks``; an exception or None ends it."""
+        try:
+            async for text in self._completion(messages):
+                chunks.put(text)
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            chunks.put(None)
+
+    async def _completion(self, messages):
+        stream = await self.groq.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=messages,
+            temperature=0.3,
+            stream=True,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()
+
+    def close(self):
+        """Close the clients and stop the loop."""
+        async def _close():
+            if self.convex is not None:
+                await self.convex.aclose()
+            await self.groq.close()
+
+        self._run(_close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,161 @@
+"""
+Vectorized clinical rule engine for FamilyAIDoc.
+The kidney risk rules are declared as data (threshold / category conditions,
+reason conjunctions and override rules) and compiled into NumPy boolean
+matrix operations, so a whole batch of encoded patients is assessed at once.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from config.settings import KIDNEY_ENCODING, KIDNEY_FEATURES, KIDNEY_THRESHOLDS
+
+
+RuleResult = namedtuple('RuleResult', ['override', 'reasons'])
+
+# Comparisons a condition may use, applied as ``column <op> value``
+CONDITION_OPS = {
+    '>=': np.greater_equal,
+    '==': np.equal,
+}
+
+# Kidney conditions on the encoded feature matrix: name -> (column, op, value)
+KIDNEY_CONDITIONS = {
+    'high_creatinine': ('sc', '>=', KIDNEY_THRESHOLDS['high_creatinine']),
+    'high_albumin': ('al', '>=', KIDNEY_THRESHOLDS['high_albumin']),
+    'high_urea': ('bu', '>=', KIDNEY_THRESHOLDS['high_urea']),
+    'high_glucose': ('bgr', '>=', KIDNEY_THRESHOLDS['high_glucose']),
+    'rbc_abnormal': ('rbc', '==', KIDNEY_ENCODING['rbc']['abnormal']),
+    'pc_abnormal': ('pc', '==', KIDNEY_ENCODING['pc']['abnormal']),
+    'pcc_present': ('pcc', '==', KIDNEY_ENCODING['pcc']['present']),
+    'pe_present': ('pe', '==', KIDNEY_ENCODING['pe']['yes']),
+    'ane_present': ('ane', '==', KIDNEY_ENCODING['ane']['yes']),
+}
+
+# Reasons shown to the user, in display order; each fires when all of its
+# conditions hold. Bit i of the reason mask is reason i.
+KIDNEY_REASONS = (
+    (f"Serum Creatinine ≥ {KIDNEY_THRESHOLDS['high_creatinine']:g} mg/dL", ('high_creatinine',)),
+    (f"Urine Albumin ≥ {KIDNEY_THRESHOLDS['high_albumin']:g}", ('high_albumin',)),
+    ('Abnormal RBC and Pus Cells', ('rbc_abnormal', 'pc_abnormal')),
+    ('Pus Cell Clumps present', ('pcc_present',)),
+    ('Pedal Edema present', ('pe_present',)),
+    ('Anemia present', ('ane_present',)),
+    (f"Blood Urea ≥ {KIDNEY_THRESHOLDS['high_urea']:g} mg/dL", ('high_urea',)),
+    (f"Random Blood Glucose ≥ {KIDNEY_THRESHOLDS['high_glucose']:g} mg/dL", ('high_glucose',)),
+)
+
+# CKD is flagged regardless of the model when, for any rule, all of its
+# required conditions and at least one of its alternatives hold
+KIDNEY_OVERRIDES = (
+    (('high_creatinine',), ('high_albumin', 'rbc_abnormal', 'pc_abnormal', 'pcc_present')),
+    (('high_creatinine',), ('pe_present', 'ane_present')),
+    (('high_creatinine',), ('high_urea',)),
+)
+
+
+class RuleEngine:
+    """
+    A rule table compiled to column indices and 0/1 incidence matrices.
+
+    ``evaluate`` computes every condition with one broadcast comparison per
+    operator, then resolves reasons and overrides with matrix products, so
+    the cost per patient is a handful of vectorized operations.
+    """
+
+    def __init__(self, conditions, reasons, overrides, feature_names):
+        """
+        Args:
+            conditions (dict): Name -> (column, op, value), op in ``CONDITION_OPS``
+            reasons (tuple): (label, condition names) pairs, all must hold
+            overrides (tuple): (required names, alternative names) pairs
+            feature_names (list): Column order of the matrices to evaluate
+        """
+        if len(reasons) > 64:
+            raise ValueError("At most 64 reasons fit in the reason bitmask")
+
+        self.condition_names = list(conditions)
+        self.labels = [label for label, _ in reasons]
+        position = {name: i for i, name in enumerate(self.condition_names)}
+        column = {name: i for i, name in enumerate(feature_names)}
+
+        # Condition positions, columns and values grouped by operator
+        self._checks = []
+        for op, ufunc in CONDITION_OPS.items():
+            names = [n for n in self.condition_names if conditions[n][1] == op]
+            if names:
+                self._checks.append((
+                    ufunc,
+                    np.array([position[n] for n in names], dtype=np.intp),
+                    np.array([column[conditions[n][0]] for n in names], dtype=np.intp),
+                    np.array([conditions[n][2] for n in names], dtype=np.float64),
+                ))
+
+        def incidence(groups):
+            matrix = np.zeros((len(groups), len(self.condition_names)), dtype=np.int64)
+            for i, names in enumerate(groups):
+                matrix[i, [position[n] for n in names]] = 1
+            return matrix
+
+        self._reason_terms = incidence([names for _, names in reasons])
+        self._override_required = incidence([required for required, _ in overrides])
+        self._override_any = incidence([alternatives for _, alternatives in overrides])
+        self._reason_bits = np.left_shift(np.uint64(1), np.arange(len(reasons), dtype=np.uint64))
+
+    def conditions(self, features):
+        """
+        Evaluate every condition for every patient.
+
+        Args:
+            features (numpy.ndarray): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            numpy.ndarray: int64 0/1 matrix, shape (n_rows, n_conditions)
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+
+        held = np.zeros((features.shape[0], len(self.condition_names)), dtype=np.int64)
+        for ufunc, positions, columns, values in self._checks:
+            held[:, positions] = ufunc(features[:, columns], values)
+        return held
+
+    def evaluate(self, features):
+        """
+        Assess a batch of patients.
+
+        Args:
+            features (numpy.ndarray): Encoded features, shape (n_rows, n_features)
+
+        Returns:
+            RuleResult: ``override`` bool vector and ``reasons`` uint64
+            bitmask vector (bit i set when reason i triggered)
+        """
+        held = self.conditions(features)
+
+        triggered = (held @ self._reason_terms.T) == self._reason_terms.sum(axis=1)
+        reasons = (triggered * self._reason_bits).sum(axis=1, dtype=np.uint64)
+
+        required = (held @ self._override_required.T) == self._override_required.sum(axis=1)
+        alternative = (held @ self._override_any.T) > 0
+        override = (required & alternative).any(axis=1)
+
+        return RuleResult(override, reasons)
+
+    def reason_labels(self, mask):
+        """
+        Decode one patient's reason bitmask.
+
+        Args:
+            mask (int): Entry of ``RuleResult.reasons``
+
+        Returns:
+            list: Labels of the triggered reasons, in table order
+        """
+        mask = int(mask)
+        return [label for i, label in enumerate(self.labels) if mask >> i & 1]
+
+
+KIDNEY_RULES = RuleEngine(KIDNEY_CONDITIONS, KIDNEY_REASONS, KIDNEY_OVERRIDES, KIDNEY_FEATURES)
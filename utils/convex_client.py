@@ -0,0 +1,263 @@
+"""
+HTTP client for the Convex disease search used by the medical chatbot.
+One pooled ``httpx.AsyncClient`` per process keeps connections to the
+Convex deployment alive between chat turns. Failed lookups are retried a
+bounded number of times with jittered exponential backoff inside a
+per-lookup deadline, and a circuit breaker stops calling a deployment that
+keeps failing, so a slow Convex degrades a chat turn instead of stalling it.
+Answers are cached process-wide by the normalized token set of the query,
+so retyped or reordered symptom descriptions skip the round trip.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import httpx
+
+from config.settings import (
+    CONVEX_BACKOFF_BASE,
+    CONVEX_BACKOFF_MAX,
+    CONVEX_BREAKER_RESET,
+    CONVEX_BREAKER_THRESHOLD,
+    CONVEX_CACHE_SIZE,
+    CONVEX_CACHE_TTL,
+    CONVEX_POOL_SIZE,
+    CONVEX_RETRIES,
+    CONVEX_TIMEOUT,
+)
+from utils.symptom_index import tokenize
+from utils.ttl_cache import TTLCache
+
+SEARCH_PATH = '/api/search_diseases'
+
+# Responses worth retrying; other 4xx errors fail immediately
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+# Shared by every CachedConvexClient of the process; stats() for display
+search_cache = TTLCache(maxsize=CONVEX_CACHE_SIZE, ttl=CONVEX_CACHE_TTL)
+
+
+class ConvexUnavailable(RuntimeError):
+    """Convex could not answer: circuit open, or every attempt failed."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: calls pass. After ``threshold`` consecutive failures it opens and
+    rejects calls for ``reset_timeout`` seconds, then lets a single trial
+    call through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold=CONVEX_BREAKER_THRESHOLD, reset_timeout=CONVEX_BREAKER_RESET):
+        """
+        Args:
+            threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds the circuit stays open
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self.opened_at is None:
+                return 'closed'
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return 'open'
+            return 'half-open'
+
+    def allow(self):
+        """True if a call may go ahead (claims the half-open trial slot)."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+def backoff_delay(attempt, base=CONVEX_BACKOFF_BASE, cap=CONVEX_BACKOFF_MAX):
+    """Full-jitter exponential backoff before retry number ``attempt`` (1-based)."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class ConvexClient:
+    """
+    Pooled, retrying client for the Convex ``/api/search_diseases`` route.
+    Use it from a single event loop.
+    """
+
+    def __init__(self, base_url, timeout=CONVEX_TIMEOUT, retries=CONVEX_RETRIES,
+                 deadline=None, pool_size=CONVEX_POOL_SIZE, breaker=None):
+        """
+        Args:
+            base_url (str): Convex HTTP actions URL (``CONVEX_URL``)
+            timeout (tuple): (connect, read) timeout in seconds per attempt
+            retries (int): Attempts after the first one
+            deadline (float): Seconds a whole lookup may take, retries
+                included; defaults to one connect + read timeout plus the
+                largest backoff
+            pool_size (int): Keep-alive connections kept per host
+            breaker (CircuitBreaker): Shared breaker, a new one by default
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.deadline = deadline if deadline is not None else sum(timeout) + CONVEX_BACKOFF_MAX
+        self.breaker = breaker or CircuitBreaker()
+        self.http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    async def search_diseases(self, query):
+        """
+        Ranked disease matches for a symptom description.
+
+        A lookup that is cancelled (e.g. by a caller's timeout) counts as a
+        failure, so the breaker still opens and a half-open trial is released.
+
+        Args:
+            query (str): User's symptom text
+
+        Returns:
+            list: Disease dicts as returned by ``diseases.searchDiseases``
+
+        Raises:
+            ConvexUnavailable: Circuit open or every attempt failed
+        """
+        if not self.breaker.allow():
+            raise ConvexUnavailable("Convex circuit open after repeated failures")
+
+        succeeded = False
+        try:
+            matches = await self._attempts(query)
+            succeeded = True
+            return matches
+        finally:
+            if succeeded:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+    async def _attempts(self, query):
+        started = time.monotonic()
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = backoff_delay(attempt)
+                if time.monotonic() - started + delay >= self.deadline:
+                    break
+                await asyncio.sleep(delay)
+
+            remaining = self.deadline - (time.monotonic() - started)
+            timeout = httpx.Timeout(min(self.timeout[1], remaining),
+                                    connect=min(self.timeout[0], remaining))
+            try:
+                response = await self.http.post(f"{self.base_url}{SEARCH_PATH}",
+                                                json={"query": query}, timeout=timeout)
+                if response.status_code in RETRY_STATUSES:
+                    error = httpx.HTTPStatusError(f"{response.status_code} from Convex",
+                                                  request=response.request, response=response)
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except httpx.TransportError as e:
+                # Connection errors and timeouts
+                error = e
+            except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+                # 4xx, undecodable or malformed body, redirect loops, bad URL:
+                # retrying will not help
+                error = e
+                break
+
+        raise ConvexUnavailable(f"Convex search failed: {error!r}") from error
+
+    async def aclose(self):
+        await self.http.aclose()
+
+
+def query_key(query, version=None):
+    """
+    Cache key for a symptom description.
+
+    "Fever and a bad headache" and "headache, fever" share a key: stop words
+    are dropped and the remaining tokens de-duplicated and sorted.
+
+    Args:
+        query (str): User's symptom text
+        version (str): Disease snapshot version the answer belongs to
+
+    Returns:
+        tuple: (normalized token string, version)
+    """
+    return ' '.join(sorted(set(tokenize(query)))), version
+
+
+class CachedConvexClient:
+    """
+    Wrap a ``ConvexClient`` with the process-wide search cache.
+
+    Only successful Convex answers are stored. The snapshot version is part
+    of every key, so exporting a new snapshot leaves the old entries
+    unreachable until they age out.
+    """
+
+    def __init__(self, client, cache=search_cache):
+        """
+        Args:
+            client (ConvexClient): Client used on a cache miss
+            cache (TTLCache): TTL + LRU cache to read and fill
+        """
+        self.client = client
+        self.cache = cache
+
+    def __getattr__(self, name):
+        # Expose the wrapped client's attributes (breaker, deadline, ...)
+        if name == 'client':
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    async def search_diseases(self, query, version=None):
+        """
+        Cached ``ConvexClient.search_diseases``.
+
+        Args:
+            query (str): User's symptom text
+            version (str): Current disease snapshot version, if known
+
+        Returns:
+            list: Disease matches; shared between callers, do not modify
+
+        Raises:
+            ConvexUnavailable: Not cached and Convex could not answer
+        """
+        key = query_key(query, version)
+        matches = self.cache.get(key)
+        if matches is None:
+            matches = await self.client.search_diseases(query)
+            self.cache.put(key, matches)
+        return matches
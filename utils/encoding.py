@@ -2,7 +2,10 @@
 Encoding utilities for categorical variables in predictions.
 """
 
-from config.settings import KIDNEY_ENCODING
+import numpy as np
+
+from config.settings import KIDNEY_ENCODING, KIDNEY_ENCODING_DEFAULTS
+from utils.feature_schema import KIDNEY_SCHEMA
 
 
 def encode_kidney_features(rbc, pc, pcc, ba, htn, dm, cad, appet, pe, ane):
@@ -25,27 +28,37 @@ def encode_kidney_features(rbc, pc, pcc, ba, htn, dm, cad, appet, pe, ane):
         tuple: Encoded feature values
     """
     return (
-        KIDNEY_ENCODING['rbc'].get(rbc, 1),
-        KIDNEY_ENCODING['pc'].get(pc, 1),
-        KIDNEY_ENCODING['pcc'].get(pcc, 0),
-        KIDNEY_ENCODING['ba'].get(ba, 0),
-        KIDNEY_ENCODING['htn'].get(htn, 0),
-        KIDNEY_ENCODING['dm'].get(dm, 0),
-        KIDNEY_ENCODING['cad'].get(cad, 0),
-        KIDNEY_ENCODING['appet'].get(appet, 0),
-        KIDNEY_ENCODING['pe'].get(pe, 0),
-        KIDNEY_ENCODING['ane'].get(ane, 0),
+        KIDNEY_ENCODING['rbc'].get(rbc, KIDNEY_ENCODING_DEFAULTS['rbc']),
+        KIDNEY_ENCODING['pc'].get(pc, KIDNEY_ENCODING_DEFAULTS['pc']),
+        KIDNEY_ENCODING['pcc'].get(pcc, KIDNEY_ENCODING_DEFAULTS['pcc']),
+        KIDNEY_ENCODING['ba'].get(ba, KIDNEY_ENCODING_DEFAULTS['ba']),
+        KIDNEY_ENCODING['htn'].get(htn, KIDNEY_ENCODING_DEFAULTS['htn']),
+        KIDNEY_ENCODING['dm'].get(dm, KIDNEY_ENCODING_DEFAULTS['dm']),
+        KIDNEY_ENCODING['cad'].get(cad, KIDNEY_ENCODING_DEFAULTS['cad']),
+        KIDNEY_ENCODING['appet'].get(appet, KIDNEY_ENCODING_DEFAULTS['appet']),
+        KIDNEY_ENCODING['pe'].get(pe, KIDNEY_ENCODING_DEFAULTS['pe']),
+        KIDNEY_ENCODING['ane'].get(ane, KIDNEY_ENCODING_DEFAULTS['ane']),
     )
 
 
-def encode_gender(gender):
+def encode_kidney_categoricals(df):
     """
-    Encode gender for liver disease prediction.
-    
+    Encode the ten kidney categorical columns of a DataFrame at once.
+
+    Vectorized counterpart of ``encode_kidney_features`` for lab exports:
+    each column goes through a lookup table built once from
+    ``KIDNEY_ENCODING``, with the same defaults for missing or unknown
+    values.
+
     Args:
-        gender (str): "Male" or "Female"
-        
+        df (pandas.DataFrame): Columns named as the keys of ``KIDNEY_ENCODING``
+
     Returns:
-        int: Encoded value (1 for Male, 0 for Female)
+        numpy.ndarray: Float matrix of shape (n_patients, 10), columns in
+        ``encode_kidney_features`` order
     """
-    return 1 if gender == "Male" else 0
+    encoded = np.empty((len(df), len(KIDNEY_ENCODING)), dtype=np.float64)
+    for i, col in enumerate(KIDNEY_ENCODING):
+        encoded[:, i] = KIDNEY_SCHEMA.lookups[col].encode(df[col])
+    return encoded
+
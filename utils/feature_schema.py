@@ -0,0 +1,338 @@
+"""
+Per-disease feature schemas for FamilyAIDoc.
+A schema is the single description of a model's inputs: column order,
+dtype, valid range, categorical encoding and default. It turns dicts or
+DataFrames of raw patient values into the contiguous float64 matrix the
+scalers were fit on, one column at a time.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import (
+    KIDNEY_ENCODING,
+    KIDNEY_ENCODING_DEFAULTS,
+    KIDNEY_FEATURES,
+    LIVER_FEATURES,
+    PARKINSONS_FEATURES,
+    SG_DEFAULT,
+    SG_VALUES,
+)
+
+
+class Feature(namedtuple('Feature', ['name', 'dtype', 'bounds', 'encoding', 'default', 'source'])):
+    """
+    One model input.
+
+    Attributes:
+        name (str): Key used by the app (pages, sample data, API)
+        dtype (str): 'float' or 'category'
+        bounds (tuple): (low, high) of valid raw values, or None
+        encoding (dict): Raw value -> encoded number, for categories
+        default (float): Encoded value used for missing / unknown
+            categories; None makes the column required
+        source (str): Column name in the original training dataset
+    """
+
+    __slots__ = ()
+
+
+def numeric(name, low=None, high=None, source=None):
+    """A required numeric feature."""
+    bounds = None if low is None and high is None else (low, high)
+    return Feature(name, 'float', bounds, None, None, source or name)
+
+
+def categorical(name, encoding, default, source=None):
+    """A categorical feature encoded through ``encoding``."""
+    return Feature(name, 'category', None, dict(encoding), default, source or name)
+
+
+class CategoryLookup:
+    """
+    Vectorized encoder for one categorical feature, built once.
+
+    String categories are matched with a pandas ``Categorical`` (hash lookup
+    in C) and numeric categories with ``np.searchsorted`` on the sorted
+    keys; either way the resulting codes index a lookup table whose last
+    slot holds the default for missing or unknown values.
+    """
+
+    def __init__(self, encoding, default):
+        """
+        Args:
+            encoding (dict): Raw value -> encoded number
+            default (float): Encoded value for missing / unknown input
+        """
+        self.numeric = all(isinstance(key, float) for key in encoding)
+        if self.numeric:
+            # Numeric categories (specific gravity) are matched after rounding
+            keys = sorted(round(key, 3) for key in encoding)
+            codes = {round(key, 3): code for key, code in encoding.items()}
+            self.keys = np.array(keys, dtype=np.float64)
+        else:
+            keys = list(encoding)
+            codes = encoding
+            self.keys = pd.Index(keys)
+        self.table = np.array([codes[key] for key in keys] + [default], dtype=np.float64)
+
+    def codes(self, values):
+        """Position of each value in ``keys``, -1 when missing or unknown."""
+        if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+            # Already categorical (e.g. read_csv(dtype='category')): translate
+            # the few distinct categories, then index by the existing codes
+            categories = self.codes(pd.Series(values.cat.categories))
+            return np.append(categories, -1)[values.cat.codes.to_numpy()]
+        if self.numeric:
+            values = np.round(pd.to_numeric(values, errors='coerce'), 3)
+            values = np.asarray(values, dtype=np.float64)
+            positions = np.searchsorted(self.keys, values).clip(max=len(self.keys) - 1)
+            return np.where(self.keys[positions] == values, positions, -1)
+        return pd.Categorical(values, categories=self.keys).codes
+
+    def encode(self, values):
+        """
+        Encode a column of raw values.
+
+        Args:
+            values (array-like): Raw categories (Series, array or list)
+
+        Returns:
+            numpy.ndarray: float64 encoded values
+        """
+        # Code -1 picks the default in the table's last slot
+        return self.table[self.codes(values)]
+
+
+class FeatureSchema:
+    """Ordered features of one disease model."""
+
+    def __init__(self, disease, features):
+        """
+        Args:
+            disease (str): 'kidney', 'liver' or 'parkinsons'
+            features (list): ``Feature`` per model input, in model order
+        """
+        self.disease = disease
+        self.features = tuple(features)
+        self.names = [f.name for f in self.features]
+        self.sources = [f.source for f in self.features]
+        self.index = {f.name: i for i, f in enumerate(self.features)}
+        self.n_features = len(self.features)
+
+        self._low = np.array([f.bounds[0] if f.bounds and f.bounds[0] is not None else -np.inf
+                              for f in self.features], dtype=np.float64)
+        self._high = np.array([f.bounds[1] if f.bounds and f.bounds[1] is not None else np.inf
+                               for f in self.features], dtype=np.float64)
+        self._numeric = np.array([f.dtype == 'float' for f in self.features])
+        self.lookups = {
+            f.name: CategoryLookup(f.encoding, f.default)
+            for f in self.features if f.dtype == 'category'
+        }
+
+    def __len__(self):
+        return self.n_features
+
+    def matches(self, feature_names):
+        """True if ``feature_names`` (e.g. a pickled features list) is this order."""
+        feature_names = list(feature_names)
+        return feature_names == self.names or feature_names == self.sources
+
+    def resolve_columns(self, columns):
+        """
+        Map each feature to the column holding it.
+
+        Args:
+            columns (iterable): Available column names
+
+        Returns:
+            list: Column name per feature (app or dataset name), or None where
+            the column is absent
+        """
+        columns = set(columns)
+        resolved = []
+        for feature in self.features:
+            if feature.name in columns:
+                resolved.append(feature.name)
+            elif feature.source in columns:
+                resolved.append(feature.source)
+            else:
+                resolved.append(None)
+        return resolved
+
+    def missing_columns(self, columns):
+        """Names of required features absent from ``columns``."""
+        return [
+            feature.name
+            for feature, column in zip(self.features, self.resolve_columns(columns))
+            if column is None and feature.default is None
+        ]
+
+    def build_matrix(self, data):
+        """
+        Encode raw patient values into the model's feature matrix.
+
+        Args:
+            data: dict (one patient), list of dicts or DataFrame, keyed by
+                feature name or original dataset column name
+
+        Returns:
+            numpy.ndarray: C-contiguous float64 matrix, shape (n_patients, n_features)
+        """
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, pd.DataFrame):
+            data = pd.DataFrame.from_records(data)
+
+        missing = self.missing_columns(data.columns)
+        if missing:
+            raise ValueError(f"Missing {self.disease} features: {', '.join(missing)}")
+
+        matrix = np.empty((len(data), self.n_features), dtype=np.float64)
+        for i, (feature, column) in enumerate(zip(self.features, self.resolve_columns(data.columns))):
+            if column is None:
+                matrix[:, i] = feature.default
+            elif feature.dtype == 'category':
+                matrix[:, i] = self.lookups[feature.name].encode(data[column])
+            else:
+                matrix[:, i] = pd.to_numeric(data[column], errors='coerce')
+        return matrix
+
+    def missing_values(self, matrix):
+        """
+        Flag numeric values that were blank or not numbers (NaN after
+        ``build_matrix``); such patients cannot be scored.
+
+        Args:
+            matrix (numpy.ndarray): Output of ``build_matrix``
+
+        Returns:
+            numpy.ndarray: Boolean mask, shape (n_patients, n_features)
+        """
+        return np.isnan(np.asarray(matrix, dtype=np.float64)) & self._numeric
+
+    def row_issues(self, matrix):
+        """
+        Describe why each patient cannot be scored: missing or non-numeric
+        values and values outside the feature bounds.
+
+        Args:
+            matrix (numpy.ndarray): Output of ``build_matrix``
+
+        Returns:
+            numpy.ndarray: One string per patient, '' where all values are valid
+        """
+        missing = self.missing_values(matrix)
+        outside = self.out_of_bounds(matrix) & ~missing
+        issues = np.full(len(missing), '', dtype=object)
+        for row in np.flatnonzero(missing.any(axis=1) | outside.any(axis=1)):
+            parts = []
+            for label, mask in (('missing or non-numeric', missing), ('outside bounds', outside)):
+                names = [self.names[i] for i in np.flatnonzero(mask[row])]
+                if names:
+                    parts.append(f"{label}: {', '.join(names)}")
+            issues[row] = '; '.join(parts)
+        return issues
+
+    def out_of_bounds(self, matrix):
+        """
+        Flag numeric values outside their feature's bounds (NaN included).
+
+        Args:
+            matrix (numpy.ndarray): Output of ``build_matrix``
+
+        Returns:
+            numpy.ndarray: Boolean mask, shape (n_patients, n_features)
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        inside = (matrix >= self._low) & (matrix <= self._high)
+        return ~inside & self._numeric
+
+    def validation_errors(self, matrix):
+        """
+        Human-readable summary of ``out_of_bounds``.
+
+        Returns:
+            list: One message per feature with invalid values
+        """
+        counts = self.out_of_bounds(matrix).sum(axis=0)
+        return [
+            f"{feature.name}: {count} value(s) missing or outside "
+            f"[{feature.bounds[0]}, {feature.bounds[1]}]"
+            if feature.bounds else f"{feature.name}: {count} missing value(s)"
+            for feature, count in zip(self.features, counts) if count
+        ]
+
+
+# Bounds are physiological limits, wide enough for every row of the
+# training datasets (tools/check_feature_bounds.py); they reject impossible
+# values, not unusual patients. The page widgets use their own, narrower ranges.
+KIDNEY_BOUNDS = {
+    'age': (0, 120), 'bp': (20, 300), 'al': (0, 5), 'su': (0, 5),
+    'bgr': (10, 1500), 'bu': (0, 600), 'sc': (0.1, 100.0), 'sod': (1, 250),
+    'pot': (0.5, 60.0), 'hemo': (1.0, 25.0), 'pcv': (5, 80),
+    'wc': (500, 100000), 'rc': (0.5, 12.0),
+}
+
+LIVER_BOUNDS = {
+    'age': (0, 120), 'total_bilirubin': (0.0, 100.0), 'direct_bilirubin': (0.0, 60.0),
+    'alkaline_phosphotase': (10, 5000), 'alamine_aminotransferase': (1, 10000),
+    'aspartate_aminotransferase': (1, 10000), 'total_protiens': (1.0, 15.0),
+    'albumin': (0.5, 10.0), 'ag_ratio': (0.05, 5.0),
+}
+
+LIVER_SOURCES = [
+    'Age', 'Gender', 'Total_Bilirubin', 'Direct_Bilirubin', 'Alkaline_Phosphotase',
+    'Alamine_Aminotransferase', 'Aspartate_Aminotransferase', 'Total_Protiens',
+    'Albumin', 'Albumin_and_Globulin_Ratio',
+]
+
+PARKINSONS_BOUNDS = {
+    'mdvp_fo': (50.0, 500.0), 'mdvp_fhi': (50.0, 1000.0), 'mdvp_flo': (30.0, 500.0),
+    'mdvp_jitter_percent': (0.0, 1.0), 'mdvp_jitter_abs': (0.0, 0.01),
+    'mdvp_rap': (0.0, 1.0), 'mdvp_ppq': (0.0, 1.0), 'jitter_ddp': (0.0, 1.0),
+    'mdvp_shimmer': (0.0, 1.0), 'mdvp_shimmer_db': (0.0, 5.0),
+    'shimmer_apq3': (0.0, 1.0), 'shimmer_apq5': (0.0, 1.0), 'mdvp_apq': (0.0, 1.0),
+    'shimmer_dda': (0.0, 1.0), 'nhr': (0.0, 5.0), 'hnr': (-10.0, 50.0),
+    'rpde': (0.0, 1.0), 'dfa': (0.0, 1.0), 'spread1': (-12.0, 0.0),
+    'spread2': (0.0, 1.0), 'd2': (0.0, 10.0), 'ppe': (0.0, 1.0),
+}
+
+PARKINSONS_SOURCES = [
+    'MDVP:Fo(Hz)', 'MDVP:Fhi(Hz)', 'MDVP:Flo(Hz)', 'MDVP:Jitter(%)', 'MDVP:Jitter(Abs)',
+    'MDVP:RAP', 'MDVP:PPQ', 'Jitter:DDP', 'MDVP:Shimmer', 'MDVP:Shimmer(dB)',
+    'Shimmer:APQ3', 'Shimmer:APQ5', 'MDVP:APQ', 'Shimmer:DDA', 'NHR', 'HNR',
+    'RPDE', 'DFA', 'spread1', 'spread2', 'D2', 'PPE',
+]
+
+
+def _kidney_feature(name):
+    if name == 'sg':
+        # Specific gravity is encoded as its position in SG_VALUES
+        return categorical('sg', {value: i for i, value in enumerate(SG_VALUES)},
+                           SG_VALUES.index(SG_DEFAULT))
+    if name in KIDNEY_ENCODING:
+        return categorical(name, KIDNEY_ENCODING[name], KIDNEY_ENCODING_DEFAULTS[name])
+    return numeric(name, *KIDNEY_BOUNDS[name])
+
+
+KIDNEY_SCHEMA = FeatureSchema('kidney', [_kidney_feature(name) for name in KIDNEY_FEATURES])
+
+LIVER_SCHEMA = FeatureSchema('liver', [
+    categorical(name, {'Male': 1, 'Female': 0}, 0, source)
+    if name == 'gender' else numeric(name, *LIVER_BOUNDS[name], source=source)
+    for name, source in zip(LIVER_FEATURES, LIVER_SOURCES)
+])
+
+PARKINSONS_SCHEMA = FeatureSchema('parkinsons', [
+    numeric(name, *PARKINSONS_BOUNDS[name], source=source)
+    for name, source in zip(PARKINSONS_FEATURES, PARKINSONS_SOURCES)
+])
+
+SCHEMAS = {
+    'kidney': KIDNEY_SCHEMA,
+    'liver': LIVER_SCHEMA,
+    'parkinsons': PARKINSONS_SCHEMA,
+}
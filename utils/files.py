@@ -0,0 +1,61 @@
+"""
+File helpers shared by the metrics export, the warm-up health file and the
+scored CSV downloads.
+"""
+
+import contextlib
+import os
+import tempfile
+import time
+
+
+def atomic_write(path, text, mode=0o644):
+    """
+    Replace ``path`` with ``text`` so readers never see a partial file.
+
+    Each call writes its own temporary file next to ``path``, so concurrent
+    writers (e.g. several Streamlit sessions) never share one.
+
+    Args:
+        path (str): Destination file
+        text (str): New contents
+        mode (int): Permissions of the written file
+
+    Raises:
+        OSError: The file could not be written
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def remove_older_than(directory, max_age):
+    """
+    Delete the files in ``directory`` last modified more than ``max_age``
+    seconds ago. Files that vanish or cannot be removed are skipped.
+
+    Args:
+        directory (str): Directory to sweep (missing is fine)
+        max_age (float): Age in seconds
+
+    Returns:
+        int: Files removed
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    with contextlib.suppress(FileNotFoundError), os.scandir(directory) as entries:
+        for entry in entries:
+            with contextlib.suppress(OSError):
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+    return removed
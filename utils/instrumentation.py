@@ -0,0 +1,185 @@
+"""
+Latency instrumentation for FamilyAIDoc.
+Context-manager timers record how long each stage takes (model load,
+encoding, scaling, predict_proba, gauge building, Convex lookup, Groq
+completion, ...) into per-stage / per-disease histograms that can be
+exported in the Prometheus text format. When metrics are disabled the
+timers are a shared no-op context manager.
+"""
+
+import contextlib
+import threading
+import time
+
+from config.settings import METRICS_ENABLED
+from utils.files import atomic_write
+
+
+METRIC_NAME = 'familyaidoc_stage_duration_seconds'
+
+# Histogram bucket upper bounds in seconds (Prometheus ``le`` labels)
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Record one duration in seconds."""
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """(upper bound, cumulative count) pairs, ending with +Inf."""
+        running = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+
+class _Timer:
+    """Times a ``with`` block and records it in a registry."""
+
+    __slots__ = ('registry', 'stage', 'labels', 'start')
+
+    def __init__(self, registry, stage, labels):
+        self.registry = registry
+        self.stage = stage
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.stage, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Histograms keyed by stage and labels (e.g. ``disease``)."""
+
+    def __init__(self, enabled=True, buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            enabled (bool): Record timings; when False ``timer`` is a no-op
+            buckets (tuple): Histogram bucket upper bounds in seconds
+        """
+        self.enabled = enabled
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def timer(self, stage, **labels):
+        """
+        Context manager timing one stage.
+
+        Args:
+            stage (str): Stage name, e.g. 'predict_proba'
+            **labels: Extra labels, e.g. ``disease='kidney'``
+
+        Returns:
+            Context manager recording the block's duration
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage, labels)
+
+    def observe(self, stage, seconds, **labels):
+        """Record a duration measured elsewhere."""
+        if not self.enabled:
+            return
+        key = (stage, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def summary(self):
+        """
+        Count, total and mean seconds per stage.
+
+        Returns:
+            dict: (stage, labels) -> {'count', 'sum', 'mean'}
+        """
+        with self._lock:
+            return {
+                key: {'count': h.count, 'sum': h.sum, 'mean': h.sum / h.count if h.count else 0.0}
+                for key, h in self._histograms.items()
+            }
+
+    def reset(self):
+        """Drop all recorded timings."""
+        with self._lock:
+            self._histograms.clear()
+
+    def to_prometheus(self):
+        """
+        Render every histogram in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text
+        """
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent per FamilyAIDoc stage.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for (stage, labels), histogram in sorted(self._histograms.items()):
+                base = [('stage', stage)] + list(labels)
+                for bound, count in histogram.cumulative():
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f"{METRIC_NAME}_bucket{_format_labels(base + [('le', le)])} {count}")
+                lines.append(f"{METRIC_NAME}_sum{_format_labels(base)} {histogram.sum!r}")
+                lines.append(f"{METRIC_NAME}_count{_format_labels(base)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """
+        Atomically write ``to_prometheus()`` to ``path`` (node_exporter
+        textfile style). Safe to call from concurrent sessions; a failed
+        write is skipped so the export never breaks a page.
+
+        Returns:
+            bool: True if the file was written
+        """
+        try:
+            atomic_write(path, self.to_prometheus())
+        except OSError:
+            return False
+        return True
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(pairs):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+# Process-wide registry used by the app
+metrics = MetricsRegistry(enabled=METRICS_ENABLED)
+
+
+def timer(stage, **labels):
+    """Time a stage on the process-wide registry (no-op when disabled)."""
+    return metrics.timer(stage, **labels)
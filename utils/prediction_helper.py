@@ -2,13 +2,18 @@
 Helper functions for disease predictions and clinical assessments.
 """
 
-from config.settings import KIDNEY_THRESHOLDS
+import numpy as np
+from config.settings import KIDNEY_ENCODING, KIDNEY_FEATURES
+from utils.clinical_rules import KIDNEY_RULES
 
 
 def assess_kidney_disease_risk(rbc, pc, pcc, pe, ane, sc, al, bu, bgr):
     """
     Assess clinical risk factors for kidney disease.
     
+    Single-patient wrapper around ``KIDNEY_RULES``; use
+    ``assess_kidney_risk_batch`` to assess many encoded patients at once.
+    
     Args:
         rbc (str): Red Blood Cells status
         pc (str): Pus Cell status
@@ -23,74 +28,82 @@ def assess_kidney_disease_risk(rbc, pc, pcc, pe, ane, sc, al, bu, bgr):
     Returns:
         tuple: (risk_override, override_reasons)
     """
-    override_reasons = []
-    
-    high_creatinine = (sc >= KIDNEY_THRESHOLDS['high_creatinine'])
-    high_albumin = (al >= KIDNEY_THRESHOLDS['high_albumin'])
-    high_urea = (bu >= KIDNEY_THRESHOLDS['high_urea'])
-    high_glucose = (bgr >= KIDNEY_THRESHOLDS['high_glucose'])
-    
-    rbc_abnormal = (rbc == 'abnormal')
-    pc_abnormal = (pc == 'abnormal')
-    pcc_present = (pcc == 'present')
-    pe_present = (pe == 'yes')
-    ane_present = (ane == 'yes')
+    values = {'rbc': rbc, 'pc': pc, 'pcc': pcc, 'pe': pe, 'ane': ane,
+              'sc': sc, 'al': al, 'bu': bu, 'bgr': bgr}
     
-    if high_creatinine:
-        override_reasons.append('Serum Creatinine ≥ 1.8 mg/dL')
-    if high_albumin:
-        override_reasons.append('Urine Albumin ≥ 3')
-    if rbc_abnormal and pc_abnormal:
-        override_reasons.append('Abnormal RBC and Pus Cells')
-    if pcc_present:
-        override_reasons.append('Pus Cell Clumps present')
-    if pe_present:
-        override_reasons.append('Pedal Edema present')
-    if ane_present:
-        override_reasons.append('Anemia present')
-    if high_urea:
-        override_reasons.append('Blood Urea ≥ 50 mg/dL')
-    if high_glucose:
-        override_reasons.append('Random Blood Glucose ≥ 150 mg/dL')
+    # Unused columns and unknown categories stay NaN so no condition matches them
+    row = np.full((1, len(KIDNEY_FEATURES)), np.nan)
+    for name, value in values.items():
+        if name in KIDNEY_ENCODING:
+            value = KIDNEY_ENCODING[name].get(value, np.nan)
+        row[0, KIDNEY_FEATURES.index(name)] = value
     
-    risk_override = (
-        high_creatinine and (high_albumin or rbc_abnormal or pc_abnormal or pcc_present)
-    ) or (
-        high_creatinine and (pe_present or ane_present)
-    ) or (
-        high_creatinine and high_urea
-    )
+    result = KIDNEY_RULES.evaluate(row)
+    return bool(result.override[0]), KIDNEY_RULES.reason_labels(result.reasons[0])
+
+
+def assess_kidney_risk_batch(features):
+    """
+    Assess clinical risk factors for a batch of kidney patients.
     
-    return risk_override, override_reasons
+    Args:
+        features (numpy.ndarray): Encoded kidney features in
+            ``KIDNEY_FEATURES`` order, shape (n_patients, 24)
+        
+    Returns:
+        RuleResult: ``override`` vector and ``reasons`` bitmask vector;
+        decode a mask with ``KIDNEY_RULES.reason_labels``
+    """
+    return KIDNEY_RULES.evaluate(features)
 
 
-def get_kidney_ckd_status(model, prediction):
+def resolve_ckd_mask(model, target_classes=None):
     """
-    Determine CKD status from model prediction.
+    Work out which kidney model classes mean CKD.
+    
+    Called once when the kidney model is loaded so each prediction only
+    needs an array lookup instead of re-reading the metadata file.
     
     Args:
-        model: Trained model
-        prediction (int): Predicted class
+        model: Trained kidney model
+        target_classes (list): Class label per class index from the model
+            bundle / metadata, if available
         
     Returns:
-        bool: True if CKD detected, False otherwise
+        numpy.ndarray: Boolean mask indexed by predicted class
     """
-    # Try to load metadata for accurate mapping
-    try:
-        import joblib
-        meta = joblib.load('models/kidney/kidney_extratrees_metadata.pkl')
-        if isinstance(meta, dict) and 'target_classes' in meta:
-            text_classes = [str(c).strip().lower().replace('\t', '').replace(' ', '') 
-                           for c in meta['target_classes']]
-            ckd_indices = [i for i, c in enumerate(text_classes) 
-                          if c in ('ckd', 'chronickidneydisease')]
-            if ckd_indices:
-                return int(prediction) in ckd_indices
-    except:
-        pass
+    model_classes = len(getattr(model, 'classes_', []))
+    n_classes = max(model_classes, 2)
+    ckd_indices = []
+    
+    # Use class labels for accurate mapping
+    if target_classes:
+        text_classes = [str(c).strip().lower().replace('\t', '').replace(' ', '') 
+                       for c in target_classes]
+        ckd_indices = [i for i, c in enumerate(text_classes) 
+                      if c in ('ckd', 'chronickidneydisease')]
+        n_classes = max(n_classes, len(text_classes))
     
     # Fallback logic
-    if hasattr(model, 'classes_') and len(getattr(model, 'classes_', [])) == 3:
-        return int(prediction) in [0, 1]
+    if not ckd_indices:
+        ckd_indices = [0, 1] if model_classes == 3 else [0]
     
-    return int(prediction) == 0
+    ckd_mask = np.zeros(n_classes, dtype=bool)
+    ckd_mask[ckd_indices] = True
+    return ckd_mask
+
+
+def get_kidney_ckd_status(ckd_mask, prediction):
+    """
+    Determine CKD status from model prediction.
+    
+    Args:
+        ckd_mask (numpy.ndarray): Mask from ``resolve_ckd_mask``
+        prediction (int or array-like): Predicted class, or an array of them
+        
+    Returns:
+        bool or numpy.ndarray: True where CKD is detected
+    """
+    if np.ndim(prediction) == 0:
+        return bool(ckd_mask[int(prediction)])
+    return ckd_mask[np.asarray(prediction, dtype=int)]
@@ -0,0 +1,138 @@
+"""
+In-process symptom search for the medical chatbot.
+An inverted index (symptom token -> diseases) over a snapshot of the Convex
+``diseases`` table, scored with BM25. Results are ranked the way
+``searchDiseases`` in convex/diseases.ts ranks them, so the chatbot can use
+it interchangeably with Convex: offline, when ``CONVEX_URL`` is unset or
+Convex is unavailable, and without a network round trip.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+
+# Function words that carry no symptom information
+STOP_WORDS = frozenset("""
+    a about am an and any are as at be been but by can do does feel feeling
+    felt for from get getting got had has have having i im i'm in is it its
+    just like me my of on or since so some that the there this to very was
+    what when with
+""".split())
+
+# Diseases ranked by BM25 before the symptom-overlap ordering (searchDiseases
+# takes 10 full-text matches)
+CANDIDATES = 10
+
+
+def tokenize(text):
+    """Lower-case word tokens of ``text`` without stop words."""
+    return [token for token in re.findall(r"[a-z0-9']+", text.lower()) if token not in STOP_WORDS]
+
+
+def snapshot_version(diseases):
+    """Content hash identifying a set of disease documents."""
+    canonical = json.dumps(diseases, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+class SymptomIndex:
+    """BM25 inverted index over disease symptoms."""
+
+    def __init__(self, diseases, version=None, k1=1.5, b=0.75):
+        """
+        Args:
+            diseases (list): Disease documents (``name``, ``symptoms``, ...)
+            version (str): Snapshot version, the content hash by default
+            k1 (float): BM25 term-frequency saturation
+            b (float): BM25 document-length normalization
+        """
+        self.diseases = list(diseases)
+        self.version = version or snapshot_version(self.diseases)
+        self._symptoms = [[s.lower() for s in d['symptoms']] for d in self.diseases]
+
+        documents = [tokenize(d.get('symptomsText') or ' '.join(d['symptoms'])) for d in self.diseases]
+        average_length = sum(map(len, documents)) / max(len(documents), 1) or 1.0
+        postings = defaultdict(list)
+        for doc_id, tokens in enumerate(documents):
+            for token, tf in Counter(tokens).items():
+                postings[token].append((doc_id, tf, len(tokens)))
+
+        # Per-posting BM25 weights are precomputed; a query only sums them
+        n_docs = len(documents)
+        self._postings = {}
+        for token, entries in postings.items():
+            idf = math.log(1 + (n_docs - len(entries) + 0.5) / (len(entries) + 0.5))
+            self._postings[token] = [
+                (doc_id, idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / average_length)))
+                for doc_id, tf, length in entries
+            ]
+
+    def __len__(self):
+        return len(self.diseases)
+
+    def rank(self, query, limit=CANDIDATES):
+        """
+        Diseases by BM25 relevance to ``query``.
+
+        Returns:
+            list: (disease index, BM25 score) pairs, best first
+        """
+        scores = defaultdict(float)
+        for token in set(tokenize(query)):
+            for doc_id, weight in self._postings.get(token, ()):
+                scores[doc_id] += weight
+        return sorted(scores.items(), key=lambda item: -item[1])[:limit]
+
+    def search(self, query, limit=5):
+        """
+        Ranked disease matches, in the shape ``/api/search_diseases`` returns.
+
+        The BM25 candidates are re-ordered by ``score``, the number of the
+        disease's symptoms that appear verbatim in the query; diseases with
+        no such symptom are dropped, as in ``searchDiseases``.
+
+        Args:
+            query (str): User's symptom text
+            limit (int): Matches returned
+
+        Returns:
+            list: Disease dicts with an added ``score``
+        """
+        text = query.lower()
+        matches = []
+        for doc_id, _ in self.rank(query):
+            overlaps = sum(symptom in text for symptom in self._symptoms[doc_id])
+            if overlaps:
+                matches.append(dict(self.diseases[doc_id], score=overlaps))
+        # Stable sort keeps the BM25 order among equal overlap counts
+        matches.sort(key=lambda match: -match['score'])
+        return matches[:limit]
+
+
+def load_snapshot(path):
+    """
+    Read a disease snapshot written by tools/export_disease_snapshot.py.
+
+    Args:
+        path (str): JSON file, ``{"version": ..., "diseases": [...]}`` or a
+            bare list of disease documents
+
+    Returns:
+        tuple: (diseases list, version string)
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data, snapshot_version(data)
+    return data['diseases'], data.get('version') or snapshot_version(data['diseases'])
+
+
+def load_symptom_index(path):
+    """``SymptomIndex`` for the snapshot at ``path``, or None if there is none."""
+    if not path or not os.path.exists(path):
+        return None
+    diseases, version = load_snapshot(path)
+    return SymptomIndex(diseases, version)